@@ -2,6 +2,7 @@
 
 import os
 import io
+import threading
 import base64
 import traceback
 import mimetypes
@@ -10,6 +11,7 @@ from typing import Optional
 import pandas as pd
 
 import boto3
+from botocore.config import Config
 
 # debug_print 폴백
 try:
@@ -29,6 +31,56 @@ def _get_env(*keys: str, default: Optional[str] = None) -> Optional[str]:
     return default
 
 
+# 커넥션 풀 크기: 스레드 worker 수 이상으로 (부족하면 요청이 풀 대기)
+S3_MAX_POOL_CONNECTIONS = int(os.getenv("S3_MAX_POOL_CONNECTIONS", 32))
+S3_TCP_KEEPALIVE = os.getenv("S3_TCP_KEEPALIVE", "true").lower() in ("1", "true", "yes")
+
+# (region, access_key, secret_key) → (boto3.client, client)
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(region: Optional[str] = None, access_key: Optional[str] = None, secret_key: Optional[str] = None):
+    """
+    프로세스 공용 S3 클라이언트 (자격 증명/리전 조합별 1개)
+    - credential/endpoint 해석과 커넥션 풀 생성은 처음 한 번만
+    - boto3 client는 thread-safe → 스레드 간 공유, 생성만 lock
+    """
+    key = (region, access_key, secret_key)
+    factory = boto3.client
+
+    entry = _clients.get(key)
+    # boto3.client가 교체되면(테스트 mock 등) 다시 생성
+    if entry is not None and entry[0] is factory:
+        return entry[1]
+
+    with _clients_lock:
+        entry = _clients.get(key)
+        if entry is not None and entry[0] is factory:
+            return entry[1]
+
+        kwargs = {
+            "config": Config(
+                max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+                tcp_keepalive=S3_TCP_KEEPALIVE,
+            )
+        }
+        if region:
+            kwargs["region_name"] = region
+        if access_key and secret_key:
+            kwargs["aws_access_key_id"] = access_key
+            kwargs["aws_secret_access_key"] = secret_key
+
+        client = factory("s3", **kwargs)
+        _clients[key] = (factory, client)
+        return client
+
+
+def clear_clients():
+    with _clients_lock:
+        _clients.clear()
+
+
 # 모듈 수준의 간단 클라이언트도 제공(기존 코드 호환용)
 def get_boto3_client():
     access_key = _get_env("IAM_ACCESS_KEY_ID", "AWS_ACCESS_KEY_ID")
@@ -4,11 +4,68 @@ import mimetypes
 import traceback
 
 import json
-from datetime import timezone
+from datetime import datetime, timezone
 
 import boto3
 
-from S3 import _get_env, debug_print
+from S3 import _get_env, debug_print, get_client
+
+# prefix별 최신 객체 포인터 (producer가 업로드 후 갱신)
+LATEST_MANIFEST = "_latest.json"
+# 날짜 파티션: 값이 큰 것부터 탐색하면 최신 데이터를 먼저 만남
+DATE_PARTITIONS = ("year", "month", "day")
+
+
+def manifest_key(prefix: str) -> str:
+    prefix = prefix.rstrip("/")
+    return f"{prefix}/{LATEST_MANIFEST}" if prefix else LATEST_MANIFEST
+
+
+def put_latest_manifest(client, bucket: str, key: str, *prefixes: str) -> None:
+    """
+    업로드한 객체(key)를 각 prefix의 최신 객체로 기록 (producer 공용)
+    - prefix 아래 객체를 모두 이 producer가 올리는 경우에만 사용
+      (다른 producer와 공유하는 상위 prefix에 쓰면 그 producer의 최신 객체를 가림)
+    """
+    head = client.head_object(Bucket=bucket, Key=key)
+    for prefix in prefixes:
+        body = json.dumps({
+            "Prefix": prefix.rstrip("/"),
+            "Key": key,
+            "ETag": head.get("ETag"),
+            "LastModified": head["LastModified"].isoformat(),
+            "Size": head.get("ContentLength"),
+        })
+        client.put_object(
+            Bucket=bucket,
+            Key=manifest_key(prefix),
+            Body=body,
+            ContentType="application/json",
+        )
+
+
+def _is_manifest(obj) -> bool:
+    return obj["Key"].rsplit("/", 1)[-1] == LATEST_MANIFEST
+
+
+def _date_partition(prefix: str):
+    """
+    'a/b/year=2025/' → ('year', 2025), 날짜 파티션이 아니면 None
+    """
+    name, _, value = prefix.rstrip("/").rsplit("/", 1)[-1].partition("=")
+    if name in DATE_PARTITIONS and value.isdigit():
+        return name, int(value)
+    return None
+
+
+def _newer(a, b):
+    if a is None: return b
+    if b is None: return a
+    return b if b["LastModified"] > a["LastModified"] else a
+
+
+class _ProbeUnsupported(Exception):
+    """한 번의 목록 조회로 끝나지 않는 레벨 → 전체 목록 조회로 대체"""
 
 
 class BaseBucket:
@@ -29,15 +86,9 @@ class BaseBucket:
     ):
         region = _get_env("AWS_REGION")
 
-        kwargs = {}
-        if region:
-            kwargs["region_name"] = region
-        if access_key and secret_key:
-            kwargs["aws_access_key_id"] = access_key
-            kwargs["aws_secret_access_key"] = secret_key
-
         try:
-            self._client = boto3.client("s3", **kwargs)
+            # 같은 자격 증명/리전이면 프로세스 공용 클라이언트 재사용
+            self._client = get_client(region, access_key, secret_key)
             self._bucket = bucket_name
         except Exception:
             debug_print(traceback.format_exc())
@@ -80,6 +131,82 @@ class BaseBucket:
         return self._client.list_objects_v2(Bucket=self._bucket, Prefix=prefix)
 
     def get_latest_object(self, prefix):
+        """
+        prefix 아래 가장 최근 객체
+        1. producer가 갱신하는 manifest(<prefix>/_latest.json) GET 한 번
+        2. 없으면 날짜 파티션(year=/month=/day=)을 최신 값부터 탐색
+        3. 파티션 구조가 아니면 전체 목록 조회
+        """
+        latest = self.read_latest_manifest(prefix)
+        if latest is not None:
+            return latest
+
+        try:
+            return self._probe_latest(prefix)
+        except _ProbeUnsupported:
+            return self._scan_latest(prefix)
+
+    def read_latest_manifest(self, prefix):
+        """
+        manifest를 list_objects_v2 항목과 같은 형태로 반환, 없거나 잘못되면 None
+        """
+        try:
+            obj = self._client.get_object(Bucket=self._bucket, Key=manifest_key(prefix))
+            manifest = json.loads(obj["Body"].read().decode("utf-8"))
+
+            # 자기 prefix용으로 기록된 manifest만 신뢰 (Prefix 없는 예전 manifest는 무시)
+            if manifest.get("Prefix") != prefix.rstrip("/"): return None
+            if not manifest["Key"].startswith(prefix): return None
+
+            return {
+                "Key": manifest["Key"],
+                "LastModified": datetime.fromisoformat(manifest["LastModified"]),
+                "ETag": manifest.get("ETag"),
+                "Size": manifest.get("Size"),
+            }
+        except Exception as e:
+            code = getattr(e, "response", {}).get("Error", {}).get("Code")
+            if code not in ("NoSuchKey", "404"):
+                debug_print(traceback.format_exc())
+            return None
+
+    def put_latest_manifest(self, key: str, *prefixes: str) -> None:
+        """
+        업로드한 객체(key)를 각 prefix의 최신 객체로 기록
+        """
+        put_latest_manifest(self._client, self._bucket, key, *prefixes)
+
+    def _probe_latest(self, prefix):
+        """
+        한 단계씩 목록 조회(Delimiter="/")
+        - 날짜 파티션: 큰 값부터 내려가며 객체가 있는 첫 파티션 사용
+        - 그 외 하위 prefix(market= 등): 각각 탐색 후 가장 최근 것
+        """
+        response = self._client.list_objects_v2(Bucket=self._bucket, Prefix=prefix, Delimiter="/")
+        if response.get("IsTruncated"):
+            raise _ProbeUnsupported(prefix)
+
+        latest = None
+        for obj in response.get("Contents", []):
+            if not _is_manifest(obj):
+                latest = _newer(latest, obj)
+
+        children = [p["Prefix"] for p in response.get("CommonPrefixes", [])]
+        partitions = [_date_partition(child) for child in children]
+
+        if children and all(partitions) and len({name for name, _ in partitions}) == 1:
+            ordered = sorted(zip(partitions, children), reverse=True)
+            for _, child in ordered:
+                found = self._probe_latest(child)
+                if found is not None:
+                    return _newer(latest, found)
+            return latest
+
+        for child in children:
+            latest = _newer(latest, self._probe_latest(child))
+        return latest
+
+    def _scan_latest(self, prefix):
         paginator = self._client.get_paginator("list_objects_v2")
         latest = None
         pages = paginator.paginate(
@@ -89,18 +216,16 @@ class BaseBucket:
 
         for page in pages:
             for obj in page.get("Contents", []):
-                if latest is None:
-                    latest = obj
-                elif obj["LastModified"] > latest["LastModified"]:
-                    latest = obj
+                if not _is_manifest(obj):
+                    latest = _newer(latest, obj)
 
         return latest
 
-    def check_source(self, prefix: str):
-        obj = self.get_latest_object(prefix)
-
-        if not obj: return { "ok": False, "latest": None }
-
+    @staticmethod
+    def source_date(obj) -> str:
+        """
+        객체의 기준 날짜(YYYY-MM-DD): 파일명 날짜 우선, 없으면 LastModified
+        """
         key = obj["Key"]
         ts = None
 
@@ -109,9 +234,16 @@ class BaseBucket:
             # assume  YYYY-MM-DD.{ext}
             if filename.count("-") >= 2:
                 ts = filename.split(".")[0] # ex) 2025-10-01
+        return ts or obj["LastModified"].strftime("%Y-%m-%d")
+
+    def check_source(self, prefix: str):
+        obj = self.get_latest_object(prefix)
+
+        if not obj: return { "ok": False, "latest": None }
+
         return {
             "ok": True,
-            "latest": ts or obj["LastModified"].strftime("%Y-%m-%d")
+            "latest": self.source_date(obj)
         }
 
     # --- json ---
@@ -0,0 +1,86 @@
+# S3/tests/test_client_registry.py
+"""
+프로세스 공용 S3 클라이언트(get_client) 테스트
+"""
+
+from django.test import TestCase
+from unittest.mock import patch, MagicMock
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ClientRegistryTests(TestCase):
+    """get_client 재사용/설정 테스트"""
+
+    def setUp(self):
+        from S3 import clear_clients
+
+        clear_clients()
+
+    def tearDown(self):
+        from S3 import clear_clients
+
+        clear_clients()
+
+    @patch('S3.base.boto3.client')
+    def test_buckets_share_client(self, mock_boto_client):
+        """버킷 인스턴스를 여러 번 만들어도 클라이언트는 한 번만 생성"""
+        from S3.base import BaseBucket
+        from S3.finance import FinanceBucket
+
+        a = BaseBucket("key", "secret", "bucket-a")
+        b = BaseBucket("key", "secret", "bucket-b")
+        c = FinanceBucket("key", "secret", "bucket-c")
+
+        mock_boto_client.assert_called_once()
+        self.assertIs(a._client, b._client)
+        self.assertIs(a._client, c._client)
+        self.assertEqual(c._bucket, "bucket-c")
+
+    @patch('S3.base.boto3.client')
+    def test_separate_client_per_credentials(self, mock_boto_client):
+        """자격 증명이 다르면 별도 클라이언트"""
+        from S3 import get_client
+
+        mock_boto_client.side_effect = lambda *args, **kwargs: MagicMock()
+
+        self.assertIsNot(get_client(None, "k1", "s1"), get_client(None, "k2", "s2"))
+        self.assertIs(get_client("ap-northeast-2"), get_client("ap-northeast-2"))
+        self.assertEqual(mock_boto_client.call_count, 3)
+
+    @patch('S3.S3_TCP_KEEPALIVE', True)
+    @patch('S3.S3_MAX_POOL_CONNECTIONS', 64)
+    @patch('S3.base.boto3.client')
+    def test_pool_config(self, mock_boto_client):
+        """커넥션 풀 크기/keep-alive 설정 전달"""
+        from S3 import get_client
+
+        get_client("ap-northeast-2")
+
+        config = mock_boto_client.call_args.kwargs["config"]
+        self.assertEqual(config.max_pool_connections, 64)
+        self.assertTrue(config.tcp_keepalive)
+        self.assertEqual(mock_boto_client.call_args.kwargs["region_name"], "ap-northeast-2")
+
+    @patch('S3.base.boto3.client')
+    def test_concurrent_first_use(self, mock_boto_client):
+        """여러 스레드가 동시에 요청해도 한 번만 생성"""
+        from S3 import get_client
+
+        mock_boto_client.side_effect = lambda *args, **kwargs: MagicMock()
+
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            clients = list(ex.map(lambda _: get_client("ap-northeast-2"), range(32)))
+
+        mock_boto_client.assert_called_once()
+        self.assertEqual(len({id(c) for c in clients}), 1)
+
+    @patch('S3.base.boto3.client')
+    def test_failed_creation_not_cached(self, mock_boto_client):
+        """생성 실패는 캐시하지 않음"""
+        from S3 import get_client
+
+        mock_boto_client.side_effect = [Exception("no credentials"), MagicMock()]
+
+        with self.assertRaises(Exception):
+            get_client("ap-northeast-2")
+        self.assertIsNotNone(get_client("ap-northeast-2"))
@@ -0,0 +1,202 @@
+# S3/tests/test_latest_manifest.py
+"""
+get_latest_object: manifest / 날짜 파티션 탐색 테스트
+"""
+
+from django.test import TestCase
+from unittest.mock import patch, MagicMock
+from datetime import datetime, timezone
+from botocore.exceptions import ClientError
+import json
+
+
+def no_such_key(*args, **kwargs):
+    raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+
+
+def obj(key, day):
+    return {"Key": key, "LastModified": datetime(2025, 11, day, tzinfo=timezone.utc)}
+
+
+def listing(tree):
+    """prefix → (Contents, CommonPrefixes) 로 list_objects_v2(Delimiter="/") 흉내"""
+    def list_objects_v2(Bucket, Prefix, Delimiter=None):
+        contents, children = tree.get(Prefix, ([], []))
+        return {"Contents": contents, "CommonPrefixes": [{"Prefix": c} for c in children]}
+    return list_objects_v2
+
+
+class LatestManifestTests(TestCase):
+    """manifest 기반 최신 객체 조회"""
+
+    @patch('S3.base.boto3.client')
+    def test_manifest_single_get(self, mock_boto_client):
+        """manifest가 있으면 GET 한 번으로 끝나고 목록 조회를 하지 않음"""
+        from S3.base import BaseBucket
+
+        mock_s3 = MagicMock()
+        mock_boto_client.return_value = mock_s3
+        body = MagicMock()
+        body.read.return_value = json.dumps({
+            "Prefix": "llm_output/company-overview",
+            "Key": "llm_output/company-overview/year=2025/month=11/2025-11-20.json",
+            "ETag": '"abc"',
+            "LastModified": "2025-11-20T09:00:00+00:00",
+        }).encode("utf-8")
+        mock_s3.get_object.return_value = {"Body": body}
+
+        latest = BaseBucket().get_latest_object("llm_output/company-overview")
+
+        mock_s3.get_object.assert_called_once_with(
+            Bucket=None, Key="llm_output/company-overview/_latest.json"
+        )
+        mock_s3.list_objects_v2.assert_not_called()
+        mock_s3.get_paginator.assert_not_called()
+        self.assertEqual(latest["ETag"], '"abc"')
+        self.assertEqual(BaseBucket.source_date(latest), "2025-11-20")
+        self.assertEqual(latest["LastModified"], datetime(2025, 11, 20, 9, tzinfo=timezone.utc))
+
+    @patch('S3.base.boto3.client')
+    def test_manifest_for_other_prefix_falls_back_to_probe(self, mock_boto_client):
+        """다른 prefix용(또는 Prefix 없는 예전) manifest는 무시하고 파티션 탐색"""
+        from S3.base import BaseBucket
+
+        mock_s3 = MagicMock()
+        mock_boto_client.return_value = mock_s3
+        mock_s3.list_objects_v2.side_effect = listing({
+            "llm_output": ([], ["llm_output/a/", "llm_output/b/"]),
+            "llm_output/a/": ([obj("llm_output/a/2025-11-20.json", 20)], []),
+            "llm_output/b/": ([obj("llm_output/b/2025-11-21.json", 21)], []),
+        })
+
+        for manifest in (
+            {"Key": "llm_output/a/2025-11-20.json", "LastModified": "2025-11-20T00:00:00+00:00"},
+            {"Prefix": "llm_output/a", "Key": "llm_output/a/2025-11-20.json",
+             "LastModified": "2025-11-20T00:00:00+00:00"},
+        ):
+            body = MagicMock()
+            body.read.return_value = json.dumps(manifest).encode("utf-8")
+            mock_s3.get_object.return_value = {"Body": body}
+
+            latest = BaseBucket().get_latest_object("llm_output")
+
+            self.assertEqual(latest["Key"], "llm_output/b/2025-11-21.json")
+
+    @patch('S3.base.boto3.client')
+    def test_probe_date_partitions_descending(self, mock_boto_client):
+        """manifest가 없으면 최신 year/month부터 탐색 (이전 파티션은 조회하지 않음)"""
+        from S3.base import BaseBucket
+
+        mock_s3 = MagicMock()
+        mock_boto_client.return_value = mock_s3
+        mock_s3.get_object.side_effect = no_such_key
+        mock_s3.list_objects_v2.side_effect = listing({
+            "data/": ([], ["data/year=2024/", "data/year=2025/"]),
+            "data/year=2025/": ([], ["data/year=2025/month=9/", "data/year=2025/month=11/"]),
+            "data/year=2025/month=11/": ([obj("data/year=2025/month=11/2025-11-20.parquet", 20),
+                                          obj("data/year=2025/month=11/2025-11-19.parquet", 19)], []),
+        })
+
+        latest = BaseBucket().get_latest_object("data/")
+
+        self.assertEqual(latest["Key"], "data/year=2025/month=11/2025-11-20.parquet")
+        probed = [c.kwargs["Prefix"] for c in mock_s3.list_objects_v2.call_args_list]
+        self.assertNotIn("data/year=2024/", probed)
+        self.assertNotIn("data/year=2025/month=9/", probed)
+
+    @patch('S3.base.boto3.client')
+    def test_probe_skips_empty_partition(self, mock_boto_client):
+        """최신 파티션이 비어 있으면 그 다음 파티션 사용"""
+        from S3.base import BaseBucket
+
+        mock_s3 = MagicMock()
+        mock_boto_client.return_value = mock_s3
+        mock_s3.get_object.side_effect = no_such_key
+        mock_s3.list_objects_v2.side_effect = listing({
+            "data/": ([], ["data/day=9/", "data/day=10/"]),
+            "data/day=9/": ([obj("data/day=9/a.json", 9)], []),
+        })
+
+        latest = BaseBucket().get_latest_object("data/")
+
+        self.assertEqual(latest["Key"], "data/day=9/a.json")
+
+    @patch('S3.base.boto3.client')
+    def test_probe_non_date_children(self, mock_boto_client):
+        """날짜가 아닌 하위 prefix(market=)는 모두 탐색해 가장 최근 객체 선택"""
+        from S3.base import BaseBucket
+
+        mock_s3 = MagicMock()
+        mock_boto_client.return_value = mock_s3
+        mock_s3.get_object.side_effect = no_such_key
+        mock_s3.list_objects_v2.side_effect = listing({
+            "p/": ([], ["p/month=11/"]),
+            "p/month=11/": ([], ["p/month=11/market=kosdaq/", "p/month=11/market=kospi/"]),
+            "p/month=11/market=kosdaq/": ([obj("p/month=11/market=kosdaq/2025-11-20.parquet", 21)], []),
+            "p/month=11/market=kospi/": ([obj("p/month=11/market=kospi/2025-11-20.parquet", 20)], []),
+        })
+
+        latest = BaseBucket().get_latest_object("p/")
+
+        self.assertEqual(latest["Key"], "p/month=11/market=kosdaq/2025-11-20.parquet")
+
+    @patch('S3.base.boto3.client')
+    def test_truncated_listing_falls_back_to_scan(self, mock_boto_client):
+        """한 번에 목록을 받을 수 없으면 전체 목록 조회 (manifest 객체는 제외)"""
+        from S3.base import BaseBucket
+
+        mock_s3 = MagicMock()
+        mock_boto_client.return_value = mock_s3
+        mock_s3.get_object.side_effect = no_such_key
+        mock_s3.list_objects_v2.return_value = {"IsTruncated": True}
+        mock_s3.get_paginator.return_value.paginate.return_value = [
+            {"Contents": [obj("data/a.json", 1), obj("data/_latest.json", 30)]},
+            {"Contents": [obj("data/b.json", 2)]},
+        ]
+
+        latest = BaseBucket().get_latest_object("data/")
+
+        self.assertEqual(latest["Key"], "data/b.json")
+
+    @patch('S3.base.boto3.client')
+    def test_put_latest_manifest(self, mock_boto_client):
+        """업로드한 객체의 HEAD 정보를 각 prefix manifest로 기록"""
+        from S3.base import BaseBucket
+
+        mock_s3 = MagicMock()
+        mock_boto_client.return_value = mock_s3
+        mock_s3.head_object.return_value = {
+            "ETag": '"abc"',
+            "LastModified": datetime(2025, 11, 20, tzinfo=timezone.utc),
+            "ContentLength": 10,
+        }
+
+        BaseBucket().put_latest_manifest("news/day=20/a.json", "news/day=20/", "news")
+
+        keys = [c.kwargs["Key"] for c in mock_s3.put_object.call_args_list]
+        self.assertEqual(keys, ["news/day=20/_latest.json", "news/_latest.json"])
+        bodies = [json.loads(c.kwargs["Body"]) for c in mock_s3.put_object.call_args_list]
+        self.assertEqual([b["Prefix"] for b in bodies], ["news/day=20", "news"])
+        self.assertEqual(bodies[-1]["Key"], "news/day=20/a.json")
+        self.assertEqual(bodies[-1]["LastModified"], "2025-11-20T00:00:00+00:00")
+
+    @patch('S3.base.boto3.client')
+    def test_put_then_read_manifest(self, mock_boto_client):
+        """기록한 manifest를 같은 prefix로 읽으면 목록 조회 없이 사용"""
+        from S3.base import BaseBucket
+
+        mock_s3 = MagicMock()
+        mock_boto_client.return_value = mock_s3
+        mock_s3.head_object.return_value = {
+            "ETag": '"abc"',
+            "LastModified": datetime(2025, 11, 20, tzinfo=timezone.utc),
+        }
+        bucket = BaseBucket()
+        bucket.put_latest_manifest("news/day=20/a.json", "news/")
+
+        body = MagicMock()
+        body.read.return_value = mock_s3.put_object.call_args.kwargs["Body"].encode("utf-8")
+        mock_s3.get_object.return_value = {"Body": body}
+
+        self.assertEqual(bucket.get_latest_object("news/")["Key"], "news/day=20/a.json")
+        mock_s3.list_objects_v2.assert_not_called()
@@ -15,6 +15,11 @@ from pathlib import Path
 import boto3
 from botocore.exceptions import ClientError
 
+try:
+    from S3 import get_client
+except ImportError:  # cron에서 이 폴더만 단독 실행하는 경우
+    get_client = None
+
 # S3 설정
 S3_BUCKET_NAME = "swpp-12-bucket"
 S3_REGION = "ap-northeast-2"
@@ -45,7 +50,11 @@ class StockindexManager:
         self.use_s3 = use_s3
         if self.use_s3:
             try:
-                self.s3_client = boto3.client("s3", region_name=S3_REGION)
+                # Django 프로세스에서는 공용 클라이언트 재사용 (요청마다 생성하지 않음)
+                if get_client is not None:
+                    self.s3_client = get_client(region=S3_REGION)
+                else:
+                    self.s3_client = boto3.client("s3", region_name=S3_REGION)
             except Exception as e:
                 print(f"⚠️  S3 초기화 실패: {e}")
                 self.use_s3 = False
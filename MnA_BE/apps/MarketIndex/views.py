@@ -1,5 +1,5 @@
 import os
-from django.http import JsonResponse
+from utils.fast_json import FastJsonResponse
 from rest_framework import viewsets, serializers
 from rest_framework.decorators import action
 from drf_yasg.utils import swagger_auto_schema
@@ -112,9 +112,9 @@ class MarketLLMview(viewsets.ViewSet):
 
             llm_output = get_latest_overview("market-index-overview")
         except Exception as e:
-            return JsonResponse({"message": "Unexpected Server Error"}, status=500)
+            return FastJsonResponse({"message": "Unexpected Server Error"}, status=500)
 
-        return JsonResponse(llm_output, status=200, safe=False)
+        return FastJsonResponse(llm_output, status=200, safe=False)
 
 
 class StockIndexView(viewsets.ViewSet):
@@ -132,7 +132,7 @@ class StockIndexView(viewsets.ViewSet):
         manager = StockindexManager()
         latest_data = manager.get_latest()
 
-        return JsonResponse({"status": "success", "data": latest_data})
+        return FastJsonResponse({"status": "success", "data": latest_data})
 
     @swagger_auto_schema(
         operation_description="Get historical daily price data for stock indices with flexible date range",
@@ -203,14 +203,14 @@ class StockIndexView(viewsets.ViewSet):
 
                 both_data[idx_name] = formatted_history
 
-            return JsonResponse(
+            return FastJsonResponse(
                 {"status": "success", "index": "BOTH", "days": days, "data": both_data}
             )
 
         else:
             valid_indices = list(manager.indices.keys())
             if index_type not in valid_indices:
-                return JsonResponse(
+                return FastJsonResponse(
                     {
                         "status": "error",
                         "message": f'Invalid index. Choose from: {", ".join(valid_indices + ["BOTH"])}',
@@ -230,7 +230,7 @@ class StockIndexView(viewsets.ViewSet):
                 for record in history
             ]
 
-            return JsonResponse(
+            return FastJsonResponse(
                 {
                     "status": "success",
                     "index": index_type,
@@ -269,4 +269,4 @@ class StockIndexView(viewsets.ViewSet):
                 "data_points": data["data_points"],
             }
 
-        return JsonResponse({"status": "success", "data": formatted_summary})
+        return FastJsonResponse({"status": "success", "data": formatted_summary})
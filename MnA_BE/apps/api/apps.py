@@ -3,7 +3,7 @@ from django.apps import AppConfig
 from django.core.cache import cache
 import pandas as pd
 from utils.debug_print import debug_print
-from utils import instant_data
+from utils import instant_data, data_watcher
 
 
 class ApiConfig(AppConfig):
@@ -13,9 +13,9 @@ class ApiConfig(AppConfig):
     def ready(self):
         """
         Django 앱 시작 시 한 번만 실행
-        instant 데이터를 Django 캐시에 로드
+        instant 데이터를 Django 캐시에 로드하고, 서버로 실행 중이면 S3 watcher 시작
         """
-        import os
+        import os, sys
 
         run_main = os.environ.get("RUN_MAIN")
         if run_main != "true" and run_main is not None:
@@ -30,3 +30,9 @@ class ApiConfig(AppConfig):
             import traceback
 
             debug_print(traceback.format_exc())
+
+        # 서버 프로세스에서만 watcher 실행 (test, migrate, reload_data 등 다른 명령 제외)
+        program = os.path.basename(sys.argv[0])
+        command = sys.argv[1] if len(sys.argv) > 1 else None
+        if command == "runserver" or program in ("gunicorn", "uvicorn", "daphne", "uwsgi"):
+            data_watcher.start()
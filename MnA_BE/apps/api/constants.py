@@ -12,3 +12,4 @@ S3_PREFIX_ARTICLE = os.getenv("S3_PREFIX_ARTICLES", "news-articles/")  # article
 
 ARTICLES_SOURCE = os.getenv("ARTICLES_SOURCE", "s3")  # mock → s3
 INDICES_SOURCE = os.getenv("INDICES_SOURCE", "s3")  # mock → s3
+RECO_SOURCE = os.getenv("RECO_SOURCE", "s3")  # s3 | db (ingest_reco로 적재한 테이블)
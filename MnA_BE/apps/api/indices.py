@@ -0,0 +1,125 @@
+# apps/api/indices.py
+"""
+KOSPI/KOSDAQ 최신 지수 스냅샷 제공자
+- 프로세스 메모리에 최신 레코드를 보관하고, TTL이 지나면 백그라운드에서 갱신
+- 갱신 중에는 이전 스냅샷을 그대로 반환 (stale-while-revalidate)
+"""
+from S3.finance import FinanceBucket
+from utils.debug_print import debug_print
+from apps.api.constants import S3_PREFIX_INDICES
+import os, threading, time
+
+INDICES_TTL_SECONDS = int(os.getenv("INDICES_TTL_SECONDS", 300))
+
+# { "data": {"kospi", "kosdaq", "asOf"} | None, "fetched_at": float }
+_snapshot = None
+_refreshing = False
+_lock = threading.Lock()
+
+
+def _index_record(data):
+    return {
+        "value": round(data.get("close", 0), 2),
+        "changePct": round(data.get("change_percent", 0), 2),
+    }
+
+
+def fetch_indices():
+    """
+    S3에서 최신 KOSPI/KOSDAQ 레코드 조회
+    지수 데이터가 없으면 None
+    """
+    s3 = FinanceBucket()
+    response = s3.get_list_v2(S3_PREFIX_INDICES)
+
+    if "Contents" not in response:
+        return None
+
+    files = sorted(response["Contents"], key=lambda x: x["LastModified"], reverse=True)
+
+    kospi_file = None
+    kosdaq_file = None
+
+    for f in files:
+        if "KOSPI.json" in f["Key"] and kospi_file is None:
+            kospi_file = f
+        if "KOSDAQ.json" in f["Key"] and kosdaq_file is None:
+            kosdaq_file = f
+        if kospi_file and kosdaq_file:
+            break
+
+    result = {"kospi": None, "kosdaq": None, "asOf": None}
+
+    if kospi_file:
+        data = s3.get_json(kospi_file["Key"])
+        result["kospi"] = _index_record(data)
+        result["asOf"] = data.get("fetched_at") or str(kospi_file["LastModified"])
+
+    if kosdaq_file:
+        data = s3.get_json(kosdaq_file["Key"])
+        result["kosdaq"] = _index_record(data)
+        if not result["asOf"]:
+            result["asOf"] = data.get("fetched_at") or str(kosdaq_file["LastModified"])
+
+    return result
+
+
+def refresh_indices():
+    global _snapshot
+    _snapshot = {"data": fetch_indices(), "fetched_at": time.time()}
+    return _snapshot["data"]
+
+
+def _refresh_in_background():
+    global _refreshing
+    try:
+        refresh_indices()
+    except Exception as e:
+        debug_print(f"Error refreshing indices snapshot: {e}")
+    finally:
+        with _lock:
+            _refreshing = False
+
+
+def get_indices_snapshot():
+    """
+    최신 지수 스냅샷 반환
+    - 최초 호출: 동기 로드 (실패 시 예외 전파)
+    - TTL 경과: 이전 값을 반환하고 백그라운드 스레드에서 갱신
+    """
+    global _refreshing
+
+    snapshot = _snapshot
+    if snapshot is None:
+        with _lock:
+            if _snapshot is None:
+                refresh_indices()
+        return _snapshot["data"]
+
+    if time.time() - snapshot["fetched_at"] >= INDICES_TTL_SECONDS:
+        with _lock:
+            start = not _refreshing
+            _refreshing = True
+        if start:
+            threading.Thread(target=_refresh_in_background, daemon=True).start()
+
+    return snapshot["data"]
+
+
+def indices_version():
+    """
+    현재 스냅샷 식별자 (ETag용, asOf)
+    스냅샷이 없거나 조회에 실패하면 None
+    """
+    try:
+        data = get_indices_snapshot()
+    except Exception as e:
+        debug_print(f"Error fetching indices snapshot: {e}")
+        return None
+    return data["asOf"] if data else None
+
+
+def clear_indices_snapshot():
+    global _snapshot
+    with _lock:
+        _snapshot = None
@@ -0,0 +1,66 @@
+# apps/api/management/commands/benchmark_auth.py
+"""
+require_auth 오버헤드 측정 (JWT 검증 + 사용자 조회, view 본문은 빈 응답)
+- jwt.decode (캐시 없음) vs decode_access_token (검증 캐시)
+- require_auth: 캐시 없음 (매 요청 decode + DB 조회) vs 캐시 (token + user_cache)
+임시 사용자는 transaction 안에서 만들고 끝나면 rollback
+실행: python manage.py benchmark_auth [--iterations 2000]
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.http import HttpResponse
+from django.test import RequestFactory
+from apps.api.management.commands.benchmark_json import time_per_call
+from apps.user.models import Style, User
+from decorators.require_auth import require_auth
+from utils import token_handler, user_cache
+
+
+@require_auth
+def empty_view(self, request, user=None):
+    return HttpResponse()
+
+
+class Command(BaseCommand):
+    help = "Benchmark require_auth overhead (JWT verification + user lookup)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+
+        with transaction.atomic():
+            user = User.objects.create(name="benchmark", password="-")
+            Style.objects.create(
+                user=user, interests={"interests": ["반도체"]}, strategy={"strategy": "안정형"}
+            )
+            token = token_handler.make_access_token(str(user.id))
+
+            request = RequestFactory().get("/")
+            request.COOKIES = {"access_token": token}
+
+            def uncached():
+                token_handler.load_keys()
+                user_cache.clear()
+                return empty_view(None, request)
+
+            results = {
+                "jwt.decode": time_per_call(lambda: token_handler.decode_token(token), iterations),
+                "decode_access_token (cached)": time_per_call(
+                    lambda: token_handler.decode_access_token(token), iterations
+                ),
+                "require_auth (no cache)": time_per_call(uncached, iterations),
+                "require_auth (cached)": time_per_call(
+                    lambda: empty_view(None, request), iterations
+                ),
+            }
+
+            transaction.set_rollback(True)
+
+        user_cache.clear()
+
+        self.stdout.write(f"{iterations} iterations per case")
+        for name, elapsed in results.items():
+            self.stdout.write(f"  {name:<30} {elapsed * 1000:8.1f} µs")
@@ -0,0 +1,104 @@
+# apps/api/management/commands/benchmark_json.py
+"""
+리포트 응답 JSON 인코딩 시간 비교 (표준 JsonResponse vs FastJsonResponse)
+실행: python manage.py benchmark_json [--rows 1400] [--iterations 50]
+"""
+
+from django.core.management.base import BaseCommand
+from django.http import JsonResponse
+from apps.api.views import serialize_history
+from utils import fast_json
+from utils.fast_json import FastJsonResponse
+from utils.instant_data import normalize_schema
+import numpy as np
+import pandas as pd
+import time
+
+
+def make_report_payload(rows: int) -> dict:
+    """get_reports_detail 응답과 같은 구조 (history = 전체 거래일)"""
+    rng = np.random.default_rng(0)
+    close = 70000 + rng.normal(0, 1000, rows).cumsum().round()
+    history_df = normalize_schema(
+        pd.DataFrame(
+            {
+                "date": pd.bdate_range("2020-01-02", periods=rows),
+                "ticker": "005930",
+                "close": close,
+                "change": np.r_[0, np.diff(close)],
+                "change_rate": rng.normal(0, 1.5, rows).round(2),
+                "market_cap": (close * 5_969_782_550).astype(np.int64),
+                "PER": rng.uniform(5, 30, rows).round(2),
+                "PBR": rng.uniform(0.5, 3, rows).round(2),
+                "EPS": rng.integers(1000, 10000, rows).astype(float),
+                "BPS": rng.integers(30000, 60000, rows).astype(float),
+                "DIV": np.where(rng.random(rows) < 0.1, np.nan, 2.1),
+                "DPS": 1444.0,
+                "ROE": rng.uniform(0, 0.2, rows).round(4),
+            }
+        )
+    )
+    history = serialize_history(history_df)
+    latest = history[-1]
+
+    return {
+        "ticker": "005930",
+        "name": "삼성전자",
+        "market": "KOSPI",
+        "industry": "전기·전자",
+        "price": {"current": latest["close"], "change": latest["change"]},
+        "current": {"price": latest["close"], "market_cap": latest["market_cap"]},
+        "valuation": {"pe_annual": latest["PER"], "pb": latest["PBR"]},
+        "dividend": {"payout_ratio": None, "yield": latest["DIV"], "latest_exdate": None},
+        "financials": {"eps": latest["EPS"], "bps": latest["BPS"], "roe": latest["ROE"]},
+        "history": history,
+        "profile": {"symbol": "005930", "explanation": "동사는 1969년 설립되었으며 " * 20},
+        "indicesSnippet": {"kospi": {"value": 2500.12, "changePct": 1.23}},
+        "articles": [],
+        "asOf": latest["date"],
+        "source": "cache",
+    }
+
+
+def time_per_call(fn, iterations: int) -> float:
+    """1회 평균 (ms)"""
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+class Command(BaseCommand):
+    help = "Benchmark JSON encoding of a full report payload"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1400, help="history rows (trading days)")
+        parser.add_argument("--iterations", type=int, default=50)
+
+    def handle(self, *args, **options):
+        payload = make_report_payload(options["rows"])
+        iterations = options["iterations"]
+
+        results = {
+            "JsonResponse (stdlib)": time_per_call(
+                lambda: JsonResponse(payload, json_dumps_params={"ensure_ascii": False}),
+                iterations,
+            ),
+            "FastJsonResponse (stdlib fallback)": time_per_call(
+                lambda: fast_json._dumps_stdlib(payload), iterations
+            ),
+        }
+        if fast_json.orjson is not None:
+            results["FastJsonResponse (orjson)"] = time_per_call(
+                lambda: FastJsonResponse(payload), iterations
+            )
+        else:
+            self.stdout.write(self.style.WARNING("orjson not installed: fallback only"))
+
+        size = len(FastJsonResponse(payload).content)
+        self.stdout.write(f"payload: {options['rows']} history rows, {size / 1024:.0f}KB")
+
+        baseline = results["JsonResponse (stdlib)"]
+        for name, elapsed in results.items():
+            self.stdout.write(f"  {name:<36} {elapsed:8.2f} ms  (x{baseline / elapsed:.1f})")
@@ -0,0 +1,78 @@
+# apps/api/management/commands/ingest_reco.py
+"""
+llm_output의 top_picks / all_industry_picks를 RecommendationBatch/Item 테이블에 적재
+실행: python manage.py ingest_reco [--date YYYY-MM-DD] [--days 1]
+- 날짜가 없으면 가장 최근 llm_output 날짜
+- 같은 날짜를 다시 적재하면 그날 batch/item을 교체 (apps/api/recommendations/db.py upsert_day)
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from datetime import date, timedelta
+from S3.finance import FinanceBucket
+from utils import llm_picks
+from apps.api.recommendations import db as reco_db
+import json
+
+
+def load_output(s3, content, day: date):
+    """llm_output 하루치 JSON, 없거나 읽을 수 없으면 None"""
+    try:
+        output = s3.get_json(key=llm_picks.picks_path(content, day.year, day.month, day.day))
+    except Exception:
+        return None
+    if isinstance(output, str):
+        output = json.loads(output)
+    return output if isinstance(output, dict) else None
+
+
+class Command(BaseCommand):
+    help = "Bulk-upsert llm_output top_picks / all_industry_picks into recommendation tables"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--date", help="Last market date to ingest (default: latest llm_output)"
+        )
+        parser.add_argument("--days", type=int, default=1, help="Number of days ending at --date")
+
+    def handle(self, *args, **options):
+        s3 = FinanceBucket()
+
+        if options["date"]:
+            try:
+                last = date.fromisoformat(options["date"])
+            except ValueError:
+                raise CommandError("--date must be YYYY-MM-DD")
+        else:
+            source = s3.check_source(prefix=llm_picks.LLM_OUTPUT_PREFIX)
+            if not source["ok"]:
+                raise CommandError("No LLM output found")
+            last = date.fromisoformat(source["latest"])
+
+        for offset in reversed(range(max(options["days"], 1))):
+            day = last - timedelta(days=offset)
+            top_picks = load_output(s3, "top_picks", day)
+            industry = load_output(s3, "all_industry_picks", day)
+            if top_picks is None and industry is None:
+                self.stdout.write(self.style.WARNING(f"- {day}: no llm_output"))
+                continue
+
+            groups = [
+                group
+                for group, output in (
+                    (reco_db.GENERAL, top_picks),
+                    (reco_db.PERSONALIZED, industry),
+                )
+                if output is not None
+            ]
+            result = reco_db.upsert_day(
+                day,
+                reco_db.day_batches(top_picks, industry),
+                groups=groups,
+                model_id=(top_picks or {}).get("model_id"),
+            )
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"✓ {day}: {result['batches']} batches, {result['items']} items"
+                    f" ({result['deleted']} stale batches removed)"
+                )
+            )
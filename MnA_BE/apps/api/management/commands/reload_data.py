@@ -1,7 +1,7 @@
 # apps/api/management/commands/reload_data.py
 """
 데이터를 수동으로 리로드하는 커맨드
-실행: python manage.py reload_data
+실행: python manage.py reload_data [--full]
 """
 
 from django.core.management.base import BaseCommand
@@ -11,11 +11,18 @@ from utils import instant_data
 class Command(BaseCommand):
     help = "Reload instant and profile data from S3 into Django cache"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Reload the whole instant parquet instead of only new daily partitions",
+        )
+
     def handle(self, *args, **options):
         self.stdout.write(self.style.WARNING("Starting data reload..."))
 
         try:
-            instant_data.reload()
+            instant_data.reload(full=options["full"])
 
         except Exception as e:
             self.stdout.write(self.style.ERROR(f"✗ Error: {e}"))
@@ -0,0 +1,246 @@
+"""
+RecommendationBatch / RecommendationItem 저장 / 조회
+- 저장: llm_output의 하루치 top_picks, all_industry_picks → batch + item (ingest_reco 커맨드)
+  - top_picks → level=global, audience=general
+  - all_industry_picks "{strategy}_{tag}" → level=industry, audience=personalized,
+    risk_profile=strategy, industry_tag=tag
+- 조회: (market_date, level, audience) 인덱스로 batch를 찾고 items는 prefetch (쿼리 2번)
+  응답 항목은 S3 경로와 같은 형식 (items.to_item)
+"""
+
+from django.db import transaction
+from django.db.models import Count, Max
+from django.utils import timezone
+from apps.api.models import (
+    Audience,
+    BatchLevel,
+    Direction,
+    RecommendationBatch,
+    RecommendationItem,
+)
+from .items import to_item
+from datetime import date
+
+GENERAL = (BatchLevel.GLOBAL, Audience.GENERAL)
+PERSONALIZED = (BatchLevel.INDUSTRY, Audience.PERSONALIZED)
+
+
+########################################
+### Ingestion
+########################################
+
+
+def _reason(value) -> list:
+    if isinstance(value, list):
+        return value
+    return [value] if value else []
+
+
+def _conviction(value) -> float:
+    try:
+        return min(max(float(value), 0.0), 1.0)
+    except (TypeError, ValueError):
+        return 0.5
+
+
+def _items(picks) -> list:
+    """pick 목록 → RecommendationItem 필드 (ticker 중복 제거, rank 1부터)"""
+    items, seen = [], set()
+    for pick in picks if isinstance(picks, list) else [picks]:
+        if not isinstance(pick, dict) or not pick.get("ticker") or pick["ticker"] in seen:
+            continue
+        seen.add(pick["ticker"])
+
+        direction = pick.get("expected_direction")
+        items.append(
+            {
+                "rank": len(items) + 1,
+                "ticker": str(pick["ticker"])[:16],
+                "name": str(pick.get("name") or "")[:128],
+                "market": pick.get("market") or "KOSPI",
+                "news": pick.get("news") or [],
+                "reason": _reason(pick.get("reason")),
+                "expected_direction": (
+                    direction if direction in Direction.values else Direction.NEUTRAL
+                ),
+                "conviction": _conviction(pick.get("conviction", 0.5)),
+                "score_breakdown": pick.get("score_breakdown"),
+            }
+        )
+    return items
+
+
+def day_batches(top_picks_output=None, industry_output=None) -> dict:
+    """
+    하루치 llm_output → { (risk_profile, level, industry_tag, audience): (notes, [item 필드]) }
+    all_industry_picks 키는 첫 "_" 기준으로 strategy / tag 분리 (strategy에는 "_"가 없음)
+    """
+    batches = {}
+
+    if top_picks_output:
+        notes = {k: v for k, v in top_picks_output.items() if k != "top_picks"} or None
+        items = _items(top_picks_output.get("top_picks", []))
+        if items:
+            batches[(None, GENERAL[0], None, GENERAL[1])] = (notes, items)
+
+    for key, picks in (industry_output or {}).items():
+        strategy, _, tag = key.partition("_")
+        items = _items(picks) if picks else []
+        if tag and items:
+            batches[(strategy, PERSONALIZED[0], tag, PERSONALIZED[1])] = (None, items)
+
+    return batches
+
+
+def _key(batch) -> tuple:
+    return (batch.risk_profile, batch.level, batch.industry_tag, batch.audience)
+
+
+@transaction.atomic
+def upsert_day(market_date: date, batches: dict, groups=(GENERAL, PERSONALIZED), model_id=None):
+    """
+    하루치 batch/item 교체 (다시 실행해도 같은 결과)
+    - batch: 한 번에 조회 → 없는 것만 bulk_create, 있는 것은 bulk_update
+      (risk_profile/industry_tag가 NULL인 batch는 unique 제약으로 충돌을 잡을 수 없어 직접 비교)
+    - groups((level, audience)) 중 이번 출력에 없는 batch는 삭제
+    - item: 대상 batch의 item을 한 번에 지우고 bulk_create
+    반환: {"batches": 저장한 batch 수, "items": item 수, "deleted": 삭제한 batch 수}
+    """
+    groups = set(groups) | {(key[1], key[3]) for key in batches}
+    existing = {
+        _key(batch): batch
+        for batch in RecommendationBatch.objects.filter(
+            market_date=market_date, level__in=[g[0] for g in groups]
+        )
+        if (batch.level, batch.audience) in groups
+    }
+
+    stale = [batch.pk for key, batch in existing.items() if key not in batches]
+    if stale:
+        RecommendationBatch.objects.filter(pk__in=stale).delete()
+
+    now = timezone.now()
+    created, updated = [], []
+    for key, (notes, _) in batches.items():
+        risk_profile, level, industry_tag, audience = key
+        batch = existing.get(key)
+        if batch is None:
+            batch = RecommendationBatch(
+                market_date=market_date,
+                risk_profile=risk_profile,
+                level=level,
+                industry_tag=industry_tag,
+                audience=audience,
+            )
+            created.append(batch)
+        else:
+            updated.append(batch)
+        batch.source = "llm"
+        batch.model_id = model_id
+        batch.notes = notes
+        batch.as_of_utc = now
+        batch.updated_at = now
+
+    RecommendationBatch.objects.bulk_create(created)
+    RecommendationBatch.objects.bulk_update(
+        updated, ["source", "model_id", "notes", "as_of_utc", "updated_at"]
+    )
+
+    # MySQL은 bulk_create 후 pk를 돌려주지 않으므로 다시 조회
+    ids = {
+        _key(batch): batch.pk
+        for batch in RecommendationBatch.objects.filter(market_date=market_date).only(
+            "pk", "risk_profile", "level", "industry_tag", "audience"
+        )
+    }
+    RecommendationItem.objects.filter(batch_id__in=[ids[key] for key in batches]).delete()
+    items = [
+        RecommendationItem(batch_id=ids[key], **fields)
+        for key, (_, rows) in batches.items()
+        for fields in rows
+    ]
+    RecommendationItem.objects.bulk_create(items, batch_size=500)
+
+    return {"batches": len(batches), "items": len(items), "deleted": len(stale)}
+
+
+########################################
+### Queries
+########################################
+
+
+def _market_date(year, month, day):
+    if year is None and month is None and day is None:
+        return None
+    return date(int(year), int(month), int(day))
+
+
+def _batches(level, audience, market_date=None):
+    """(market_date, level, audience) 인덱스 조회, market_date가 없으면 가장 최근 날짜"""
+    batches = RecommendationBatch.objects.filter(level=level, audience=audience)
+    if market_date is None:
+        market_date = batches.order_by("-market_date").values_list("market_date", flat=True).first()
+        if market_date is None:
+            return None, batches.none()
+    return market_date, batches.filter(market_date=market_date)
+
+
+def data_version() -> list:
+    """추천 테이블 식별자 (ETag용): batch 수 + 마지막 저장 시각 (ingest_reco 실행 시 변경)"""
+    stats = RecommendationBatch.objects.aggregate(count=Count("pk"), updated=Max("updated_at"))
+    return [stats["count"], stats["updated"]]
+
+
+def item_dict(item: RecommendationItem) -> dict:
+    """RecommendationItem → 응답 항목 (LLM reason은 문자열 하나 → headline)"""
+    return to_item(
+        {
+            "ticker": item.ticker,
+            "name": item.name,
+            "reason": item.reason[0] if len(item.reason) == 1 else (item.reason or None),
+        }
+    )
+
+
+def general_items(year=None, month=None, day=None):
+    """
+    일반 추천 항목 (rank 순), 해당 날짜 batch가 없으면 None
+    날짜가 없으면 가장 최근 batch
+    """
+    market_date = _market_date(year, month, day)
+    batches = RecommendationBatch.objects.filter(level=GENERAL[0], audience=GENERAL[1])
+    if market_date is not None:
+        batches = batches.filter(market_date=market_date)
+    batch = batches.order_by("-market_date").prefetch_related("items").first()
+    if batch is None:
+        return None
+    return [item_dict(item) for item in batch.items.all()]
+
+
+def personalized_items(strategy, interests, year=None, month=None, day=None):
+    """
+    strategy + interests 업종 batch를 interests 순서대로 병합 (ticker 중복 제거)
+    해당 날짜(없으면 가장 최근 날짜)에 개인화 batch가 하나도 없으면 None
+    """
+    market_date, batches = _batches(*PERSONALIZED, _market_date(year, month, day))
+    if market_date is None:
+        return None
+
+    by_tag = {
+        batch.industry_tag: batch
+        for batch in batches.filter(
+            risk_profile=strategy, industry_tag__in=interests
+        ).prefetch_related("items")
+    }
+    if not by_tag and not batches.exists():
+        return None
+
+    items, seen = [], set()
+    for tag in interests:
+        if tag not in by_tag:
+            continue
+        for item in by_tag[tag].items.all():
+            if item.ticker not in seen:
+                seen.add(item.ticker)
+                items.append(item_dict(item))
+    return items
@@ -1,17 +1,36 @@
-import os
-import json
 from django.http import HttpRequest, JsonResponse
 from rest_framework import viewsets
 from rest_framework.decorators import action
-from S3.finance import FinanceBucket
 from apps.api.constants import *
-from decorators import default_error_handler
+from decorators import default_error_handler, data_etag
 from utils.for_api import *
+from utils import llm_picks
+from .items import to_item, with_quotes
+from . import db as reco_db
+
+
+def transform_top_picks(llm_output):
+    """top_picks → 프론트엔드 형식 (날짜별로 한 번만 변환, utils/llm_picks.py)"""
+    # Extract top_picks
+    top_picks = llm_output.get("top_picks", [])
+
+    # Transform to frontend format
+    return [to_item(pick) for pick in top_picks]
+
+
+def picks_etag(request, **kwargs):
+    """
+    추천 출처가 바뀌면 ETag도 변경 (데이터 reload와 별개로 갱신됨)
+    - s3: llm_output 최신 객체 (llm_picks가 TTL마다 재확인)
+    - db: 추천 테이블 (ingest_reco)
+    """
+    return reco_db.data_version() if RECO_SOURCE == "db" else llm_picks.latest_version()
 
 
 class GeneralRecommendationsView(viewsets.ViewSet):
 
     @action(detail=False, methods=["get"])
+    @data_etag(extra=picks_etag)
     @default_error_handler
     def get(self, request: HttpRequest, year=None, month=None, day=None):
         # Get pagination parameters
@@ -27,44 +46,26 @@ class GeneralRecommendationsView(viewsets.ViewSet):
             limit = 10
             offset = 0
 
-        # if no date provided, get the latest
-        if year is None and month is None and day is None:
-            source = FinanceBucket().check_source(prefix="llm_output")
-            if not source["ok"]:
-                return JsonResponse({"message": "No LLM output found"}, status=404)
-            year, month, day = source["latest"].split("-")
-
-        path = f"llm_output/{get_path_with_date('top_picks', year, month, day)}"
-        try:
-            llm_output = FinanceBucket().get_json(key=path)
-        except Exception as e:
-            return JsonResponse({"message": "Unexpected Server Error"}, status=500)
-
-        # Parse JSON string if needed
-        if isinstance(llm_output, str):
-            llm_output = json.loads(llm_output)
-
-        # Extract top_picks
-        top_picks = llm_output.get("top_picks", [])
+        if RECO_SOURCE == "db":
+            all_items = reco_db.general_items(year, month, day)
+            if all_items is None:
+                return JsonResponse({"message": "No recommendations found"}, status=404)
+        else:
+            # if no date provided, get the latest
+            if year is None and month is None and day is None:
+                latest = llm_picks.latest_date()
+                if latest is None:
+                    return JsonResponse({"message": "No LLM output found"}, status=404)
+                year, month, day = latest.split("-")
 
-        # Transform to frontend format
-        all_items = []
-        for pick in top_picks:
-            all_items.append(
-                {
-                    "ticker": pick.get("ticker"),
-                    "name": pick.get("name"),
-                    "price": None,  # TODO: Get from price-financial-info
-                    "change": None,
-                    "change_rate": None,
-                    "time": "09:00",  # TODO: Get actual time
-                    "headline": pick.get("reason"),
-                }
-            )
+            try:
+                all_items = llm_picks.get_picks("top_picks", year, month, day, transform_top_picks)
+            except Exception as e:
+                return JsonResponse({"message": "Unexpected Server Error"}, status=500)
 
         # Apply pagination
         total = len(all_items)
-        paginated_items = all_items[offset : offset + limit]
+        paginated_items = with_quotes(all_items[offset : offset + limit])
 
         return JsonResponse(
             {
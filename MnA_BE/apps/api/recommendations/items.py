@@ -0,0 +1,32 @@
+from utils.store import store
+from utils import instant_data
+
+
+def to_item(pick: dict) -> dict:
+    """llm_output pick → 프론트엔드 형식 (시세는 with_quotes에서 채움)"""
+    return {
+        "ticker": pick.get("ticker"),
+        "name": pick.get("name"),
+        "price": None,
+        "change": None,
+        "change_rate": None,
+        "time": "09:00",  # TODO: Get actual time
+        "headline": pick.get("reason"),
+    }
+
+
+def with_quotes(items: list) -> list:
+    """
+    추천 항목에 최신 거래일 시세(price/change/change_rate)를 채운 새 목록
+    - 항목 전체의 ticker를 instant_data.get_quotes로 한 번에 조회
+    - 캐시된 항목(utils/llm_picks.py)은 수정하지 않고 복사
+    - 데이터가 로드되지 않았거나 최신 거래일에 없는 종목은 None 그대로
+    """
+    instant_df = store.get_data("instant_df")
+    if instant_df is None or not items:
+        return items
+
+    quotes = instant_data.get_quotes(instant_df, [item["ticker"] for item in items])
+    return [
+        {**item, **quotes[item["ticker"]]} if item["ticker"] in quotes else item for item in items
+    ]
@@ -1,18 +1,80 @@
-import json
 from django.http import HttpRequest, JsonResponse
 from rest_framework import viewsets
 from rest_framework.decorators import action
-from S3.finance import FinanceBucket
 from utils.for_api import *
-from decorators import require_auth, default_error_handler
+from utils import llm_picks, user_cache
+from decorators import require_auth, default_error_handler, data_etag
 from apps.user.models import User
 from apps.api.constants import *
+from .items import to_item, with_quotes
+from .general import picks_etag
+from . import db as reco_db
+
+
+# 날짜별 인덱스에 보관하는 style별 병합 결과 수 (넘으면 비우고 다시 채움)
+MERGED_CACHE_SIZE = 256
+
+
+def index_industry_picks(llm_output):
+    """
+    all_industry_picks → { "picks": { f"{strategy}_{tag}": [item] }, "merged": {} }
+    - 날짜별로 한 번만 변환 (utils/llm_picks.py), 목록 안의 같은 ticker는 첫 항목만
+    - "merged": (strategy, interests) → 병합 결과 캐시 (merged_picks)
+    """
+    picks = {}
+    for key, datum in llm_output.items():
+        if not datum:
+            continue
+        items, seen = [], set()
+        for pick in datum if isinstance(datum, list) else [datum]:
+            if isinstance(pick, dict) and pick.get("ticker") not in seen:
+                seen.add(pick.get("ticker"))
+                items.append(to_item(pick))
+        if items:
+            picks[key] = items
+    return {"picks": picks, "merged": {}}
+
+
+def merged_picks(index, strategy, interests) -> list:
+    """
+    interests 순서대로 (strategy, tag) 목록을 이어 붙임 (ticker 중복 제거)
+    style 내용이 같으면 같은 결과 → 사용자 style 버전(strategy, interests)별로 캐시
+    """
+    key = (strategy, tuple(interests))
+    merged = index["merged"].get(key)
+    if merged is not None:
+        return merged
+
+    merged, seen = [], set()
+    for tag in interests:
+        for item in index["picks"].get(f"{strategy}_{tag}", ()):
+            if item["ticker"] not in seen:
+                seen.add(item["ticker"])
+                merged.append(item)
+
+    if len(index["merged"]) >= MERGED_CACHE_SIZE:
+        index["merged"].clear()
+    index["merged"][key] = merged
+    return merged
+
+
+def _style_etag(request, user: User = None, **kwargs):
+    """
+    사용자와 최신 style(변경 시 새 row 추가), 추천 출처가 바뀌면 ETag도 변경
+    추천 출처 버전을 알 수 없으면 None (ETag 없음)
+    """
+    picks_version = picks_etag(request)
+    if picks_version is None:
+        return None
+    style = user_cache.latest_style(user)
+    return [user.id, style.id if style else None, picks_version]
 
 
 class PersonalizedRecommendationsView(viewsets.ViewSet):
 
     @action(detail=False, methods=["get"])
     @require_auth
+    @data_etag(extra=_style_etag, private=True)
     @default_error_handler
     def get(self, request: HttpRequest, year=None, month=None, day=None, user: User = None):
         # Get pagination parameters
@@ -28,56 +90,38 @@ class PersonalizedRecommendationsView(viewsets.ViewSet):
             limit = 10
             offset = 0
 
-        # if no date provided, get the latest
-        if year is None and month is None and day is None:
-            source = FinanceBucket().check_source(prefix="llm_output")
-            if not source["ok"]:
-                return JsonResponse({"message": "No LLM output found"}, status=404)
-            year, month, day = source["latest"].split("-")
+        # User preferences
+        strategy, interests = None, []
+        style_of_user = user_cache.latest_style(user)
 
-        path = f"llm_output/{get_path_with_date('all_industry_picks', year, month, day)}"
-        try:
-            llm_output = FinanceBucket().get_json(key=path)
-        except Exception as e:
-            return JsonResponse({"message": "Unexpected Server Error"}, status=500)
+        if style_of_user:
+            strategy = style_of_user.strategy.get("strategy")
+            interests = style_of_user.interests.get("interests") or []
 
-        # Parse JSON string if needed
-        if isinstance(llm_output, str):
-            llm_output = json.loads(llm_output)
+        if RECO_SOURCE == "db":
+            all_items = reco_db.personalized_items(strategy, interests, year, month, day)
+            if all_items is None:
+                return JsonResponse({"message": "No recommendations found"}, status=404)
+        else:
+            # if no date provided, get the latest
+            if year is None and month is None and day is None:
+                latest = llm_picks.latest_date()
+                if latest is None:
+                    return JsonResponse({"message": "No LLM output found"}, status=404)
+                year, month, day = latest.split("-")
 
-        # Filter by user preferences
-        filtered_items = []
-        style_of_user = user.style_set.first()
+            try:
+                index = llm_picks.get_picks(
+                    "all_industry_picks", year, month, day, index_industry_picks
+                )
+            except Exception as e:
+                return JsonResponse({"message": "Unexpected Server Error"}, status=500)
 
-        if style_of_user:
-            strategy = style_of_user.strategy.get("strategy")
-            interests = style_of_user.interests.get("interests")
-
-            for tag in interests:
-                datum = llm_output.get(f"{strategy}_{tag}")
-                if datum and isinstance(datum, list):
-                    filtered_items.extend(datum)
-                elif datum:
-                    filtered_items.append(datum)
-
-        # Transform to frontend format
-        all_items = []
-        for pick in filtered_items:
-            all_items.append(
-                {
-                    "ticker": pick.get("ticker"),
-                    "name": pick.get("name"),
-                    "price": None,  # TODO: Get from price-financial-info
-                    "change": None,
-                    "change_rate": None,
-                    "time": "09:00",  # TODO: Get actual time
-                    "headline": pick.get("reason"),
-                }
-            )
+            all_items = merged_picks(index, strategy, interests) if style_of_user else []
 
         # Apply pagination
         total = len(all_items)
-        paginated_items = all_items[offset : offset + limit]
+        paginated_items = with_quotes(all_items[offset : offset + limit])
 
         return JsonResponse(
             {
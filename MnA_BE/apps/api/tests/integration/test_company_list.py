@@ -109,3 +109,23 @@ class ApiCompanyListTests(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertTrue(data.get("degraded"))
         self.assertEqual(data["source"], "memory")
+
+    def test_company_overview_etag_follows_overview_version(self):
+        """company-overview 객체가 바뀌면 (데이터 reload 전이라도) 이전 ETag로 304가 아님"""
+        version = {"id": "v1", "sources": {}, "loaded_at": "2025-11-20T16:10:00"}
+        url = "/api/overview/005930"
+
+        with (
+            patch("decorators.data_etag.instant_data.get_data_version", return_value=version),
+            patch("apps.api.views.get_overview_items", return_value={"005930": {"summary": "a"}}),
+            patch("apps.api.views.overview_version", return_value="key@1") as overview,
+        ):
+            first = self.client.get(url)
+            same = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+            overview.return_value = "key@2"
+            changed = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(same.status_code, 304)
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed["ETag"], first["ETag"])
@@ -187,3 +187,22 @@ class ApiHealthTests(TestCase):
         # DELETE도 405
         response_delete = self.client.delete(self.url)
         self.assertEqual(response_delete.status_code, 405)
+
+    def test_health_exposes_data_version(self):
+        """현재 서비스 중인 데이터 버전(dataVersion)과 로드 시각"""
+        from unittest.mock import patch
+
+        version = {
+            "id": "abc123def456",
+            "sources": {"instant": "2025-11-20", "profile": {}, "llm_output": None},
+            "loaded_at": "2025-11-20T16:10:00",
+        }
+        with (
+            patch("apps.api.views.FinanceBucket") as bucket,
+            patch("apps.api.views.instant_data.get_data_version", return_value=version),
+        ):
+            bucket.return_value.check_source.return_value = {"ok": True, "latest": "2025-11-20"}
+            data = self.client.get(self.url).json()
+
+        self.assertEqual(data["dataVersion"], version)
+        self.assertEqual(data["cache"]["last_loaded"], "2025-11-20T16:10:00")
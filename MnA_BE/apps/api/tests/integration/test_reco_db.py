@@ -0,0 +1,178 @@
+# apps/api/tests/integration/test_reco_db.py
+from django.test import TestCase, RequestFactory
+from django.core.management import call_command
+from unittest.mock import patch, MagicMock
+from datetime import date
+from io import StringIO
+import json
+
+TOP_PICKS = {
+    "model_id": "gpt-test",
+    "top_picks": [
+        {"ticker": "005930", "name": "삼성전자", "reason": "HBM 수요"},
+        {"ticker": "000660", "name": "SK하이닉스", "reason": "메모리 업황", "conviction": 1.7},
+        {"ticker": "005930", "name": "삼성전자", "reason": "중복"},
+    ],
+}
+INDUSTRY_PICKS = {
+    "공격투자형_반도체": [
+        {"ticker": "000660", "name": "SK하이닉스", "reason": "a"},
+        {"ticker": "005930", "name": "삼성전자", "reason": "b"},
+    ],
+    "공격투자형_2차전지": {"ticker": "247540", "name": "에코프로비엠", "reason": "c"},
+    "안정형_반도체": [{"ticker": "005930", "name": "삼성전자", "reason": "d"}],
+    "generated_at": "2025-11-20",
+}
+
+
+def ingest(day, top_picks=TOP_PICKS, industry=INDUSTRY_PICKS, **kwargs):
+    from apps.api.recommendations import db as reco_db
+
+    return reco_db.upsert_day(day, reco_db.day_batches(top_picks, industry), **kwargs)
+
+
+class RecoIngestTests(TestCase):
+    """upsert_day / day_batches"""
+
+    def test_ingest(self):
+        from apps.api.models import RecommendationBatch, RecommendationItem
+
+        result = ingest(date(2025, 11, 20))
+
+        self.assertEqual(result, {"batches": 4, "items": 6, "deleted": 0})
+        general = RecommendationBatch.objects.get(level="global", audience="general")
+        self.assertEqual(general.notes, {"model_id": "gpt-test"})
+        self.assertEqual(
+            list(general.items.values_list("rank", "ticker", "conviction")),
+            [(1, "005930", 0.5), (2, "000660", 1.0)],
+        )
+        self.assertEqual(general.items.first().reason, ["HBM 수요"])
+
+        battery = RecommendationBatch.objects.get(industry_tag="2차전지")
+        self.assertEqual((battery.risk_profile, battery.level), ("공격투자형", "industry"))
+        self.assertEqual(RecommendationItem.objects.count(), 6)
+
+    def test_reingest_replaces_day(self):
+        """같은 날짜를 다시 적재하면 batch는 유지, item 교체, 빠진 batch 삭제"""
+        from apps.api.models import RecommendationBatch, RecommendationItem
+
+        ingest(date(2025, 11, 20))
+        ingest(date(2025, 11, 19))
+        general_id = RecommendationBatch.objects.get(
+            market_date=date(2025, 11, 20), level="global"
+        ).pk
+
+        result = ingest(
+            date(2025, 11, 20),
+            top_picks={"top_picks": [{"ticker": "035720", "name": "카카오", "reason": "x"}]},
+            industry={"안정형_반도체": [{"ticker": "005930", "name": "삼성전자"}]},
+        )
+
+        self.assertEqual(result, {"batches": 2, "items": 2, "deleted": 2})
+        today = RecommendationBatch.objects.filter(market_date=date(2025, 11, 20))
+        self.assertEqual(today.count(), 2)
+        self.assertEqual(today.get(level="global").pk, general_id)
+        self.assertEqual(
+            list(RecommendationItem.objects.filter(batch_id=general_id).values_list("ticker")),
+            [("035720",)],
+        )
+        # 다른 날짜는 그대로
+        self.assertEqual(
+            RecommendationBatch.objects.filter(market_date=date(2025, 11, 19)).count(), 4
+        )
+
+    def test_partial_output_keeps_other_group(self):
+        """top_picks만 다시 적재하면 개인화 batch는 유지"""
+        from apps.api.models import RecommendationBatch
+        from apps.api.recommendations import db as reco_db
+
+        ingest(date(2025, 11, 20))
+        ingest(date(2025, 11, 20), industry=None, groups=[reco_db.GENERAL])
+
+        self.assertEqual(RecommendationBatch.objects.filter(level="industry").count(), 3)
+
+
+class RecoQueryTests(TestCase):
+    """general_items / personalized_items"""
+
+    def setUp(self):
+        ingest(date(2025, 11, 19), top_picks={"top_picks": [{"ticker": "000001", "reason": "old"}]})
+        ingest(date(2025, 11, 20))
+
+    def test_general_latest(self):
+        from apps.api.recommendations import db as reco_db
+
+        with self.assertNumQueries(2):
+            items = reco_db.general_items()
+
+        self.assertEqual([item["ticker"] for item in items], ["005930", "000660"])
+        self.assertEqual(items[0]["headline"], "HBM 수요")
+        self.assertIsNone(items[0]["price"])
+
+    def test_general_by_date(self):
+        from apps.api.recommendations import db as reco_db
+
+        self.assertEqual(reco_db.general_items("2025", "11", "19")[0]["headline"], "old")
+        self.assertIsNone(reco_db.general_items("2025", "11", "18"))
+
+    def test_personalized(self):
+        from apps.api.recommendations import db as reco_db
+
+        with self.assertNumQueries(3):
+            items = reco_db.personalized_items("공격투자형", ["2차전지", "반도체", "바이오"])
+
+        self.assertEqual([item["ticker"] for item in items], ["247540", "000660", "005930"])
+        self.assertEqual(reco_db.personalized_items("안정형", ["2차전지"]), [])
+        self.assertIsNone(reco_db.personalized_items("안정형", ["반도체"], 2025, 11, 1))
+
+    def test_general_view_from_db(self):
+        from apps.api.recommendations.general import GeneralRecommendationsView
+
+        view = GeneralRecommendationsView.as_view({"get": "get"})
+        with patch("apps.api.recommendations.general.RECO_SOURCE", "db"), patch(
+            "apps.api.recommendations.general.llm_picks"
+        ) as picks:
+            response = view(RequestFactory().get("/", {"limit": 1, "offset": 1}))
+
+        data = json.loads(response.content)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item["ticker"] for item in data["data"]], ["000660"])
+        self.assertEqual(data["total"], 2)
+        picks.get_picks.assert_not_called()
+
+
+class IngestRecoCommandTests(TestCase):
+    """python manage.py ingest_reco"""
+
+    @patch("apps.api.management.commands.ingest_reco.FinanceBucket")
+    def test_command(self, mock_bucket):
+        from apps.api.models import RecommendationBatch
+
+        outputs = {
+            "llm_output/year=2025/month=11/content=top_picks/2025-11-20": TOP_PICKS,
+            "llm_output/year=2025/month=11/content=all_industry_picks/2025-11-20": json.dumps(
+                INDUSTRY_PICKS
+            ),
+            "llm_output/year=2025/month=11/content=top_picks/2025-11-19": TOP_PICKS,
+        }
+
+        def get_json(key):
+            if key not in outputs:
+                raise Exception("NoSuchKey")
+            return outputs[key]
+
+        s3 = MagicMock()
+        s3.check_source.return_value = {"ok": True, "latest": "2025-11-20"}
+        s3.get_json.side_effect = get_json
+        mock_bucket.return_value = s3
+
+        out = StringIO()
+        call_command("ingest_reco", "--days", "3", stdout=out)
+
+        self.assertIn("2025-11-18: no llm_output", out.getvalue())
+        self.assertEqual(
+            RecommendationBatch.objects.filter(market_date=date(2025, 11, 20)).count(), 4
+        )
+        self.assertEqual(
+            RecommendationBatch.objects.filter(market_date=date(2025, 11, 19)).count(), 1
+        )
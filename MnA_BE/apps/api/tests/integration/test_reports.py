@@ -375,3 +375,39 @@ class ApiReportsDetailTests(TestCase):
                 response = self.client.get(f"/api/reports/{symbol}")
                 # 모두 200 OK (degraded 포함)
                 self.assertEqual(response.status_code, 200)
+
+    def test_reports_conditional_get(self):
+        """같은 데이터 버전의 ETag로 다시 요청하면 본문 없이 304"""
+        import pandas as pd
+        from apps.api.views import serialize_history
+
+        instant_df = pd.DataFrame(
+            {
+                "date": pd.to_datetime(["2025-11-19", "2025-11-20"]),
+                "ticker": "005930",
+                "name": "삼성전자",
+                "close": [100.0, 101.0],
+                "market_cap": [1000, 1010],
+            }
+        )
+        data = {"instant_df": instant_df}
+        version = {"id": "v1", "sources": {}, "loaded_at": "2025-11-20T16:10:00"}
+
+        with (
+            patch("apps.api.views.store.get_data", side_effect=data.get),
+            patch(
+                "apps.api.views.store.get_many",
+                side_effect=lambda keys: tuple(data.get(key) for key in keys),
+            ),
+            patch("apps.api.views.INDICES_SOURCE", "mock"),
+            patch("decorators.data_etag.instant_data.get_data_version", return_value=version),
+            patch("apps.api.views.serialize_history", wraps=serialize_history) as serialize,
+        ):
+            first = self.client.get("/api/reports/005930")
+            second = self.client.get("/api/reports/005930", HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second["ETag"], first["ETag"])
+        self.assertEqual(second.content, b"")
+        serialize.assert_called_once()
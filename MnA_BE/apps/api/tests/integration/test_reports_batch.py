@@ -0,0 +1,97 @@
+# apps/api/tests/integration/test_reports_batch.py
+from django.test import TestCase, Client
+from unittest.mock import patch
+import pandas as pd
+
+
+class ApiReportsBatchTests(TestCase):
+    """
+    여러 종목 report 한 번에 조회 (/api/reports?symbols=...)
+    """
+
+    def setUp(self):
+        self.client = Client()
+        from utils import instant_data
+
+        instant_df = pd.DataFrame(
+            {
+                "date": pd.to_datetime(["2025-11-19", "2025-11-19", "2025-11-20", "2025-11-20"]),
+                "ticker": ["005930", "000660", "005930", "000660"],
+                "name": ["삼성전자", "SK하이닉스", "삼성전자", "SK하이닉스"],
+                "market": "KOSPI",
+                "close": [100.0, 50.0, 101.0, 52.0],
+                "change": [0.0, 0.0, 1.0, 2.0],
+                "market_cap": [1000, 500, 1010, 520],
+                "PER": [10.0, 5.0, 10.5, 5.5],
+            }
+        )
+        data = {
+            "instant_df": instant_df,
+            "ticker_index": instant_data.build_ticker_index(instant_df),
+            "profile_df": pd.DataFrame({"explanation": ["메모리 반도체"]}, index=["000660"]),
+        }
+        patches = [
+            patch("apps.api.views.store.get_data", side_effect=data.get),
+            patch(
+                "apps.api.views.store.get_many",
+                side_effect=lambda keys: tuple(data.get(key) for key in keys),
+            ),
+            patch("apps.api.views.INDICES_SOURCE", "mock"),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_batch_matches_single_reports(self):
+        """배치 응답의 각 report는 단건 report와 같음 (지수는 최상위에서 공유)"""
+        response = self.client.get("/api/reports?symbols=000660,005930,999999")
+        data = response.json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item["ticker"] for item in data["items"]], ["000660", "005930"])
+        self.assertEqual(data["missing"], ["999999"])
+        self.assertIsNotNone(data["indicesSnippet"])
+        self.assertEqual(data["asOf"], "2025-11-20")
+        # 종목별 asOf도 같은 형식 (YYYY-MM-DD)
+        self.assertEqual({item["asOf"] for item in data["items"]}, {"2025-11-20"})
+
+        for item in data["items"]:
+            single = self.client.get(f"/api/reports/{item['ticker']}").json()
+            del single["indicesSnippet"]
+            with self.subTest(ticker=item["ticker"]):
+                self.assertEqual(item, single)
+
+    def test_field_selection(self):
+        """fields로 필요한 항목만 (ticker는 항상 포함)"""
+        data = self.client.get("/api/reports?symbols=005930&fields=price,valuation").json()
+
+        self.assertEqual(set(data["items"][0]), {"ticker", "price", "valuation"})
+        self.assertEqual(data["items"][0]["price"]["current"], 101.0)
+
+        # ticker를 명시해도 허용 (항상 포함되므로 그대로)
+        data = self.client.get("/api/reports?symbols=005930&fields=ticker,price").json()
+        self.assertEqual(list(data["items"][0]), ["ticker", "price"])
+
+    def test_history_excluded_skips_full_serialization(self):
+        """history를 고르지 않으면 최신 행만 직렬화"""
+        from apps.api.views import serialize_history
+
+        with patch("apps.api.views.serialize_history", wraps=serialize_history) as serialize:
+            self.client.get("/api/reports?symbols=005930,000660&fields=current")
+
+        serialize.assert_called_once()
+        self.assertEqual(len(serialize.call_args.args[0]), 2)
+
+    def test_invalid_requests(self):
+        """symbols 누락 / 개수 초과 / 알 수 없는 필드는 400"""
+        from apps.api.views import REPORTS_BATCH_MAX
+
+        too_many = ",".join(f"{i:06d}" for i in range(REPORTS_BATCH_MAX + 1))
+
+        for url in (
+            "/api/reports",
+            f"/api/reports?symbols={too_many}",
+            "/api/reports?symbols=005930&fields=price,unknown",
+        ):
+            with self.subTest(url=url):
+                self.assertEqual(self.client.get(url).status_code, 400)
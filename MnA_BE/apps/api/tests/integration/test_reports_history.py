@@ -0,0 +1,79 @@
+# apps/api/tests/integration/test_reports_history.py
+from django.test import TestCase, Client
+from unittest.mock import patch
+import pandas as pd
+
+
+class ApiReportsHistoryTests(TestCase):
+    """
+    report history 구간(start/end) / 해상도(interval) 파라미터
+    """
+
+    def setUp(self):
+        self.client = Client()
+        from utils import instant_data
+
+        # 2025-01-27(월) ~ 2025-02-07(금) 10거래일, close 100 → 109
+        dates = pd.bdate_range("2025-01-27", "2025-02-07")
+        close = [100.0 + i for i in range(len(dates))]
+        instant_df = pd.DataFrame(
+            {
+                "date": dates,
+                "ticker": "005930",
+                "name": "삼성전자",
+                "close": close,
+                "change": [0.0] + [1.0] * (len(dates) - 1),
+                "change_rate": 1.0,
+                "market_cap": [int(c * 10) for c in close],
+            }
+        )
+        data = {
+            "instant_df": instant_df,
+            "ticker_index": instant_data.build_ticker_index(instant_df),
+        }
+        patches = [
+            patch("apps.api.views.store.get_data", side_effect=data.get),
+            patch(
+                "apps.api.views.store.get_many",
+                side_effect=lambda keys: tuple(data.get(key) for key in keys),
+            ),
+            patch("apps.api.views.INDICES_SOURCE", "mock"),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_default_full_daily_history(self):
+        data = self.client.get("/api/reports/005930").json()
+
+        self.assertEqual(len(data["history"]), 10)
+
+    def test_range_keeps_latest_price(self):
+        """history는 구간만, 현재가는 최신 거래일 기준"""
+        data = self.client.get("/api/reports/005930?start=2025-01-28&end=2025-01-30").json()
+
+        self.assertEqual(
+            [h["date"] for h in data["history"]], ["2025-01-28", "2025-01-29", "2025-01-30"]
+        )
+        self.assertEqual(data["price"]["current"], 109.0)
+
+    def test_weekly(self):
+        data = self.client.get("/api/reports/005930?interval=weekly").json()
+
+        self.assertEqual(
+            [(h["date"], h["close"], h["change"]) for h in data["history"]],
+            [("2025-01-31", 104.0, 4.0), ("2025-02-07", 109.0, 5.0)],
+        )
+
+    def test_batch_monthly(self):
+        data = self.client.get("/api/reports?symbols=005930&interval=monthly&fields=history").json()
+
+        self.assertEqual(
+            [h["date"] for h in data["items"][0]["history"]], ["2025-01-31", "2025-02-07"]
+        )
+
+    def test_invalid_params(self):
+        for query in ("interval=hourly", "start=2025-13-01", "start=2025-02-01&end=2025-01-01"):
+            with self.subTest(query=query):
+                response = self.client.get(f"/api/reports/005930?{query}")
+                self.assertEqual(response.status_code, 400)
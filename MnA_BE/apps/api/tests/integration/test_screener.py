@@ -0,0 +1,64 @@
+# apps/api/tests/integration/test_screener.py
+from django.test import TestCase, Client
+from unittest.mock import patch
+from utils.tests.test_screener import make_snapshot
+import pandas as pd
+
+
+class ApiScreenerTests(TestCase):
+    """
+    최신 거래일 스크리너 (/api/screener)
+    """
+
+    def setUp(self):
+        self.client = Client()
+        from utils import instant_data
+
+        instant_df = make_snapshot()
+        instant_df.insert(0, "date", pd.Timestamp("2025-11-20"))
+        self.data = instant_data.instant_values(instant_df)
+        patches = [
+            patch("apps.api.views.store.get_data", side_effect=lambda key: self.data.get(key)),
+            patch("utils.instant_data.store.get_data", side_effect=lambda key: self.data.get(key)),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_screen(self):
+        response = self.client.get(
+            "/api/screener", {"market": "kospi", "per_max": "15", "sort": "roe", "limit": 2}
+        )
+        data = response.json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item["ticker"] for item in data["items"]], ["000660", "005930"])
+        self.assertEqual(data["total"], 3)
+        self.assertEqual(data["asOf"], "2025-11-20")
+        self.assertEqual(data["items"][0]["name"], "SK하이닉스")
+        self.assertEqual(data["items"][0]["PER"], 8.0)
+
+        data = self.client.get(
+            "/api/screener", {"market": "kospi", "per_max": "15", "sort": "roe", "offset": 2}
+        ).json()
+        self.assertEqual([item["ticker"] for item in data["items"]], ["035720"])
+        self.assertIsNone(data["items"][0]["change_rate"])
+
+    def test_invalid_params(self):
+        response = self.client.get("/api/screener", {"per_min": "cheap"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_without_stored_screener(self):
+        """스크리너가 없으면 instant_df 최신 스냅샷에서 계산"""
+        del self.data["screener"]
+        del self.data["latest_snapshot"]
+
+        data = self.client.get("/api/screener", {"market": "kosdaq"}).json()
+        self.assertEqual([item["ticker"] for item in data["items"]], ["247540"])
+
+    def test_not_loaded(self):
+        self.data.clear()
+
+        data = self.client.get("/api/screener").json()
+        self.assertTrue(data["degraded"])
+        self.assertEqual(data["total"], 0)
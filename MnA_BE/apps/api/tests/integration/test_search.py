@@ -0,0 +1,76 @@
+# apps/api/tests/integration/test_search.py
+from django.test import TestCase, Client
+from unittest.mock import patch
+import pandas as pd
+
+
+class ApiSearchTests(TestCase):
+    """
+    회사 검색 (/api/search) + company-profiles 회사명
+    """
+
+    def setUp(self):
+        self.client = Client()
+        from utils.search_index import build_search_index
+
+        self.data = {
+            "search_index": build_search_index(
+                [
+                    ("005930", "삼성전자", "KOSPI"),
+                    ("000660", "SK하이닉스", "KOSPI"),
+                    ("247540", "에코프로비엠", "KOSDAQ"),
+                    ("005935", "삼성전자우", "KOSPI"),
+                ]
+            ),
+            "profile_df": pd.DataFrame(
+                {"explanation": ["메모리 반도체", "2차전지 양극재"]}, index=["005930", "247540"]
+            ),
+        }
+        p = patch("apps.api.views.store.get_data", side_effect=lambda key: self.data.get(key))
+        p.start()
+        self.addCleanup(p.stop)
+
+    def test_search(self):
+        response = self.client.get("/api/search", {"q": "삼성"})
+        data = response.json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item["ticker"] for item in data["items"]], ["005930", "005935"])
+        self.assertEqual(
+            data["items"][0], {"ticker": "005930", "name": "삼성전자", "market": "KOSPI"}
+        )
+        self.assertEqual(data["total"], 2)
+
+    def test_search_limit_and_market(self):
+        data = self.client.get("/api/search", {"q": "ㅅ", "limit": 1}).json()
+        self.assertEqual([item["ticker"] for item in data["items"]], ["005930"])
+
+        data = self.client.get("/api/search", {"q": "ㅇ", "market": "kosdaq"}).json()
+        self.assertEqual([item["ticker"] for item in data["items"]], ["247540"])
+
+    def test_search_empty_query(self):
+        data = self.client.get("/api/search").json()
+        self.assertEqual(data["items"], [])
+
+    def test_search_not_loaded(self):
+        del self.data["search_index"]
+
+        data = self.client.get("/api/search", {"q": "삼성"}).json()
+
+        self.assertTrue(data["degraded"])
+        self.assertEqual(data["items"], [])
+
+    def test_company_profiles_names(self):
+        """회사명은 검색 인덱스에서 (없는 종목은 null)"""
+        data = self.client.get("/api/company-profiles").json()
+        self.assertEqual(
+            {item["ticker"]: item["name"] for item in data["items"]},
+            {"005930": "삼성전자", "247540": "에코프로비엠"},
+        )
+
+        data = self.client.get("/api/company-profiles", {"symbol": "247540"}).json()
+        self.assertEqual(data["items"][0]["name"], "에코프로비엠")
+
+        del self.data["search_index"]
+        data = self.client.get("/api/company-profiles").json()
+        self.assertIsNone(data["items"][0]["name"])
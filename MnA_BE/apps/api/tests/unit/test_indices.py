@@ -0,0 +1,105 @@
+from django.test import SimpleTestCase
+from unittest.mock import patch, MagicMock
+from datetime import datetime, timezone
+from apps.api import indices
+
+
+def make_bucket(kospi_close=2500.123):
+    s3 = MagicMock()
+    s3.get_list_v2.return_value = {
+        "Contents": [
+            {
+                "Key": "stock-indices/year=2025/month=11/day=19/KOSPI.json",
+                "LastModified": datetime(2025, 11, 19, tzinfo=timezone.utc),
+            },
+            {
+                "Key": "stock-indices/year=2025/month=11/day=20/KOSPI.json",
+                "LastModified": datetime(2025, 11, 20, tzinfo=timezone.utc),
+            },
+            {
+                "Key": "stock-indices/year=2025/month=11/day=20/KOSDAQ.json",
+                "LastModified": datetime(2025, 11, 20, tzinfo=timezone.utc),
+            },
+        ]
+    }
+    s3.get_json.side_effect = lambda key: {
+        "close": kospi_close if "KOSPI" in key else 750.456,
+        "change_percent": 1.234,
+        "fetched_at": "2025-11-20T15:35:00",
+    }
+    return s3
+
+
+class IndicesSnapshotTests(SimpleTestCase):
+    """
+    지수 스냅샷 제공자 유닛 테스트
+    """
+
+    def setUp(self):
+        indices.clear_indices_snapshot()
+
+    def tearDown(self):
+        indices.clear_indices_snapshot()
+
+    @patch("apps.api.indices.FinanceBucket")
+    def test_fetch_latest_records(self, mock_bucket):
+        """가장 최근 KOSPI/KOSDAQ 파일을 사용"""
+        mock_bucket.return_value = make_bucket()
+
+        snapshot = indices.get_indices_snapshot()
+
+        self.assertEqual(snapshot["kospi"], {"value": 2500.12, "changePct": 1.23})
+        self.assertEqual(snapshot["kosdaq"], {"value": 750.46, "changePct": 1.23})
+        self.assertEqual(snapshot["asOf"], "2025-11-20T15:35:00")
+        mock_bucket.return_value.get_json.assert_any_call(
+            "stock-indices/year=2025/month=11/day=20/KOSPI.json"
+        )
+
+    @patch("apps.api.indices.FinanceBucket")
+    def test_cached_within_ttl(self, mock_bucket):
+        """TTL 안에서는 S3를 다시 조회하지 않음"""
+        mock_bucket.return_value = make_bucket()
+
+        indices.get_indices_snapshot()
+        indices.get_indices_snapshot()
+
+        self.assertEqual(mock_bucket.return_value.get_list_v2.call_count, 1)
+
+    @patch("apps.api.indices.FinanceBucket")
+    def test_no_contents_returns_none(self, mock_bucket):
+        """지수 데이터가 없으면 None"""
+        mock_bucket.return_value.get_list_v2.return_value = {}
+
+        self.assertIsNone(indices.get_indices_snapshot())
+
+    @patch("apps.api.indices.threading.Thread")
+    @patch("apps.api.indices.FinanceBucket")
+    def test_stale_snapshot_served_while_refreshing(self, mock_bucket, mock_thread):
+        """TTL이 지나면 이전 값을 반환하고 백그라운드 갱신을 한 번만 시작"""
+        mock_bucket.return_value = make_bucket()
+        indices.get_indices_snapshot()
+
+        with patch("apps.api.indices.INDICES_TTL_SECONDS", 0):
+            first = indices.get_indices_snapshot()
+            indices.get_indices_snapshot()
+
+        self.assertEqual(first["kospi"]["value"], 2500.12)
+        mock_thread.assert_called_once()
+        mock_thread.return_value.start.assert_called_once()
+
+        # 백그라운드 작업 실행 후 새 값으로 교체
+        mock_bucket.return_value = make_bucket(kospi_close=2600)
+        mock_thread.call_args.kwargs["target"]()
+
+        self.assertEqual(indices.get_indices_snapshot()["kospi"]["value"], 2600)
+
+    @patch("apps.api.indices.FinanceBucket")
+    def test_background_failure_keeps_snapshot(self, mock_bucket):
+        """백그라운드 갱신 실패 시 이전 스냅샷 유지"""
+        mock_bucket.return_value = make_bucket()
+        indices.get_indices_snapshot()
+
+        mock_bucket.return_value.get_list_v2.side_effect = Exception("S3 down")
+        indices._refresh_in_background()
+
+        self.assertEqual(indices.get_indices_snapshot()["kospi"]["value"], 2500.12)
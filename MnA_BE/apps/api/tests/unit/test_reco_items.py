@@ -0,0 +1,51 @@
+# apps/api/tests/unit/test_reco_items.py
+from django.test import SimpleTestCase
+from unittest.mock import patch
+import pandas as pd
+
+
+class WithQuotesTests(SimpleTestCase):
+    """추천 항목 시세 채우기 (apps/api/recommendations/items.py)"""
+
+    def setUp(self):
+        from utils import instant_data
+
+        instant_df = pd.DataFrame(
+            {
+                "date": pd.to_datetime(["2025-11-19", "2025-11-20", "2025-11-20"]),
+                "ticker": ["000660", "005930", "035720"],
+                "close": [50.0, 101.0, 40.0],
+                "change": [0.0, 1.0, -1.0],
+                "change_rate": [0.0, 1.0, -2.44],
+                "market_cap": [500, 1010, 400],
+            }
+        )
+        self.data = instant_data.instant_values(instant_df)
+        p = patch("utils.store.store.get_data", side_effect=lambda key: self.data.get(key))
+        p.start()
+        self.addCleanup(p.stop)
+
+    def test_with_quotes(self):
+        from apps.api.recommendations.items import to_item, with_quotes
+
+        cached = [
+            to_item({"ticker": t, "name": t, "reason": "r"}) for t in ("035720", "000660", "005930")
+        ]
+
+        items = with_quotes(cached)
+
+        self.assertEqual(
+            [(item["price"], item["change"], item["change_rate"]) for item in items],
+            [(40.0, -1.0, -2.44), (None, None, None), (101.0, 1.0, 1.0)],
+        )
+        self.assertEqual(items[0]["headline"], "r")
+        # 캐시된 항목은 그대로
+        self.assertIsNone(cached[0]["price"])
+
+    def test_not_loaded(self):
+        from apps.api.recommendations.items import to_item, with_quotes
+
+        self.data.clear()
+        items = [to_item({"ticker": "005930"})]
+
+        self.assertEqual(with_quotes(items), items)
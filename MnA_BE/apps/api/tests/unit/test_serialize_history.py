@@ -0,0 +1,95 @@
+from django.test import SimpleTestCase
+from apps.api.views import serialize_history, safe_float, safe_int
+import numpy as np
+import pandas as pd
+
+
+def row_wise_history(df):
+    """기존 iterrows 기반 변환 (비교 기준)"""
+    out = []
+    for _, row in df.iterrows():
+        out.append(
+            {
+                "date": (
+                    str(row["date"].date()) if hasattr(row["date"], "date") else str(row["date"])
+                ),
+                "close": safe_float(row["close"]),
+                "change": safe_float(row["change"]),
+                "change_rate": safe_float(row["change_rate"]),
+                "market_cap": safe_int(row["market_cap"]),
+                "PER": safe_float(row["PER"]),
+                "PBR": safe_float(row["PBR"]),
+                "EPS": safe_float(row["EPS"]),
+                "BPS": safe_float(row["BPS"]),
+                "DIV": safe_float(row["DIV"]),
+                "DPS": safe_float(row["DPS"]),
+                "ROE": safe_float(row["ROE"]),
+            }
+        )
+    return out
+
+
+class SerializeHistoryTests(SimpleTestCase):
+    """
+    serialize_history 유닛 테스트
+    """
+
+    def setUp(self):
+        self.df = pd.DataFrame(
+            {
+                "date": pd.to_datetime(["2025-01-02", "2025-01-03", "2025-01-06"]),
+                "close": [100.0, np.nan, 102.5],
+                "change": [1.0, -1.0, None],
+                "change_rate": [0.01, -0.01, 0.02],
+                "market_cap": ["1000000.7", None, "abc"],
+                "PER": [10.0, 11.0, np.nan],
+                "PBR": [1.0, 1.1, 1.2],
+                "EPS": [5.0, 5.0, 5.0],
+                "BPS": [50.0, 50.0, 50.0],
+                "DIV": [2.0, np.nan, 2.0],
+                "DPS": [100.0, 100.0, 100.0],
+                "ROE": ["10.5", "bad", None],
+            }
+        )
+
+    def test_matches_row_wise_output(self):
+        """기존 row 단위 변환과 동일한 결과"""
+        self.assertEqual(serialize_history(self.df), row_wise_history(self.df))
+
+    def test_nan_becomes_none(self):
+        """NaN / 숫자가 아닌 값은 None"""
+        history = serialize_history(self.df)
+
+        self.assertIsNone(history[1]["close"])
+        self.assertIsNone(history[2]["market_cap"])
+        self.assertIsNone(history[1]["ROE"])
+
+    def test_python_native_types(self):
+        """JSON 직렬화 가능한 파이썬 기본 타입으로 반환"""
+        history = serialize_history(self.df)
+
+        self.assertIs(type(history[0]["close"]), float)
+        self.assertIs(type(history[0]["market_cap"]), int)
+        self.assertEqual(history[0]["market_cap"], 1000000)
+        self.assertEqual(history[0]["date"], "2025-01-02")
+
+    def test_string_dates(self):
+        """문자열 date 컬럼은 그대로 사용"""
+        df = self.df.assign(date=["2025-01-02", "2025-01-03", "2025-01-06"])
+
+        self.assertEqual(serialize_history(df), row_wise_history(df))
+
+    def test_compact_schema(self):
+        """normalize_schema 적용(float32/category) 후에도 같은 값, float32 오차 없음"""
+        from utils.instant_data import normalize_schema
+
+        raw = self.df.assign(ticker="005930", change_rate=[1.23, -0.45, 0.07])
+        history = serialize_history(normalize_schema(raw.copy()))
+
+        self.assertEqual(history, row_wise_history(raw))
+        self.assertEqual(history[0]["change_rate"], 1.23)
+        self.assertIs(type(history[0]["close"]), float)
+
+    def test_empty(self):
+        """빈 DataFrame은 빈 리스트"""
+        self.assertEqual(serialize_history(self.df.iloc[0:0]), [])
@@ -8,6 +8,8 @@ urlpatterns = [
     path("health", APIView.as_view({"get": "get_health"}), name="health"),
     path("indices", APIView.as_view({"get": "get_indices"}), name="indices"),
     path("company-list", APIView.as_view({"get": "get_company_list"})),
+    path("search", APIView.as_view({"get": "get_search"}), name="search"),
+    path("screener", APIView.as_view({"get": "get_screener"}), name="screener"),
     path(
         "company-profiles",
         APIView.as_view({"get": "get_company_profiles"}),
@@ -18,6 +20,7 @@ urlpatterns = [
         APIView.as_view({"get": "get_company_overview"}),
         name="company-overview",
     ),
+    path("reports", APIView.as_view({"get": "get_reports_batch"}), name="reports_batch"),
     path(
         "reports/<str:symbol>",
         APIView.as_view({"get": "get_reports_detail"}),
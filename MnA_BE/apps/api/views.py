@@ -1,5 +1,5 @@
 # apps/api/views.py
-from django.http import HttpRequest, JsonResponse
+from django.http import HttpRequest
 from django.core.cache import cache
 from rest_framework import viewsets, serializers
 from rest_framework.decorators import action
@@ -7,15 +7,19 @@ from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from S3.finance import FinanceBucket
 from Mocks.mock_data import MOCK_INDICES, MOCK_ARTICLES
-from decorators import default_error_handler
+from decorators import default_error_handler, data_etag
 from utils.debug_print import debug_print
 from utils.pagination import get_pagination
-from utils.get_llm_overview import get_latest_overview
+from utils.get_llm_overview import get_overview_items, overview_version
 from utils.for_api import *
+from utils.fast_json import FastJsonResponse
 from utils.store import store
-from utils import instant_data
+from utils import instant_data, search_index, screener
+from apps.api.indices import get_indices_snapshot, indices_version
 from apps.api.constants import *
+from datetime import date
 import json
+import numpy as np
 import pandas as pd
 
 
@@ -39,6 +43,325 @@ def safe_int(value):
         return None
 
 
+HISTORY_FLOAT_FIELDS = ["close", "change", "change_rate"]
+HISTORY_INT_FIELDS = ["market_cap"]
+HISTORY_RATIO_FIELDS = ["PER", "PBR", "EPS", "BPS", "DIV", "DPS", "ROE"]
+
+
+def _history_dates(values: pd.Series) -> np.ndarray:
+    """history date 컬럼을 YYYY-MM-DD 문자열 배열로 변환"""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.dt.strftime("%Y-%m-%d").to_numpy(dtype=object)
+    return np.array([str(v.date()) if hasattr(v, "date") else str(v) for v in values], dtype=object)
+
+
+def _nullable_column(df: pd.DataFrame, column: str, as_int: bool = False) -> np.ndarray:
+    """
+    숫자 컬럼을 NaN → None 인 object 배열로 변환 (safe_float / safe_int 와 같은 규칙)
+    """
+    if column not in df.columns:
+        return np.full(len(df), None, dtype=object)
+
+    values = instant_data.float64_values(df[column])
+    mask = ~np.isfinite(values) if as_int else np.isnan(values)
+
+    if as_int:
+        out = np.trunc(np.where(mask, 0, values)).astype(np.int64).astype(object)
+    else:
+        out = values.astype(object)
+    out[mask] = None
+    return out
+
+
+def serialize_history(df: pd.DataFrame) -> list:
+    """
+    instant_df 슬라이스를 history 응답 리스트로 변환 (컬럼 단위 일괄 변환)
+    """
+    if len(df) == 0:
+        return []
+
+    fields = ["date"] + HISTORY_FLOAT_FIELDS + HISTORY_INT_FIELDS + HISTORY_RATIO_FIELDS
+    columns = (
+        [_history_dates(df["date"])]
+        + [_nullable_column(df, c) for c in HISTORY_FLOAT_FIELDS]
+        + [_nullable_column(df, c, as_int=True) for c in HISTORY_INT_FIELDS]
+        + [_nullable_column(df, c) for c in HISTORY_RATIO_FIELDS]
+    )
+    return [dict(zip(fields, row)) for row in zip(*columns)]
+
+
+def _indices_etag(request, **kwargs):
+    """지수 스냅샷이 바뀌면 ETag도 변경 (mock 지수는 고정)"""
+    return indices_version() if INDICES_SOURCE == "s3" else "mock"
+
+
+def _overview_etag(request, **kwargs):
+    """company-overview가 바뀌면 ETag도 변경 (overview 캐시는 데이터 reload와 별개로 갱신)"""
+    return overview_version("company-overview")
+
+
+# 배치 report에서 선택할 수 있는 필드 (ticker는 항상 포함)
+REPORT_FIELDS = [
+    "name",
+    "market",
+    "industry",
+    "price",
+    "current",
+    "valuation",
+    "dividend",
+    "financials",
+    "history",
+    "profile",
+    "articles",
+    "asOf",
+    "source",
+]
+REPORTS_BATCH_MAX = 50
+
+
+def get_indices_snippet():
+    """report에 붙이는 KOSPI/KOSDAQ 지수 (조회 실패 시 None)"""
+    if INDICES_SOURCE != "s3":
+        return MOCK_INDICES
+
+    try:
+        snapshot = get_indices_snapshot()
+    except Exception as e:
+        debug_print(f"Error fetching indices: {e}")
+        return None
+
+    if snapshot is None:
+        return None
+    return {name: snapshot[name] for name in ("kospi", "kosdaq") if snapshot[name] is not None}
+
+
+def company_name(index, ticker):
+    """검색 인덱스 기준 회사명 (없거나 로드 전이면 None)"""
+    if index is None or ticker not in index["by_ticker"]:
+        return None
+    return index["entries"][index["by_ticker"][ticker]]["name"]
+
+
+def profile_explanation(profile_df, symbol):
+    if profile_df is None or symbol not in profile_df.index:
+        return None
+    prow = profile_df.loc[symbol]
+    return str(prow.get("explanation", None)) if "explanation" in prow else None
+
+
+def parse_history_params(request: HttpRequest):
+    """
+    history 구간/해상도 query params → (start, end, interval)
+    잘못된 값이면 ValueError
+    """
+    interval = request.GET.get("interval", "daily").lower()
+    if interval not in instant_data.HISTORY_INTERVALS:
+        raise ValueError(f"INVALID INTERVAL (one of {', '.join(instant_data.HISTORY_INTERVALS)})")
+
+    bounds = []
+    for name in ("start", "end"):
+        value = request.GET.get(name)
+        try:
+            bounds.append(pd.Timestamp(date.fromisoformat(value)) if value else None)
+        except ValueError:
+            raise ValueError(f"INVALID {name.upper()} DATE (YYYY-MM-DD)")
+
+    start, end = bounds
+    if start is not None and end is not None and start > end:
+        raise ValueError("START MUST BE BEFORE END")
+    return start, end, interval
+
+
+def report_history(symbol_history: pd.DataFrame, start=None, end=None, interval="daily"):
+    """
+    (history 리스트, 최신 거래일 행 직렬화 결과)
+    - 기본값(전체 일봉)이면 전체 이력을 한 번만 직렬화
+    - 구간/해상도가 있으면 집계한 이력과 최신 행을 따로 직렬화 (현재가는 항상 최신 거래일 기준)
+    """
+    if start is None and end is None and interval == "daily":
+        history_data = serialize_history(symbol_history)
+        return history_data, history_data[-1]
+
+    window = instant_data.history_window(symbol_history, start, end, interval)
+    return serialize_history(window), serialize_history(symbol_history.iloc[-1:])[0]
+
+
+HISTORY_PARAMETERS = [
+    openapi.Parameter(
+        "start",
+        openapi.IN_QUERY,
+        description="History start date, inclusive (YYYY-MM-DD)",
+        type=openapi.TYPE_STRING,
+        required=False,
+    ),
+    openapi.Parameter(
+        "end",
+        openapi.IN_QUERY,
+        description="History end date, inclusive (YYYY-MM-DD)",
+        type=openapi.TYPE_STRING,
+        required=False,
+    ),
+    openapi.Parameter(
+        "interval",
+        openapi.IN_QUERY,
+        description="History resolution: daily (default), weekly, monthly "
+        "(last close of the period, summed change)",
+        type=openapi.TYPE_STRING,
+        required=False,
+    ),
+]
+
+SCREENER_PARAMETERS = [
+    *[
+        openapi.Parameter(
+            f"{field}_{bound}",
+            openapi.IN_QUERY,
+            description=f"{column} {'lower' if bound == 'min' else 'upper'} bound, inclusive",
+            type=openapi.TYPE_NUMBER,
+        )
+        for field, column in screener.RANGE_FIELDS.items()
+        for bound in ("min", "max")
+    ],
+    openapi.Parameter(
+        "market",
+        openapi.IN_QUERY,
+        description='Market filter, comma separated (e.g., "kospi,kosdaq")',
+        type=openapi.TYPE_STRING,
+    ),
+    openapi.Parameter(
+        "industry",
+        openapi.IN_QUERY,
+        description="Industry filter, comma separated",
+        type=openapi.TYPE_STRING,
+    ),
+    openapi.Parameter(
+        "sort",
+        openapi.IN_QUERY,
+        description=f"Sort field: {', '.join(screener.RANGE_FIELDS)} (default: market_cap)",
+        type=openapi.TYPE_STRING,
+    ),
+    openapi.Parameter(
+        "order",
+        openapi.IN_QUERY,
+        description="asc or desc (default: desc)",
+        type=openapi.TYPE_STRING,
+    ),
+    openapi.Parameter(
+        "limit",
+        openapi.IN_QUERY,
+        description="Number of items (default: 20, max: 100)",
+        type=openapi.TYPE_INTEGER,
+    ),
+    openapi.Parameter(
+        "offset",
+        openapi.IN_QUERY,
+        description="Pagination offset (default: 0)",
+        type=openapi.TYPE_INTEGER,
+    ),
+]
+
+
+def build_report(symbol, latest_row, latest, history_data, explanation=None, indices_snippet=None):
+    """
+    report 응답 생성
+    - latest_row: 최신 거래일 instant_df 행 (종목 데이터가 없으면 None)
+    - latest: 같은 행의 serialize_history 결과 (숫자 값은 float32 컬럼도 10진 표현 그대로,
+      날짜는 history와 같은 YYYY-MM-DD)
+    - history_data: serialize_history 결과 리스트 또는 None
+    """
+    name = None
+    market_type = None
+    industry = None
+    price = change = change_rate = None
+    market_cap = None
+    shares_outstanding = None
+    ts_price = None
+
+    eps = None
+    bps = None
+    div = None
+    dps = None
+    roe = None
+
+    valuation = {
+        "pe_annual": None,
+        "pe_ttm": None,
+        "forward_pe": None,
+        "ps_ttm": None,
+        "pb": None,
+        "pcf_ttm": None,
+        "pfcf_ttm": None,
+    }
+
+    dividend = {"payout_ratio": None, "yield": None, "latest_exdate": None}
+
+    if latest_row is not None:
+        row = latest_row
+        ts_price = latest["date"]
+
+        name = str(row["name"]) if "name" in row and row["name"] is not None else None
+        market_type = str(row["market"]) if "market" in row and row["market"] is not None else None
+        industry = (
+            str(row["industry"]) if "industry" in row and row["industry"] is not None else None
+        )
+
+        price = latest["close"]
+        change = latest["change"]
+        change_rate = latest["change_rate"]
+
+        market_cap = latest["market_cap"]
+
+        eps = latest["EPS"]
+        bps = latest["BPS"]
+        div = latest["DIV"]
+        dps = latest["DPS"]
+        roe = latest["ROE"]
+
+        if market_cap and price and price > 0:
+            shares_outstanding = int(market_cap / price)
+
+        per_val = latest["PER"]
+        pbr_val = latest["PBR"]
+
+        if per_val is not None:
+            valuation["pe_annual"] = per_val
+            valuation["pe_ttm"] = per_val
+        if pbr_val is not None:
+            valuation["pb"] = pbr_val
+
+        if div is not None:
+            dividend["yield"] = round(div, 2)
+
+    return {
+        "ticker": symbol,
+        "name": name,
+        "market": market_type,
+        "industry": industry,
+        "price": (
+            {"current": price, "change": change, "change_rate": change_rate}
+            if price is not None
+            else None
+        ),
+        "current": {
+            "price": price,
+            "change": change,
+            "change_rate": change_rate,
+            "market_cap": market_cap,
+            "shares_outstanding": shares_outstanding,
+            "date": ts_price,
+        },
+        "valuation": valuation,
+        "dividend": dividend,
+        "financials": {"eps": eps, "bps": bps, "dps": dps, "roe": roe, "div": div},
+        "history": history_data,
+        "profile": {"symbol": symbol, "explanation": explanation} if explanation else None,
+        "indicesSnippet": indices_snippet,
+        "articles": [],
+        "asOf": ts_price or iso_now(),
+        "source": "cache",
+    }
+
+
 # ============================================================================
 # Serializers
 # ============================================================================
@@ -55,11 +378,18 @@ class HealthCacheSerializer(serializers.Serializer):
     last_loaded = serializers.CharField(allow_null=True)
 
 
+class HealthDataVersionSerializer(serializers.Serializer):
+    id = serializers.CharField()
+    sources = serializers.DictField()
+    loaded_at = serializers.CharField()
+
+
 class HealthResponseSerializer(serializers.Serializer):
     api = serializers.CharField()
     s3 = HealthS3Serializer()
     db = serializers.DictField()
     cache = HealthCacheSerializer()
+    dataVersion = HealthDataVersionSerializer(allow_null=True)
     asOf = serializers.CharField()
 
 
@@ -102,7 +432,7 @@ class CompanyListResponseSerializer(serializers.Serializer):
 
 class CompanyProfileItemSerializer(serializers.Serializer):
     ticker = serializers.CharField()
-    name = serializers.CharField()
+    name = serializers.CharField(allow_null=True)
     explanation = serializers.CharField(required=False)
 
 
@@ -192,6 +522,51 @@ class ReportResponseSerializer(serializers.Serializer):
     source = serializers.CharField()
 
 
+class SearchItemSerializer(serializers.Serializer):
+    ticker = serializers.CharField()
+    name = serializers.CharField(allow_null=True)
+    market = serializers.CharField(allow_null=True)
+
+
+class SearchResponseSerializer(serializers.Serializer):
+    items = SearchItemSerializer(many=True)
+    query = serializers.CharField()
+    total = serializers.IntegerField()
+    source = serializers.CharField()
+    asOf = serializers.CharField()
+
+
+class ScreenerItemSerializer(serializers.Serializer):
+    ticker = serializers.CharField()
+    name = serializers.CharField(allow_null=True)
+    market = serializers.CharField(allow_null=True)
+    industry = serializers.CharField(allow_null=True)
+    close = serializers.FloatField(allow_null=True)
+    change_rate = serializers.FloatField(allow_null=True)
+    market_cap = serializers.IntegerField(allow_null=True)
+    PER = serializers.FloatField(allow_null=True)
+    PBR = serializers.FloatField(allow_null=True)
+    ROE = serializers.FloatField(allow_null=True)
+    DIV = serializers.FloatField(allow_null=True)
+
+
+class ScreenerResponseSerializer(serializers.Serializer):
+    items = ScreenerItemSerializer(many=True)
+    total = serializers.IntegerField()
+    limit = serializers.IntegerField()
+    offset = serializers.IntegerField()
+    source = serializers.CharField()
+    asOf = serializers.CharField()
+
+
+class ReportBatchResponseSerializer(serializers.Serializer):
+    items = ReportResponseSerializer(many=True)
+    missing = serializers.ListField(child=serializers.CharField())
+    indicesSnippet = serializers.DictField(allow_null=True)
+    asOf = serializers.CharField()
+    source = serializers.CharField()
+
+
 # ============================================================================
 # Views
 # ============================================================================
@@ -224,9 +599,9 @@ class APIView(viewsets.ViewSet):
 
         db_status = {"ok": True}
 
-        instant_df = store.get_data("instant_df")
-        profile_df = store.get_data("profile_df")
-        last_loaded = cache.get("data_last_loaded")
+        instant_df, profile_df = store.get_many(["instant_df", "profile_df"])
+        data_version = instant_data.get_data_version()
+        last_loaded = data_version["loaded_at"] if data_version else cache.get("data_last_loaded")
 
         cache_status = {
             "instant_loaded": instant_df is not None,
@@ -240,12 +615,22 @@ class APIView(viewsets.ViewSet):
                 "s3": s3_status,
                 "db": db_status,
                 "cache": cache_status,
+                "dataVersion": data_version,
                 "asOf": iso_now(),
             }
         )
 
     @swagger_auto_schema(
         operation_description="Manually reload data from S3 into memory cache (admin function)",
+        manual_parameters=[
+            openapi.Parameter(
+                "full",
+                openapi.IN_QUERY,
+                description="true: reload the whole instant parquet (default: new daily partitions only)",
+                type=openapi.TYPE_BOOLEAN,
+                required=False,
+            )
+        ],
         responses={
             200: openapi.Response(
                 description="Success or degraded mode",
@@ -253,6 +638,8 @@ class APIView(viewsets.ViewSet):
                     "application/json": {
                         "status": "success",
                         "message": "Data reloaded successfully",
+                        "mode": "delta",
+                        "added_dates": ["2025-11-20"],
                         "instant_loaded": True,
                         "profile_loaded": True,
                     }
@@ -264,7 +651,8 @@ class APIView(viewsets.ViewSet):
     @default_error_handler
     def reload_data(self, request: HttpRequest):
         try:
-            return instant_data.reload()
+            full = request.GET.get("full", "").lower() in ("1", "true")
+            return instant_data.reload(full=full)
         except Exception as e:
             debug_print(f"✗ Error reloading data: {e}")
             import traceback
@@ -277,14 +665,14 @@ class APIView(viewsets.ViewSet):
         responses={200: IndicesResponseSerializer()},
     )
     @action(detail=False, methods=["get"])
+    @data_etag(extra=_indices_etag)
     @default_error_handler
     def get_indices(self, request: HttpRequest):
         if INDICES_SOURCE == "s3":
             try:
-                s3 = FinanceBucket()
-                response = s3.get_list_v2(S3_PREFIX_INDICES)
+                snapshot = get_indices_snapshot()
 
-                if "Contents" not in response:
+                if snapshot is None:
                     return degraded(
                         "No indices data in S3",
                         source="s3",
@@ -292,42 +680,13 @@ class APIView(viewsets.ViewSet):
                         kosdaq=MOCK_INDICES.get("kosdaq", {"value": 750, "changePct": 0}),
                     )
 
-                files = sorted(response["Contents"], key=lambda x: x["LastModified"], reverse=True)
-
-                kospi_file = None
-                kosdaq_file = None
-
-                for f in files:
-                    if "KOSPI.json" in f["Key"] and kospi_file is None:
-                        kospi_file = f
-                    if "KOSDAQ.json" in f["Key"] and kosdaq_file is None:
-                        kosdaq_file = f
-                    if kospi_file and kosdaq_file:
-                        break
-
-                kospi_data = {}
-                kosdaq_data = {}
-                as_of = None
-
-                if kospi_file:
-                    data = s3.get_json(kospi_file["Key"])
-                    kospi_data = {
-                        "value": round(data.get("close", 0), 2),
-                        "changePct": round(data.get("change_percent", 0), 2),
-                    }
-                    as_of = data.get("fetched_at") or str(kospi_file["LastModified"])
-
-                if kosdaq_file:
-                    data = s3.get_json(kosdaq_file["Key"])
-                    kosdaq_data = {
-                        "value": round(data.get("close", 0), 2),
-                        "changePct": round(data.get("change_percent", 0), 2),
-                    }
-                    if not as_of:
-                        as_of = data.get("fetched_at") or str(kosdaq_file["LastModified"])
-
                 return ok(
-                    {"kospi": kospi_data, "kosdaq": kosdaq_data, "asOf": as_of, "source": "s3"}
+                    {
+                        "kospi": snapshot["kospi"] or {},
+                        "kosdaq": snapshot["kosdaq"] or {},
+                        "asOf": snapshot["asOf"],
+                        "source": "s3",
+                    }
                 )
 
             except Exception as e:
@@ -366,6 +725,7 @@ class APIView(viewsets.ViewSet):
         responses={200: CompanyListResponseSerializer()},
     )
     @action(detail=False, methods=["get"])
+    @data_etag(extra=_overview_etag)
     @default_error_handler
     def get_company_list(self, request):
         limit, offset = get_pagination(request, default_limit=10, max_limit=100)
@@ -381,22 +741,18 @@ class APIView(viewsets.ViewSet):
                     "Data not loaded in cache", source="cache", total=0, limit=limit, offset=offset
                 )
 
-            latest_date = df["date"].max()
-            df_latest = df[df["date"] == latest_date]
-
-            if market and "market" in df_latest.columns:
-                df_latest = df_latest[df_latest["market"] == market]
+            df_latest, latest_date = instant_data.get_latest_snapshot(df, market)
 
             total = len(df_latest)
             page_df = df_latest.iloc[offset : offset + limit]
 
-            company_overview = get_latest_overview("company-overview")
+            company_overview = get_overview_items("company-overview")
 
             items = [
                 {
                     "ticker": row["ticker"],
                     "name": str(row["name"]),
-                    "overview": json.loads(company_overview.get(row["ticker"], "{}")),
+                    "overview": company_overview.get(row["ticker"], {}),
                 }
                 for idx, row in page_df.iterrows()
             ]
@@ -441,6 +797,7 @@ class APIView(viewsets.ViewSet):
         responses={200: CompanyProfileResponseSerializer()},
     )
     @action(detail=False, methods=["get"])
+    @data_etag
     @default_error_handler
     def get_company_profiles(self, request: HttpRequest):
         limit, offset = get_pagination(request, default_limit=10, max_limit=100)
@@ -457,10 +814,18 @@ class APIView(viewsets.ViewSet):
                     offset=offset,
                 )
 
+            index = store.get_data("search_index")
+
             if symbol:
                 if symbol in df.index:
                     row = df.loc[symbol]
-                    items = [{"ticker": symbol, "explanation": str(row["explanation"])}]
+                    items = [
+                        {
+                            "ticker": symbol,
+                            "name": company_name(index, symbol),
+                            "explanation": str(row["explanation"]),
+                        }
+                    ]
                     return ok(
                         {
                             "items": items,
@@ -491,7 +856,7 @@ class APIView(viewsets.ViewSet):
                 items.append(
                     {
                         "ticker": idx,
-                        "name": "hello",
+                        "name": company_name(index, idx),
                     }
                 )
 
@@ -510,6 +875,98 @@ class APIView(viewsets.ViewSet):
             debug_print(e)
             return degraded(str(e), source="cache", total=0, limit=limit, offset=offset)
 
+    @swagger_auto_schema(
+        operation_description="Search companies by ticker/name prefix, substring or "
+        "Hangul initial consonants (e.g. ㅅㅅㅈㅈ)",
+        manual_parameters=[
+            openapi.Parameter(
+                "q",
+                openapi.IN_QUERY,
+                description="Search text (e.g., 0059, 삼성, 전자, ㅅㅅ)",
+                type=openapi.TYPE_STRING,
+                required=True,
+            ),
+            openapi.Parameter(
+                "limit",
+                openapi.IN_QUERY,
+                description="Number of items (default: 10, max: 50)",
+                type=openapi.TYPE_INTEGER,
+            ),
+            openapi.Parameter(
+                "market",
+                openapi.IN_QUERY,
+                description='Market filter: "kospi" or "kosdaq"',
+                type=openapi.TYPE_STRING,
+            ),
+        ],
+        responses={200: SearchResponseSerializer()},
+    )
+    @action(detail=False, methods=["get"])
+    @data_etag
+    @default_error_handler
+    def get_search(self, request: HttpRequest):
+        limit, _ = get_pagination(request, default_limit=10, max_limit=50)
+        query = request.GET.get("q", "")
+        market = request.GET.get("market")
+
+        index = store.get_data("search_index")
+        if index is None:
+            return degraded("Search index not loaded in cache", source="cache", items=[], total=0)
+
+        items = search_index.search(index, query, limit=limit, market=market)
+
+        return ok(
+            {
+                "items": items,
+                "query": query,
+                "total": len(items),
+                "source": "cache",
+            }
+        )
+
+    @swagger_auto_schema(
+        operation_description="Screen the latest trading day by valuation ranges, market and industry",
+        manual_parameters=SCREENER_PARAMETERS,
+        responses={
+            200: ScreenerResponseSerializer(),
+            400: openapi.Response(description="Invalid filter/sort parameters"),
+        },
+    )
+    @action(detail=False, methods=["get"])
+    @data_etag
+    @default_error_handler
+    def get_screener(self, request: HttpRequest):
+        limit, offset = get_pagination(request, default_limit=20, max_limit=100)
+
+        try:
+            screen = screener.parse_screen(request.GET)
+        except ValueError as e:
+            return FastJsonResponse({"message": str(e)}, status=400)
+
+        screener_data = instant_data.get_screener()
+        if screener_data is None:
+            return degraded(
+                "Data not loaded in cache",
+                source="cache",
+                items=[],
+                total=0,
+                limit=limit,
+                offset=offset,
+            )
+
+        positions = screener.run_screen(screener_data, screen)
+
+        return ok(
+            {
+                "items": screener.page_rows(screener_data, positions, limit, offset),
+                "total": len(positions),
+                "limit": limit,
+                "offset": offset,
+                "source": "cache",
+                "asOf": str(screener_data["date"].date()),
+            }
+        )
+
     @swagger_auto_schema(
         operation_description="Get AI-generated investment analysis for a specific stock",
         manual_parameters=[
@@ -527,17 +984,19 @@ class APIView(viewsets.ViewSet):
         },
     )
     @action(detail=False, methods=["get"])
+    @data_etag(extra=_overview_etag)
     @default_error_handler
     def get_company_overview(self, request, ticker: str):
         try:
-            company_overview = get_latest_overview("company-overview")
+            company_overview = get_overview_items("company-overview")
         except Exception as e:
-            return JsonResponse({"message": "Unexpected Server Error"}, status=500)
+            return FastJsonResponse({"message": "Unexpected Server Error"}, status=500)
 
-        return JsonResponse(json.loads(company_overview.get(ticker, "{}")), status=200, safe=False)
+        return FastJsonResponse(company_overview.get(ticker, {}), status=200, safe=False)
 
     @swagger_auto_schema(
-        operation_description="Get comprehensive stock report with complete historical data since 2020",
+        operation_description="Get comprehensive stock report with historical data since 2020 "
+        "(optionally limited to start/end and aggregated to weekly/monthly bars)",
         manual_parameters=[
             openapi.Parameter(
                 "symbol",
@@ -546,206 +1005,167 @@ class APIView(viewsets.ViewSet):
                 type=openapi.TYPE_STRING,
                 required=True,
             ),
+            *HISTORY_PARAMETERS,
         ],
-        responses={200: ReportResponseSerializer()},
+        responses={
+            200: ReportResponseSerializer(),
+            400: openapi.Response(description="Invalid start/end/interval"),
+        },
     )
     @action(detail=False, methods=["get"])
+    @data_etag(extra=_indices_etag)
     @default_error_handler
     def get_reports_detail(self, request: HttpRequest, symbol: str):
         try:
-            # 1) 캐시에서 회사 프로필 가져오기
-            profile_df = store.get_data("profile_df")
-            explanation = None
-            if profile_df is not None and symbol in profile_df.index:
-                prow = profile_df.loc[symbol]
-                explanation = str(prow.get("explanation", None)) if "explanation" in prow else None
-
-            # 2) 캐시에서 instant 데이터 가져오기
-            instant_df = store.get_data("instant_df")
+            start, end, interval = parse_history_params(request)
+        except ValueError as e:
+            return FastJsonResponse({"message": str(e)}, status=400)
+
+        try:
+            # 1) 캐시에서 회사 프로필 / instant 데이터 / ticker 인덱스 (같은 reload 묶음)
+            profile_df, instant_df, ticker_index = store.get_many(
+                ["profile_df", "instant_df", "ticker_index"]
+            )
             if instant_df is None:
                 return degraded("Instant data not loaded in cache", source="cache")
 
-            latest_data = None
-            ts_price = None
+            latest_row = None
+            latest = None
             history_data = None
 
             if "ticker" in instant_df.columns and "date" in instant_df.columns:
-                symbol_history = instant_df[instant_df["ticker"] == symbol].sort_values("date")
+                symbol_history = instant_data.get_ticker_history(instant_df, symbol, ticker_index)
 
                 if len(symbol_history) > 0:
                     latest_row = symbol_history.iloc[-1]
-                    latest_data = pd.DataFrame([latest_row])
-                    ts_price = str(latest_row["date"])
-
-                    history_data = []
-                    for idx, row in symbol_history.iterrows():
-                        try:
-                            date_str = (
-                                str(row["date"].date())
-                                if hasattr(row["date"], "date")
-                                else str(row["date"])
-                            )
-
-                            history_data.append(
-                                {
-                                    "date": date_str,
-                                    "close": safe_float(row["close"]),
-                                    "change": safe_float(row["change"]),
-                                    "change_rate": safe_float(row["change_rate"]),
-                                    "market_cap": safe_int(row["market_cap"]),
-                                    "PER": safe_float(row["PER"]),
-                                    "PBR": safe_float(row["PBR"]),
-                                    "EPS": safe_float(row["EPS"]),
-                                    "BPS": safe_float(row["BPS"]),
-                                    "DIV": safe_float(row["DIV"]),
-                                    "DPS": safe_float(row["DPS"]),
-                                    "ROE": safe_float(row["ROE"]),
-                                }
-                            )
-                        except Exception as e:
-                            debug_print(f"Error processing row: {e}")
-                            continue
-
-            # 최신 재무 데이터 추출
-            name = None
-            market_type = None
-            industry = None
-            price = change = change_rate = None
-            market_cap = None
-            shares_outstanding = None
-
-            eps = None
-            bps = None
-            div = None
-            dps = None
-            roe = None
-
-            valuation = {
-                "pe_annual": None,
-                "pe_ttm": None,
-                "forward_pe": None,
-                "ps_ttm": None,
-                "pb": None,
-                "pcf_ttm": None,
-                "pfcf_ttm": None,
-            }
+                    history_data, latest = report_history(symbol_history, start, end, interval)
+
+            # 2) 실시간 지수 정보와 함께 응답 생성
+            resp = build_report(
+                symbol,
+                latest_row,
+                latest,
+                history_data,
+                explanation=profile_explanation(profile_df, symbol),
+                indices_snippet=get_indices_snippet(),
+            )
+            return ok(resp)
 
-            dividend = {"payout_ratio": None, "yield": None, "latest_exdate": None}
+        except Exception as e:
+            debug_print(e)
+            import traceback
 
-            if latest_data is not None and len(latest_data) > 0:
-                row = latest_data.iloc[0]
+            debug_print(traceback.format_exc())
+            return degraded(str(e), source="cache")
 
-                name = str(row["name"]) if "name" in row and row["name"] is not None else None
-                market_type = (
-                    str(row["market"]) if "market" in row and row["market"] is not None else None
-                )
-                industry = (
-                    str(row["industry"])
-                    if "industry" in row and row["industry"] is not None
-                    else None
+    @swagger_auto_schema(
+        operation_description="Get stock reports for multiple symbols in one request (shared indices snippet)",
+        manual_parameters=[
+            openapi.Parameter(
+                "symbols",
+                openapi.IN_QUERY,
+                description=f"Comma-separated ticker codes (e.g., 005930,000660, max {REPORTS_BATCH_MAX})",
+                type=openapi.TYPE_STRING,
+                required=True,
+            ),
+            openapi.Parameter(
+                "fields",
+                openapi.IN_QUERY,
+                description=f"Comma-separated report fields to include (default: all): {', '.join(REPORT_FIELDS)}",
+                type=openapi.TYPE_STRING,
+                required=False,
+            ),
+            *HISTORY_PARAMETERS,
+        ],
+        responses={
+            200: ReportBatchResponseSerializer(),
+            400: openapi.Response(
+                description="Missing/too many symbols, unknown fields or invalid start/end/interval"
+            ),
+        },
+    )
+    @action(detail=False, methods=["get"])
+    @data_etag(extra=_indices_etag)
+    @default_error_handler
+    def get_reports_batch(self, request: HttpRequest):
+        symbols = [s.strip() for s in request.GET.get("symbols", "").split(",") if s.strip()]
+        symbols = list(dict.fromkeys(symbols))
+        if not symbols:
+            return FastJsonResponse({"message": "SYMBOLS REQUIRED"}, status=400)
+        if len(symbols) > REPORTS_BATCH_MAX:
+            return FastJsonResponse(
+                {"message": f"TOO MANY SYMBOLS (max {REPORTS_BATCH_MAX})"}, status=400
+            )
+
+        fields = None
+        if request.GET.get("fields"):
+            fields = [f.strip() for f in request.GET["fields"].split(",") if f.strip()]
+            unknown = [f for f in fields if f != "ticker" and f not in REPORT_FIELDS]
+            if unknown:
+                return FastJsonResponse(
+                    {"message": f"UNKNOWN FIELDS: {', '.join(unknown)}"}, status=400
                 )
 
-                price = safe_float(row.get("close"))
-                change = safe_float(row.get("change"))
-                change_rate = safe_float(row.get("change_rate"))
-
-                market_cap = safe_int(row.get("market_cap"))
-
-                eps = safe_float(row.get("EPS"))
-                bps = safe_float(row.get("BPS"))
-                div = safe_float(row.get("DIV"))
-                dps = safe_float(row.get("DPS"))
-                roe = safe_float(row.get("ROE"))
-
-                if market_cap and price and price > 0:
-                    shares_outstanding = int(market_cap / price)
-
-                per_val = safe_float(row.get("PER"))
-                pbr_val = safe_float(row.get("PBR"))
-
-                if per_val is not None:
-                    valuation["pe_annual"] = per_val
-                    valuation["pe_ttm"] = per_val
-                if pbr_val is not None:
-                    valuation["pb"] = pbr_val
-
-                if div is not None:
-                    dividend["yield"] = round(div, 2)
-
-            # 3) 실시간 지수 정보 가져오기
-            indices_snippet = None
-            if INDICES_SOURCE == "s3":
-                try:
-                    s3 = FinanceBucket()
-                    response = s3.get_list_v2(S3_PREFIX_INDICES)
-
-                    if "Contents" in response:
-                        files = sorted(
-                            response["Contents"], key=lambda x: x["LastModified"], reverse=True
-                        )
-
-                        kospi_file = None
-                        kosdaq_file = None
-
-                        for f in files:
-                            if "KOSPI.json" in f["Key"] and kospi_file is None:
-                                kospi_file = f
-                            if "KOSDAQ.json" in f["Key"] and kosdaq_file is None:
-                                kosdaq_file = f
-                            if kospi_file and kosdaq_file:
-                                break
-
-                        indices_snippet = {}
-
-                        if kospi_file:
-                            data = s3.get_json(kospi_file["Key"])
-                            indices_snippet["kospi"] = {
-                                "value": round(data.get("close", 0), 2),
-                                "changePct": round(data.get("change_percent", 0), 2),
-                            }
-
-                        if kosdaq_file:
-                            data = s3.get_json(kosdaq_file["Key"])
-                            indices_snippet["kosdaq"] = {
-                                "value": round(data.get("close", 0), 2),
-                                "changePct": round(data.get("change_percent", 0), 2),
-                            }
-                except Exception as e:
-                    debug_print(f"Error fetching indices: {e}")
-                    indices_snippet = MOCK_INDICES if INDICES_SOURCE != "s3" else None
+        try:
+            start, end, interval = parse_history_params(request)
+        except ValueError as e:
+            return FastJsonResponse({"message": str(e)}, status=400)
+        full_history = start is None and end is None and interval == "daily"
+
+        try:
+            profile_df, instant_df, ticker_index = store.get_many(
+                ["profile_df", "instant_df", "ticker_index"]
+            )
+            if instant_df is None:
+                return degraded("Instant data not loaded in cache", source="cache")
+
+            # 모든 종목 이력을 한 번에 슬라이스 → 직렬화도 한 번
+            combined, spans = instant_data.get_tickers_history(instant_df, symbols, ticker_index)
+            last_rows = [end - 1 for _, end in spans.values()]
+
+            include_history = fields is None or "history" in fields
+
+            if include_history and full_history:
+                history_all = serialize_history(combined)
+                latest_all = [history_all[i] for i in last_rows]
             else:
-                indices_snippet = MOCK_INDICES
-
-            resp = {
-                "ticker": symbol,
-                "name": name,
-                "market": market_type,
-                "industry": industry,
-                "price": (
-                    {"current": price, "change": change, "change_rate": change_rate}
-                    if price is not None
-                    else None
-                ),
-                "current": {
-                    "price": price,
-                    "change": change,
-                    "change_rate": change_rate,
-                    "market_cap": market_cap,
-                    "shares_outstanding": shares_outstanding,
-                    "date": ts_price,
-                },
-                "valuation": valuation,
-                "dividend": dividend,
-                "financials": {"eps": eps, "bps": bps, "dps": dps, "roe": roe, "div": div},
-                "history": history_data,
-                "profile": {"symbol": symbol, "explanation": explanation} if explanation else None,
-                "indicesSnippet": indices_snippet,
-                "articles": [],
-                "asOf": ts_price or iso_now(),
-                "source": "cache",
-            }
+                history_all = None
+                latest_all = serialize_history(combined.iloc[last_rows])
 
-            return ok(resp)
+            items = []
+            for (symbol, (lo, hi)), latest in zip(spans.items(), latest_all):
+                if history_all is not None:
+                    history_data = history_all[lo:hi]
+                elif include_history:
+                    # 구간/해상도 지정 시 종목별 집계
+                    window = instant_data.history_window(combined.iloc[lo:hi], start, end, interval)
+                    history_data = serialize_history(window)
+                else:
+                    history_data = None
+
+                report = build_report(
+                    symbol,
+                    combined.iloc[hi - 1],
+                    latest,
+                    history_data,
+                    explanation=profile_explanation(profile_df, symbol),
+                )
+                del report["indicesSnippet"]  # 응답 최상위에서 공유
+                if fields is not None:
+                    report = {key: report[key] for key in dict.fromkeys(["ticker", *fields])}
+                items.append(report)
+
+            as_of = max((latest["date"] for latest in latest_all), default=None)
+
+            return ok(
+                {
+                    "items": items,
+                    "missing": [s for s in symbols if s not in spans],
+                    "indicesSnippet": get_indices_snippet(),
+                    "asOf": as_of or iso_now(),
+                    "source": "cache",
+                }
+            )
 
         except Exception as e:
             debug_print(e)
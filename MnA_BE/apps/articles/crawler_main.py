@@ -7,6 +7,8 @@ from bs4 import BeautifulSoup
 import re
 import boto3
 from botocore.exceptions import ClientError
+# 실행: MnA_BE 에서 python -m apps.articles.crawler_main (또는 manage.py crawler_articles)
+from S3.base import put_latest_manifest
 
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -341,6 +343,11 @@ def upload_to_s3(local_file_path, date_obj):
             local_file_path, S3_BUCKET_NAME, s3_key, ExtraArgs={"ContentType": "application/json"}
         )
         print(f"[S3] ✓ Upload successful!")
+        try:
+            put_latest_manifest(s3_client, S3_BUCKET_NAME, s3_key, "news-articles")
+        except Exception as e:
+            # manifest가 없어도 서버는 파티션 탐색으로 최신 객체를 찾음
+            print(f"[S3] ✗ Manifest update failed: {e}")
         return True
     except ClientError as e:
         print(f"[S3] ✗ Upload failed: {e}")
@@ -6,13 +6,15 @@ import os, json, datetime, hashlib, typing as t
 import boto3
 from botocore.exceptions import BotoCoreError, ClientError
 
+from S3 import get_client
+
 LOCAL_BASE = os.getenv("ARTICLES_LOCAL_BASE", "articles")
 BUCKET = os.getenv("ARTICLES_S3_BUCKET", "swpp-12-bucket")
 REGION = os.getenv("ARTICLES_S3_REGION", "ap-northeast-2")
 PREFIX = os.getenv("ARTICLES_S3_PREFIX", "news-articles")
 
-# S3 클라이언트를 모듈 레벨로 (모킹 가능)
-s3 = boto3.client("s3", region_name=REGION)
+# S3 클라이언트를 모듈 레벨로 (모킹 가능), 프로세스 공용 클라이언트 사용
+s3 = get_client(region=REGION)
 
 
 def _yyyymmdd(d: datetime.date) -> str:
@@ -1,5 +1,6 @@
 # apps/articles/views.py
-from django.http import JsonResponse, HttpResponseBadRequest
+from django.http import HttpResponseBadRequest
+from utils.fast_json import FastJsonResponse
 from rest_framework import viewsets, serializers
 from rest_framework.decorators import action
 from drf_yasg.utils import swagger_auto_schema
@@ -67,7 +68,7 @@ class ArticleView(viewsets.ViewSet):
     @default_error_handler
     def get(self, request):
         data = list_articles(None)
-        return JsonResponse({"data": data}, status=200)
+        return FastJsonResponse({"data": data}, status=200)
 
     @swagger_auto_schema(
         operation_description="Get financial news articles for a specific date",
@@ -92,7 +93,7 @@ class ArticleView(viewsets.ViewSet):
             data = list_articles(date)
         except ValueError:
             return HttpResponseBadRequest("Invalid date format, expected YYYY-MM-DD")
-        return JsonResponse({"date": date, "data": data}, status=200)
+        return FastJsonResponse({"date": date, "data": data}, status=200)
 
     @swagger_auto_schema(
         operation_description="Get detailed article by ID with optional date filter",
@@ -119,5 +120,5 @@ class ArticleView(viewsets.ViewSet):
         date = request.GET.get("date")
         doc = get_article_by_id(id, date)
         if not doc:
-            return JsonResponse({"message": "Not found"}, status=404)
-        return JsonResponse(doc, status=200)
+            return FastJsonResponse({"message": "Not found"}, status=404)
+        return FastJsonResponse(doc, status=200)
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class UserConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.user"
+
+    def ready(self):
+        # User/Style 저장 시 require_auth 사용자 캐시 무효화 (signal 등록)
+        from utils import user_cache  # noqa: F401
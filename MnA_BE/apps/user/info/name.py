@@ -73,7 +73,7 @@ class NameView(viewsets.ViewSet):
 
         try:
             user.name = name
-            user.save()
+            user.save(update_fields=["name"])
         except IntegrityError:
             return JsonResponse({"message": "NAME ALREADY EXISTS"}, status=409)
         except Exception as e:
@@ -60,7 +60,7 @@ class PasswordView(viewsets.ViewSet):
 
         try:
             user.password = hashed
-            user.save()
+            user.save(update_fields=["password"])
         except Exception as e:
             return JsonResponse({"message": "PASSWORD SAVE FAILED"}, status=500)
 
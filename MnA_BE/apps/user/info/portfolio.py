@@ -69,7 +69,7 @@ class PortfolioView(viewsets.ViewSet):
 
         try:
             user.portfolio = portfolio
-            user.save()
+            user.save(update_fields=["portfolio"])
         except Exception as e:
             return JsonResponse({"message": "PORTFOLIO SAVE FAILED"}, status=500)
 
@@ -5,6 +5,7 @@ from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from decorators import *
 from apps.user.models import Style
+from utils.user_cache import latest_style
 import json
 
 
@@ -53,7 +54,7 @@ class StyleView(viewsets.ViewSet):
     @require_auth
     def get(self, request, user):
         try:
-            style_row = user.style_set.all()[0]
+            style_row = latest_style(user)
 
             # filtering style columns
             style = {
@@ -1,2 +1,3 @@
 from .default_error_handler import default_error_handler
-from .require_auth import require_auth
\ No newline at end of file
+from .require_auth import require_auth
+from .data_etag import data_etag
\ No newline at end of file
@@ -0,0 +1,70 @@
+from django.http import HttpResponseNotModified
+from django.utils.http import http_date, parse_etags
+from utils import instant_data
+from datetime import datetime
+import hashlib, json
+
+def data_etag(function=None, *, extra=None, private=False):
+    """
+    This decorator attaches a data-version ETag / Last-Modified to GET responses,
+    and returns 304 Not Modified for a matching If-None-Match without calling the view.
+
+    - ETag = hash(data version id, path, query params, extra(request, **kwargs))
+    - extra: additional version source not covered by the data version (e.g. indices snapshot)
+             returning None disables the ETag for that request
+    - private: responses depend on the user (Cache-Control: private)
+    - no ETag when data is not loaded yet, or the response is not 200 / degraded
+    """
+    def decorate(view):
+        def wrapper(*args, **kwargs):
+            request = args[1]
+            etag = None
+
+            version = instant_data.get_data_version()
+            extra_version = extra(request, **kwargs) if extra and version else None
+            if version and (extra is None or extra_version is not None):
+                etag = make_etag(version["id"], request, extra_version)
+
+            if etag and request.method == "GET" and _matches(request, etag):
+                return _with_cache_headers(HttpResponseNotModified(), etag, version, private)
+
+            response = view(*args, **kwargs)
+
+            if etag and response.status_code == 200 and not getattr(response, "degraded", False):
+                _with_cache_headers(response, etag, version, private)
+            return response
+
+        return wrapper
+
+    return decorate(function) if function else decorate
+
+
+def make_etag(version_id: str, request, extra_version=None) -> str:
+    # weak ETag: the body may differ only in asOf(generation time)
+    key = json.dumps(
+        [version_id, request.path, sorted(request.GET.lists()), extra_version], default=str
+    )
+    return f'W/"{hashlib.sha1(key.encode("utf-8")).hexdigest()[:20]}"'
+
+
+def _matches(request, etag: str) -> bool:
+    header = request.META.get("HTTP_IF_NONE_MATCH")
+    if not header:
+        return False
+
+    etags = parse_etags(header)
+    if "*" in etags:
+        return True
+    # weak comparison (RFC 9110 13.1.2)
+    return etag.removeprefix("W/") in (e.removeprefix("W/") for e in etags)
+
+
+def _with_cache_headers(response, etag: str, version: dict, private: bool):
+    response["ETag"] = etag
+    response["Cache-Control"] = "private, no-cache" if private else "no-cache"
+    try:
+        loaded_at = datetime.fromisoformat(version["loaded_at"])
+        response["Last-Modified"] = http_date(loaded_at.timestamp())
+    except (KeyError, TypeError, ValueError):
+        pass
+    return response
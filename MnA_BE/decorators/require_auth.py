@@ -1,8 +1,15 @@
 from django.http import JsonResponse
 from apps.user.models import User
 from utils.token_handler import *
+from utils import user_cache
 import jwt
 
+
+def load_user(user_id):
+    """사용자 + 최신 Style (prefetch)"""
+    return User.objects.prefetch_related(user_cache.LATEST_STYLE).get(id=user_id)
+
+
 def require_auth(function):
     """
     This decorator ensure that user is authorized (and existence of user),
@@ -22,7 +29,7 @@ def require_auth(function):
 
         # check access token
         try:
-            user_id = decode_token(access_token).get("id")
+            user_id = decode_access_token(access_token).get("id")
         except jwt.ExpiredSignatureError:
             # access token expired case
             # check refresh token
@@ -39,7 +46,11 @@ def require_auth(function):
                 return JsonResponse({ "message": "TOKEN EXPIRED" }, status=401)
 
         try:
-            user = User.objects.get(id=user_id)
+            if refresh_flag:
+                # refresh token은 항상 DB 값과 비교 (다른 worker의 캐시는 이전 token일 수 있음)
+                user = load_user(user_id)
+            else:
+                user = user_cache.get_user(user_id, load_user)
         except Exception as e:
             return JsonResponse({"message": "UNEXPECTED ERROR (USER NOT FOUND)"}, status=500)
         kwargs["user"] = user
@@ -48,7 +59,7 @@ def require_auth(function):
         if refresh_flag and user.refresh_token != refresh_token:
             try:
                 user.refresh_token = ""
-                user.save()
+                user.save(update_fields=["refresh_token"])
             except:
                 return JsonResponse({ "message": "UNEXPECTED ERROR" }, status=500)
             print("*** DUPLICATED REFRESH TOKEN DETECTED ***")
@@ -62,7 +73,7 @@ def require_auth(function):
             try:
                 new_refresh_token = rotate_refresh_token(refresh_token)
                 user.refresh_token = new_refresh_token
-                user.save()
+                user.save(update_fields=["refresh_token"])
                 set_cookie(response, "refresh_token", new_refresh_token)
                 set_cookie(response, "access_token", make_access_token(user_id))
             except:
@@ -96,9 +96,16 @@ class RequireAuthTests(TestCase):
             'REFRESH_TOKEN_EXPIRE_DAYS': '7'
         })
         self.env_patcher.start()
+
+        from utils import user_cache, token_handler
+        user_cache.clear()
+        token_handler.load_keys()
     
     def tearDown(self):
         self.env_patcher.stop()
+
+        from utils import token_handler
+        token_handler.load_keys()
     
     def test_require_auth_no_access_token(self):
         """access_token이 없을 때"""
@@ -130,7 +137,7 @@ class RequireAuthTests(TestCase):
         # Mock User
         mock_user = MagicMock()
         mock_user.id = 123
-        mock_user_model.objects.get.return_value = mock_user
+        mock_user_model.objects.prefetch_related.return_value.get.return_value = mock_user
         
         @require_auth
         def test_view(self, request, **kwargs):
@@ -190,7 +197,7 @@ class RequireAuthTests(TestCase):
         mock_user.id = 123
         refresh_token = make_refresh_token(123)
         mock_user.refresh_token = refresh_token
-        mock_user_model.objects.get.return_value = mock_user
+        mock_user_model.objects.prefetch_related.return_value.get.return_value = mock_user
         
         @require_auth
         def test_view(self, request, **kwargs):
@@ -263,7 +270,7 @@ class RequireAuthTests(TestCase):
         from utils.token_handler import make_access_token
         
         # User.objects.get이 DoesNotExist 예외 발생
-        mock_user_model.objects.get.side_effect = Exception("User not found")
+        mock_user_model.objects.prefetch_related.return_value.get.side_effect = Exception("User not found")
         
         @require_auth
         def test_view(self, request, **kwargs):
@@ -293,7 +300,7 @@ class RequireAuthTests(TestCase):
         mock_user = MagicMock()
         mock_user.id = 123
         mock_user.refresh_token = "different_token"  # DB의 토큰과 다름
-        mock_user_model.objects.get.return_value = mock_user
+        mock_user_model.objects.prefetch_related.return_value.get.return_value = mock_user
         
         @require_auth
         def test_view(self, request, **kwargs):
@@ -340,7 +347,7 @@ class RequireAuthTests(TestCase):
         mock_user.id = 123
         mock_user.refresh_token = "different_token"
         mock_user.save.side_effect = Exception("Save failed")
-        mock_user_model.objects.get.return_value = mock_user
+        mock_user_model.objects.prefetch_related.return_value.get.return_value = mock_user
         
         @require_auth
         def test_view(self, request, **kwargs):
@@ -381,7 +388,7 @@ class RequireAuthTests(TestCase):
         mock_user.id = 123
         refresh_token = make_refresh_token(123)
         mock_user.refresh_token = refresh_token
-        mock_user_model.objects.get.return_value = mock_user
+        mock_user_model.objects.prefetch_related.return_value.get.return_value = mock_user
         
         # rotate_refresh_token이 예외 발생
         mock_rotate.side_effect = Exception("Rotation failed")
@@ -421,7 +428,7 @@ class RequireAuthTests(TestCase):
         mock_user = MagicMock()
         mock_user.id = 456
         mock_user.name = "Test User"
-        mock_user_model.objects.get.return_value = mock_user
+        mock_user_model.objects.prefetch_related.return_value.get.return_value = mock_user
         
         received_user = None
         
@@ -442,4 +449,99 @@ class RequireAuthTests(TestCase):
         
         self.assertIsNotNone(received_user)
         self.assertEqual(received_user.id, 456)
-        self.assertEqual(received_user.name, "Test User")
\ No newline at end of file
+        self.assertEqual(received_user.name, "Test User")
+
+class DataEtagTests(TestCase):
+    """decorators/data_etag.py 테스트"""
+
+    VERSION = {"id": "v1", "sources": {}, "loaded_at": "2025-11-20T16:10:00"}
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.calls = 0
+
+    def make_view(self, **options):
+        from decorators.data_etag import data_etag
+
+        @data_etag(**options)
+        def test_view(self, request, **kwargs):
+            test.calls += 1
+            return JsonResponse({"status": "ok"})
+
+        test = self
+        return test_view
+
+    def get(self, view, path="/api/reports/005930", version=VERSION, **headers):
+        with patch("decorators.data_etag.instant_data.get_data_version", return_value=version):
+            return view(None, self.factory.get(path, **headers))
+
+    def test_sets_etag_and_last_modified(self):
+        """200 응답에 ETag / Last-Modified / Cache-Control"""
+        response = self.get(self.make_view())
+
+        self.assertTrue(response["ETag"].startswith('W/"'))
+        self.assertIn("Last-Modified", response)
+        self.assertEqual(response["Cache-Control"], "no-cache")
+
+    def test_if_none_match_returns_304_without_calling_view(self):
+        """같은 ETag면 본문을 만들지 않고 304"""
+        view = self.make_view()
+        etag = self.get(view)["ETag"]
+
+        response = self.get(view, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(self.calls, 1)
+
+    def test_etag_changes_with_version_and_query(self):
+        """데이터 버전, query params가 다르면 ETag도 다름"""
+        view = self.make_view()
+        etag = self.get(view)["ETag"]
+
+        self.assertEqual(self.get(view, path="/api/reports/005930")["ETag"], etag)
+        self.assertNotEqual(self.get(view, path="/api/reports/005930?limit=5")["ETag"], etag)
+        self.assertNotEqual(
+            self.get(view, version={**self.VERSION, "id": "v2"})["ETag"], etag
+        )
+        # 이전 버전 ETag로 요청하면 새 본문
+        response = self.get(view, version={**self.VERSION, "id": "v2"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_no_etag_without_data_version(self):
+        """데이터가 로드되기 전에는 ETag 없음"""
+        response = self.get(self.make_view(), version=None, HTTP_IF_NONE_MATCH="*")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response)
+
+    def test_no_etag_for_degraded_or_error(self):
+        """degraded / 200이 아닌 응답에는 ETag를 붙이지 않음"""
+        from decorators.data_etag import data_etag
+        from utils.for_api import degraded
+
+        @data_etag
+        def degraded_view(self, request):
+            return degraded("S3 down")
+
+        @data_etag
+        def error_view(self, request):
+            return JsonResponse({"message": "error"}, status=500)
+
+        self.assertNotIn("ETag", self.get(degraded_view))
+        self.assertNotIn("ETag", self.get(error_view))
+
+    def test_extra_version(self):
+        """extra가 바뀌면 ETag 변경, None이면 ETag 없음 / private"""
+        extra = {"value": "a"}
+        view = self.make_view(extra=lambda request, **kwargs: extra["value"], private=True)
+
+        first = self.get(view)
+        extra["value"] = "b"
+        second = self.get(view)
+        extra["value"] = None
+        third = self.get(view)
+
+        self.assertNotEqual(first["ETag"], second["ETag"])
+        self.assertEqual(first["Cache-Control"], "private, no-cache")
+        self.assertNotIn("ETag", third)
@@ -21,6 +21,10 @@ import json
 import time
 import sys
 
+# MnA_BE/S3 의 manifest 기록 함수 공유 (서버와 같은 형식)
+# 실행: MnA_BE 에서 python -m llm_caller.llm_caller3
+from S3.base import put_latest_manifest
+
 # functions for get trading day
 
 def is_trading_day_krx():
@@ -162,7 +166,7 @@ def get_stock_info_df(date):
     kosdaq_profile_path = f"s3://swpp-12-bucket/company-profile/year={year}/month={month}/market=kosdaq/{first_month_td}.parquet"
 
     all_info = pd.read_parquet(path, engine="pyarrow")
-    all_info['ROE'] = round(all_info['ROE'].astype(float), 4).astype(str)
+    all_info['ROE'] = pd.to_numeric(all_info['ROE'], errors='coerce').round(4)
     all_info['date'] = all_info['date'].astype(str)
     kospi_profile = pd.read_parquet(kospi_profile_path, engine="pyarrow")
     kosdaq_profile = pd.read_parquet(kosdaq_profile_path, engine="pyarrow")
@@ -369,6 +373,11 @@ def save_s3(date, content, data):
         ContentType='application/json'
     )
     print(f"[S3] Uploaded to s3://{bucket}/{key}")
+    try:
+        # llm_output/ 아래는 다른 producer도 올리므로 자기 prefix에만 기록
+        put_latest_manifest(s3, bucket, key, f"llm_output/{content}")
+    except Exception as e:
+        print(f"[S3] Manifest update failed: {e}")
     return 0
 
 ###############
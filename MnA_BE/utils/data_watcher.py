@@ -0,0 +1,154 @@
+"""
+백그라운드 데이터 watcher
+- KRX 장 마감(15:30 KST) 이후 평일 구간에는 짧은 주기로, 그 외에는 긴 주기로 S3 확인
+- 새 daily partition / company-profile / llm_output 이 올라오면 instant_data.reload()
+  (요청 처리와 별도 스레드에서 새 버전을 만들고 store에 한 번에 교체)
+- 같은 store를 쓰는 worker 중 lock을 잡은 하나만 확인 (나머지는 store registry로 새 버전을 봄)
+"""
+from datetime import datetime, time as dtime, timedelta
+from zoneinfo import ZoneInfo
+from utils.debug_print import debug_print
+from utils.store import store
+from utils import instant_data, llm_picks
+from S3.finance import FinanceBucket
+import os, threading
+
+try:
+    import fcntl
+except ImportError:  # Windows (개발 환경): 단일 프로세스로 간주
+    fcntl = None
+
+KST = ZoneInfo("Asia/Seoul")
+
+WATCHER_ENABLED = os.getenv("DATA_WATCHER_ENABLED", "true").lower() == "true"
+# 장 마감 후 확인 구간 (KST, 평일) — crawler/llm_caller 업로드 시간대
+WINDOW_START = dtime.fromisoformat(os.getenv("DATA_WATCHER_WINDOW_START", "15:40"))
+WINDOW_END = dtime.fromisoformat(os.getenv("DATA_WATCHER_WINDOW_END", "23:59"))
+# 구간 안 확인 주기 / 구간 밖 확인 주기 (profile, llm_output이 늦게 올라오는 경우)
+INTERVAL_SECONDS = int(os.getenv("DATA_WATCHER_INTERVAL_SECONDS", 600))
+IDLE_SECONDS = int(os.getenv("DATA_WATCHER_IDLE_SECONDS", 3600))
+
+_thread = None
+_stop = threading.Event()
+_leader_file = None
+
+
+def in_window(now: datetime) -> bool:
+    now = now.astimezone(KST)
+    return now.weekday() < 5 and WINDOW_START <= now.time() < WINDOW_END
+
+
+def next_check(now: datetime) -> datetime:
+    """
+    다음 확인 시각 (KST)
+    - 구간 안: now + INTERVAL_SECONDS
+    - 구간 밖: 다음 평일 구간 시작과 now + IDLE_SECONDS 중 빠른 쪽
+    """
+    now = now.astimezone(KST)
+    if in_window(now):
+        return now + timedelta(seconds=INTERVAL_SECONDS)
+
+    idle = now + timedelta(seconds=IDLE_SECONDS)
+    for offset in range(8):
+        day = (now + timedelta(days=offset)).date()
+        start = datetime.combine(day, WINDOW_START, tzinfo=KST)
+        if day.weekday() < 5 and start > now:
+            return min(start, idle)
+    return idle
+
+
+def pending_changes(s3) -> set:
+    """
+    서비스 중인 데이터 버전 이후 S3에 새로 올라온 원본
+    {"instant", "profile", "llm_output"} 의 부분집합
+    조회에 실패한 원본은 알 수 없으므로 이번 확인에서 제외 (S3 장애 중 매번 reload하지 않음)
+    """
+    version = instant_data.get_data_version()
+    instant_df = store.get_data("instant_df")
+    if version is None or instant_df is None:
+        return {"instant", "profile", "llm_output"}
+
+    sources = version["sources"]
+    checks = {
+        "instant": lambda: bool(instant_data.find_new_partitions(s3, instant_df["date"].max())),
+        "profile": lambda: instant_data._latest_profile_keys(s3) != sources.get("profile"),
+        "llm_output": lambda: (
+            instant_data.llm_output_version(s3, strict=True) != sources.get("llm_output")
+        ),
+    }
+
+    changes = set()
+    for source, changed in checks.items():
+        try:
+            if changed():
+                changes.add(source)
+        except Exception as e:
+            debug_print(f"✗ Data watcher: {source} check failed, skipped: {e}")
+    return changes
+
+
+def check_once():
+    """
+    새 원본이 있으면 reload (delta + 변경된 profile만, 데이터 버전 갱신)
+    반환: 감지한 변경 (없으면 빈 set)
+    """
+    changes = pending_changes(FinanceBucket())
+    if changes:
+        debug_print(f"Data watcher: new {', '.join(sorted(changes))} → reload")
+        instant_data.reload()
+    if "llm_output" in changes:
+        # 추천 목록도 TTL을 기다리지 않고 새 파일을 미리 로드
+        llm_picks.refresh()
+    return changes
+
+
+def _acquire_leader() -> bool:
+    """
+    store를 공유하는 worker 중 하나만 S3 확인 (non-blocking flock, 프로세스 종료 시 해제)
+    리더가 종료되면 다른 worker가 다음 확인 때 이어받음
+    """
+    global _leader_file
+    if _leader_file is not None or fcntl is None:
+        return True
+
+    lock_file = open(f"{store.registry_path}.watcher.lock", "a")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return False
+
+    _leader_file = lock_file
+    return True
+
+
+def _run():
+    while True:
+        now = datetime.now(KST)
+        wait = (next_check(now) - now).total_seconds()
+        if _stop.wait(max(wait, 0)):
+            return
+
+        if not _acquire_leader():
+            continue
+        try:
+            check_once()
+        except Exception as e:
+            debug_print(f"✗ Data watcher check failed: {e}")
+
+
+def start():
+    """watcher 스레드 시작 (DATA_WATCHER_ENABLED=false 이거나 이미 실행 중이면 무시)"""
+    global _thread
+    if not WATCHER_ENABLED or (_thread is not None and _thread.is_alive()):
+        return _thread
+
+    _stop.clear()
+    _thread = threading.Thread(target=_run, name="data-watcher", daemon=True)
+    _thread.start()
+    debug_print(f"✓ Data watcher started (window {WINDOW_START}~{WINDOW_END} KST)")
+    return _thread
+
+
+def stop():
+    _stop.set()
@@ -0,0 +1,82 @@
+"""
+빠른 JSON 직렬화
+- orjson이 설치돼 있으면 사용, 없으면 표준 json으로 폴백
+- NumPy 스칼라/배열, pandas Timestamp, datetime 직렬화
+- NaN / Infinity / pd.NA → null (표준 JSON에는 NaN이 없음)
+"""
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse, JsonResponse
+import datetime as _dt
+import json, math
+
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+ORJSON_OPTIONS = (
+    orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z if orjson else 0
+)
+
+
+def _default(value):
+    """두 인코더가 기본으로 처리하지 못하는 타입"""
+    if isinstance(value, np.generic):
+        value = value.item()
+        if isinstance(value, float) and not math.isfinite(value):
+            return None
+        return value
+    if isinstance(value, np.ndarray):
+        return _finite(value.tolist())
+    if isinstance(value, pd.Timestamp):
+        return None if pd.isna(value) else value.isoformat()
+    if value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return DjangoJSONEncoder().default(value)
+
+
+def _finite(value):
+    """NaN/Infinity → None (표준 json 폴백용)"""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _finite(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(v) for v in value]
+    return value
+
+
+def _dumps_stdlib(data) -> bytes:
+    try:
+        text = json.dumps(data, default=_default, ensure_ascii=False, allow_nan=False)
+    except ValueError:
+        # NaN/Infinity가 있을 때만 한 번 더 순회
+        text = json.dumps(_finite(data), default=_default, ensure_ascii=False, allow_nan=False)
+    return text.encode("utf-8")
+
+
+def dumps(data) -> bytes:
+    """UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data, default=_default, option=ORJSON_OPTIONS)
+    return _dumps_stdlib(data)
+
+
+class FastJsonResponse(JsonResponse):
+    """
+    JsonResponse와 같은 인터페이스, 직렬화만 dumps() 사용
+    (json_dumps_params/encoder 인자는 받지 않음)
+    """
+
+    def __init__(self, data, safe=True, **kwargs):
+        if safe and not isinstance(data, dict):
+            raise TypeError(
+                "In order to allow non-dict objects to be serialized set the safe parameter to False."
+            )
+        kwargs.setdefault("content_type", "application/json")
+        HttpResponse.__init__(self, content=dumps(data), **kwargs)
@@ -1,5 +1,5 @@
 import pytz, datetime as _dt
-from django.http import JsonResponse
+from utils.fast_json import FastJsonResponse
 from utils.time import iso_now
 import re
 
@@ -28,7 +28,10 @@ def ok(payload: dict, status=200, **meta):
         payload["asOf"] = iso_now()
     if meta:
         payload.update(meta)
-    return JsonResponse(payload, status=status, json_dumps_params={"ensure_ascii": False})
+    return FastJsonResponse(payload, status=status)
 
 def degraded(msg: str, source="s3", status=200, **extra):
-    return ok({"degraded": True, "error": str(msg)[:200], "source": source}, status=status, **extra)
\ No newline at end of file
+    response = ok({"degraded": True, "error": str(msg)[:200], "source": source}, status=status, **extra)
+    # 일시적인 대체 응답 → ETag를 붙이지 않음 (decorators/data_etag.py)
+    response.degraded = True
+    return response
\ No newline at end of file
@@ -1,15 +1,148 @@
 from S3.finance import FinanceBucket
 from django.http import JsonResponse
-import json
+from utils.debug_print import debug_print
+import json, os, threading, time
+
+# 최신 객체(key, ETag) 재확인 주기
+OVERVIEW_TTL_SECONDS = int(os.getenv("LLM_OVERVIEW_TTL_SECONDS", 60))
+
+# sector → { "version": (key, etag) | None, "raw": dict, "items": dict, "checked_at": float }
+# (version None: 객체 없음, TTL 동안 다시 조회하지 않음)
+_overview_cache = {}
+_overview_lock = threading.Lock()
+# sector별 첫 로드 lock / 백그라운드 재확인 중인 sector
+_sector_locks = {}
+_refreshing = set()
+
+
+def _decode_items(llm_output):
+    """ticker별 JSON 문자열을 dict로 미리 변환"""
+    if not isinstance(llm_output, dict):
+        return {}
+
+    items = {}
+    for key, value in llm_output.items():
+        if isinstance(value, str):
+            try:
+                value = json.loads(value)
+            except ValueError:
+                pass
+        items[key] = value
+    return items
+
+
+def _latest_version(s3, sector):
+    """
+    최신 overview 객체의 (key, etag) 반환, 없으면 None
+    """
+    latest = s3.get_latest_object(f"llm_output/{sector}")
+    if not latest:
+        return None
+
+    year, month, day = s3.source_date(latest).split("-")
+    key = f"llm_output/{sector}/year={year}/month={month}/{year}-{month}-{day}.json"
+
+    return key, latest.get("ETag")
+
+
+def refresh(sector):
+    """
+    최신 key/ETag를 확인하고 바뀐 경우에만 다시 다운로드
+    S3 장애 / 객체가 사라진 경우 이전 값 유지 (처음이면 장애는 예외, 객체 없음은 그대로 캐시)
+    """
+    entry = _overview_cache.get(sector)
+    try:
+        s3 = FinanceBucket()
+        version = _latest_version(s3, sector)
+
+        if version is None:
+            if entry is None:
+                entry = {"version": None, "raw": None, "items": {}}
+        elif entry is None or entry["version"] != version:
+            llm_output = s3.get_json(key=version[0])
+            entry = {
+                "version": version,
+                "raw": llm_output,
+                "items": _decode_items(llm_output),
+            }
+
+    except Exception as e:
+        if entry is None:
+            raise
+        debug_print(f"LLM overview revalidation failed ({sector}): {e}")
+
+    entry["checked_at"] = time.time()
+    _overview_cache[sector] = entry
+    return entry
+
+
+def _refresh_in_background(sector):
+    with _overview_lock:
+        if sector in _refreshing:
+            return
+        _refreshing.add(sector)
+
+    def run():
+        try:
+            refresh(sector)
+        except Exception as e:
+            debug_print(f"LLM overview revalidation failed ({sector}): {e}")
+        finally:
+            with _overview_lock:
+                _refreshing.discard(sector)
+
+    threading.Thread(target=run, name=f"llm-overview-refresh-{sector}", daemon=True).start()
+
+
+def _get_entry(sector):
+    """
+    캐시된 overview 반환, 없으면 None
+    - 처음: 해당 sector만 lock을 잡고 S3에서 로드
+    - TTL이 지나면 이전 값을 반환하고 백그라운드에서 재확인 → 요청은 S3를 기다리지 않음
+    """
+    entry = _overview_cache.get(sector)
+    if entry is None:
+        with _overview_lock:
+            lock = _sector_locks.setdefault(sector, threading.Lock())
+        with lock:
+            entry = _overview_cache.get(sector) or refresh(sector)
+
+    elif time.time() - entry["checked_at"] >= OVERVIEW_TTL_SECONDS:
+        _refresh_in_background(sector)
+
+    return entry if entry["version"] is not None else None
+
 
 def get_latest_overview(sector: str):
-    s3 = FinanceBucket()
-    source = s3.check_source(prefix=f"llm_output/{sector}")
-    if not source["ok"]: return JsonResponse({"message": "No LLM output found"}, status=404)
-    year, month, day = source["latest"].split("-")
+    entry = _get_entry(sector)
+    if entry is None: return JsonResponse({"message": "No LLM output found"}, status=404)
+
+    return entry["raw"]
+
+
+def get_overview_items(sector: str) -> dict:
+    """
+    ticker → overview(dict) 매핑 (JSON 파싱 완료본)
+    """
+    entry = _get_entry(sector)
+    if entry is None: return {}
+
+    return entry["items"]
+
+
+def overview_version(sector: str):
+    """
+    현재 overview 객체 식별자 (ETag용, "key@ETag")
+    overview가 없거나 조회에 실패하면 None
+    """
+    try:
+        entry = _get_entry(sector)
+    except Exception as e:
+        debug_print(f"LLM overview version check failed ({sector}): {e}")
+        return None
+    return "@".join(str(v) for v in entry["version"]) if entry else None
 
-    llm_output = s3.get_json(
-        key=f"llm_output/{sector}/year={year}/month={month}/{year}-{month}-{day}.json"
-    )
 
-    return llm_output
\ No newline at end of file
+def clear_overview_cache():
+    with _overview_lock:
+        _overview_cache.clear()
@@ -1,181 +1,748 @@
 from django.core.cache import cache
 from utils.debug_print import debug_print
 from utils.store import store
+from utils import search_index, screener
 from S3.finance import FinanceBucket
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from utils.for_api import ok
+import numpy as np
 import pandas as pd
-import time, json
+import hashlib, os, re, threading, time, json
 
-def print_line():
-    debug_print("=" * 50)
+INSTANT_PREFIX = 'price-financial-info-instant/'
+PRICE_PREFIX = 'price-financial-info/'
+PROFILE_PREFIX = 'company-profile/'
+LLM_OUTPUT_PREFIX = 'llm_output'
 
+# price-financial-info/year=YYYY/month=M/market=kospi/YYYY-MM-DD.parquet
+DAILY_KEY = re.compile(r"market=(kospi|kosdaq)/(\d{4}-\d{2}-\d{2})\.parquet$")
 
-def init():
-    print_line()
-    debug_print("Loading instant data into Django cache...")
+# 시작 시 동시에 내려받는 S3 객체 수 (instant, profile 목록, KOSPI, KOSDAQ)
+LOAD_WORKERS = int(os.getenv("INSTANT_DATA_LOAD_WORKERS", 4))
+# delta reload로 붙일 최대 거래일 수 (넘으면 전체 instant parquet 로드)
+DELTA_MAX_DAYS = int(os.getenv("INSTANT_DATA_DELTA_MAX_DAYS", 5))
 
-    total_start = time.time()
-    s3 = FinanceBucket()
 
-    # 1) Instant 데이터 로드
-    instant_start = time.time()
-    instant_df, ts = s3.get_latest_parquet_df('price-financial-info-instant/')
-    instant_elapsed = time.time() - instant_start
+# report history 해상도 (history_window)
+HISTORY_INTERVALS = ("daily", "weekly", "monthly")
 
-    if instant_df is not None:
-        # 시가총액 기준으로 정렬
-        sort_start = time.time()
-        instant_df['market_cap_numeric'] = pd.to_numeric(instant_df['market_cap'], errors='coerce')
-        instant_df = instant_df.sort_values(
-            by=['date', 'market_cap_numeric'],
-            ascending=[True, False]
-        ).drop(columns=['market_cap_numeric'])
-        sort_elapsed = time.time() - sort_start
-
-        # Store in Shared memory
-        store.set_data('instant_df', instant_df)
-
-        debug_print(f"✓ Instant data loaded to cache: {instant_df.shape}")
-        debug_print(f"  - S3 download time: {instant_elapsed:.2f}s")
-        debug_print(f"  - Sort time: {sort_elapsed:.2f}s")
-        debug_print(f"  - Unique tickers: {instant_df['ticker'].nunique()}")
-        debug_print(f"  - Date range: {instant_df['date'].min()} ~ {instant_df['date'].max()}")
-        debug_print(f"  - Sorted by: date (asc), market_cap (desc)")
+# get_quotes 응답 필드 → 스냅샷 컬럼
+QUOTE_COLUMNS = {"price": "close", "change": "change", "change_rate": "change_rate"}
 
-    # 2) Company Profile 데이터 로드 (KOSPI + KOSDAQ 자동 검색)
-    profile_start = time.time()
+# instant_df 컬럼 스키마 (normalize_schema)
+# - 반복되는 문자열 → category (ticker ~2,700종, market 2종 등 값 종류가 적음)
+# - 가격/재무 지표 → float32 (원 단위 가격·EPS/BPS는 16,777,216 미만이라 정확히 표현)
+# - 시가총액 → int64 (float32로는 자릿수가 부족)
+CATEGORY_COLUMNS = ["ticker", "name", "market", "industry"]
+FLOAT_COLUMNS = ["close", "change", "change_rate", "PER", "PBR", "EPS", "BPS", "DIV", "DPS", "ROE"]
+INT_COLUMNS = ["market_cap"]
 
-    response = s3.get_list_v2('company-profile/')
+# 메모리 예산: 행당 약 80B
+#   category 4개(int8/int16 코드) ~7B + float32 10개 40B + int64 8B + date 8B + index ~16B
+#   2,700 종목 × 1,400 거래일(≈ 3.8M 행) 기준 ~300MB (문자열 그대로일 때 행당 ~800B, 3GB 이상)
+# 초과 시 로드 로그에 경고만 남김
+MEMORY_BUDGET_MB = int(os.getenv("INSTANT_DATA_MEMORY_BUDGET_MB", 512))
 
-    if 'Contents' in response:
-        files = sorted(response['Contents'], key=lambda x: x['LastModified'], reverse=True)
 
-        kospi_file = None
-        kosdaq_file = None
+# 수동 reload(API/명령)와 백그라운드 watcher가 같은 프로세스에서 겹치지 않도록
+_reload_lock = threading.Lock()
 
-        for f in files:
-            if 'market=kospi' in f['Key'] and kospi_file is None:
-                kospi_file = f['Key']
-            if 'market=kosdaq' in f['Key'] and kosdaq_file is None:
-                kosdaq_file = f['Key']
-            if kospi_file and kosdaq_file:
-                break
 
-        profile_kospi = None
-        profile_kosdaq = None
+class DeltaUnavailable(Exception):
+    """delta reload를 할 수 없음 → 전체 로드"""
 
-        if kospi_file:
-            profile_kospi = s3.get_dataframe(kospi_file)
-            debug_print(f"  - KOSPI profile from: {kospi_file}")
+def print_line():
+    debug_print("=" * 50)
 
-        if kosdaq_file:
-            profile_kosdaq = s3.get_dataframe(kosdaq_file)
-            debug_print(f"  - KOSDAQ profile from: {kosdaq_file}")
 
-        if profile_kosdaq is not None and profile_kospi is not None:
-            profile_df = pd.concat([profile_kosdaq, profile_kospi])
+def normalize_schema(instant_df):
+    """
+    instant_df 컬럼을 작은 dtype으로 변환 (CATEGORY/FLOAT/INT_COLUMNS 참고)
+    - 숫자로 바꿀 수 없는 값("nan", "" 등)은 NaN
+    - 시가총액에 결측이 있으면 int64 대신 float64 유지
+    """
+    for column in CATEGORY_COLUMNS:
+        if column in instant_df.columns and not isinstance(instant_df[column].dtype, pd.CategoricalDtype):
+            instant_df[column] = instant_df[column].astype("category")
+
+    for column in FLOAT_COLUMNS:
+        if column in instant_df.columns and instant_df[column].dtype != np.float32:
+            instant_df[column] = pd.to_numeric(instant_df[column], errors="coerce").astype(np.float32)
+
+    for column in INT_COLUMNS:
+        if column in instant_df.columns and instant_df[column].dtype != np.int64:
+            values = pd.to_numeric(instant_df[column], errors="coerce")
+            instant_df[column] = values.astype(np.int64) if values.notna().all() else values.astype(np.float64)
+
+    return instant_df
+
+
+def memory_mb(instant_df) -> float:
+    return instant_df.memory_usage(deep=True).sum() / 1024 ** 2
+
+
+def float64_values(values: pd.Series) -> np.ndarray:
+    """
+    숫자 컬럼 → float64 배열 (숫자가 아닌 값은 NaN)
+    float32는 float64로 넓힌 뒤 유효숫자 7자리로 반올림 (1.23이 1.2300000190734863으로 보이지 않도록)
+    - float32 오차(상대 2^-24)는 7자리 반올림 단위의 절반보다 작아 원래 10진 값(유효숫자 7자리 이하)이 복원됨
+    - 1e7 이상은 float32에서 정수로 정확히 표현되므로 그대로
+    """
+    if values.dtype != np.float32:
+        return pd.to_numeric(values, errors="coerce").to_numpy(dtype=np.float64)
+
+    wide = values.to_numpy().astype(np.float64)
+    magnitude = np.abs(wide)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        scale = 10.0 ** (6 - np.floor(np.log10(magnitude)))
+        rounded = np.round(wide * scale) / scale
+    exact = (magnitude >= 1e7) | (magnitude == 0) | ~np.isfinite(wide)
+    return np.where(exact, wide, rounded)
+
+
+def _align_categories(instant_df, rows):
+    """
+    rows의 category 컬럼을 instant_df와 같은 category로 맞춤
+    (category가 다르면 concat 결과가 object로 바뀜)
+    """
+    instant_df = instant_df.copy(deep=False)
+    for column in CATEGORY_COLUMNS:
+        if column not in instant_df.columns or not isinstance(instant_df[column].dtype, pd.CategoricalDtype):
+            continue
+        new = pd.Index(np.asarray(rows[column].dropna().unique(), dtype=object))
+        new = new.difference(instant_df[column].cat.categories)
+        if len(new):
+            instant_df[column] = instant_df[column].cat.add_categories(new)
+        rows[column] = pd.Categorical(rows[column], categories=instant_df[column].cat.categories)
+    return instant_df, rows
+
+
+def build_ticker_index(instant_df):
+    """
+    ticker별 행 위치 인덱스 생성
+    - order: ticker → date 오름차순으로 정렬된 instant_df의 행 위치 배열
+    - offsets: ticker → order 내 [start, end) 구간
+    """
+    codes, tickers = pd.factorize(instant_df["ticker"])
+
+    # date 기준 정렬 후 ticker 코드로 안정 정렬 → ticker 구간 안에서 date 오름차순 유지
+    by_date = np.argsort(instant_df["date"].to_numpy(), kind="stable")
+    order = by_date[np.argsort(codes[by_date], kind="stable")]
+
+    # ticker가 비어 있는 행(code = -1)은 맨 앞에 모이므로 제외
+    order = order[np.count_nonzero(codes < 0) :]
+
+    counts = np.bincount(codes[codes >= 0], minlength=len(tickers))
+    ends = np.cumsum(counts)
+    starts = ends - counts
+
+    offsets = {
+        ticker: (int(start), int(end)) for ticker, start, end in zip(tickers, starts, ends)
+    }
+    return {"order": order, "offsets": offsets}
+
+
+def get_ticker_history(instant_df, symbol, ticker_index=None):
+    """
+    ticker의 전체 이력을 date 오름차순으로 반환
+    ticker_index는 instant_df와 같은 묶음이어야 함 (store.get_many로 함께 읽은 값)
+    인덱스가 없으면 전체 스캔으로 폴백
+    """
+    if ticker_index is None:
+        return instant_df[instant_df["ticker"] == symbol].sort_values("date")
+
+    span = ticker_index["offsets"].get(symbol)
+    if span is None:
+        return instant_df.iloc[0:0]
+
+    start, end = span
+    return instant_df.iloc[ticker_index["order"][start:end]]
+
+
+def get_tickers_history(instant_df, symbols, ticker_index=None):
+    """
+    여러 ticker의 이력을 한 번에 슬라이스 (행 위치를 모아 iloc 한 번)
+    (DataFrame, { symbol: (start, end) }) 반환
+    - DataFrame은 symbols 순서대로 ticker 구간이 이어지고, 구간 안은 date 오름차순
+    - 데이터가 없는 ticker는 spans에서 제외
+    - ticker_index: get_ticker_history와 같음
+    """
+    symbols = list(dict.fromkeys(symbols))
+
+    if ticker_index is None:
+        frames = [instant_df[instant_df["ticker"] == s].sort_values("date") for s in symbols]
+        found = [(s, f) for s, f in zip(symbols, frames) if len(f) > 0]
+        lengths = np.array([len(f) for _, f in found], dtype=np.int64)
+        combined = pd.concat([f for _, f in found]) if found else instant_df.iloc[0:0]
+        found = [s for s, _ in found]
+    else:
+        offsets = ticker_index["offsets"]
+        found = [s for s in symbols if s in offsets]
+        ranges = [offsets[s] for s in found]
+        lengths = np.array([end - start for start, end in ranges], dtype=np.int64)
+        positions = [ticker_index["order"][start:end] for start, end in ranges]
+        combined = instant_df.iloc[np.concatenate(positions) if positions else []]
+
+    ends = np.cumsum(lengths)
+    spans = {s: (int(end - n), int(end)) for s, n, end in zip(found, lengths, ends)}
+    return combined, spans
+
+
+def history_window(history, start=None, end=None, interval="daily"):
+    """
+    date 오름차순 이력에서 [start, end] 구간을 자르고 주/월 봉으로 집계
+    - 구간: date 배열에서 searchsorted (start/end는 포함)
+    - weekly(월~일) / monthly: 기간의 마지막 거래일 행 (종가·시가총액·지표는 기간 말 값)
+      change = 기간 합계, change_rate = change / 직전 기간 종가 × 100
+    """
+    dates = pd.to_datetime(history["date"]).to_numpy()
+    lo = np.searchsorted(dates, np.datetime64(start), "left") if start is not None else 0
+    hi = np.searchsorted(dates, np.datetime64(end), "right") if end is not None else len(dates)
+    history, dates = history.iloc[lo:hi], dates[lo:hi]
+
+    if interval == "daily" or len(history) == 0:
+        return history
+
+    if interval == "weekly":
+        # 1970-01-01(목요일) 기준 일수 + 3 → 월요일에 시작하는 주 번호
+        keys = (dates.astype("datetime64[D]").astype(np.int64) + 3) // 7
+    elif interval == "monthly":
+        keys = dates.astype("datetime64[M]").astype(np.int64)
+    else:
+        raise ValueError(f"Unknown interval: {interval}")
+
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    ends = np.r_[starts[1:], len(keys)] - 1
+    bars = history.iloc[ends].copy()
+
+    if "change" in bars.columns:
+        change = float64_values(history["change"])
+        valid = ~np.isnan(change)
+        summed = np.add.reduceat(np.where(valid, change, 0.0), starts).round(2)
+        summed[np.add.reduceat(valid, starts) == 0] = np.nan
+        bars["change"] = summed
+
+        if "change_rate" in bars.columns and "close" in bars.columns:
+            previous_close = float64_values(bars["close"]) - summed
+            with np.errstate(divide="ignore", invalid="ignore"):
+                rate = np.where(previous_close > 0, summed / previous_close * 100, np.nan)
+            bars["change_rate"] = rate.round(2)
+
+    return bars
+
+
+def build_latest_snapshot(instant_df):
+    """
+    최신 거래일 스냅샷 생성 (market별, 시가총액 내림차순)
+    - instant_df가 (date asc, market_cap desc)로 정렬돼 있으므로 순서를 그대로 유지
+    - "ALL" 키는 전체 시장
+    - "tickers": "ALL" 행 위치 조회용 ticker Index (get_quotes)
+    """
+    latest_date = instant_df["date"].max()
+    latest = instant_df[instant_df["date"] == latest_date].reset_index(drop=True)
+
+    markets = {"ALL": latest}
+    if "market" in latest.columns:
+        for market, group in latest.groupby("market", sort=False, observed=True):
+            markets[str(market)] = group.reset_index(drop=True)
+
+    tickers = pd.Index(latest["ticker"].astype(object)) if "ticker" in latest.columns else None
+    return {"date": latest_date, "markets": markets, "tickers": tickers}
+
+
+def _snapshot(instant_df):
+    """store의 최신 거래일 스냅샷, 없으면 instant_df에서 직접 계산"""
+    snapshot = store.get_data("latest_snapshot")
+    if snapshot is None:
+        snapshot = build_latest_snapshot(instant_df)
+    return snapshot
+
+
+def get_latest_snapshot(instant_df, market=None):
+    """
+    최신 거래일 스냅샷 (DataFrame, 최신 날짜) 반환
+    market이 없으면 전체, 스냅샷이 없으면 instant_df에서 직접 계산
+    """
+    snapshot = _snapshot(instant_df)
+
+    markets = snapshot["markets"]
+    df_latest = markets["ALL"]
+    if market and "market" in df_latest.columns:
+        df_latest = markets.get(market, df_latest.iloc[0:0])
+
+    return df_latest, snapshot["date"]
+
+
+def get_quotes(instant_df, tickers):
+    """
+    여러 종목의 최신 거래일 시세 { ticker: {"price", "change", "change_rate"} }
+    - 스냅샷 ticker Index에 get_indexer 한 번으로 행 위치를 찾고, 컬럼별로 iloc 한 번씩
+    - 최신 거래일에 없는 ticker는 제외, 결측 값은 None
+    """
+    snapshot = _snapshot(instant_df)
+    latest = snapshot["markets"]["ALL"]
+    index = snapshot.get("tickers")
+    if index is None:
+        index = pd.Index(latest["ticker"].astype(object))
+
+    tickers = pd.Index(list(dict.fromkeys(tickers)), dtype=object)
+    positions = index.get_indexer(tickers)
+    found = positions >= 0
+    positions = positions[found]
+
+    columns = {}
+    for field, column in QUOTE_COLUMNS.items():
+        if column in latest.columns:
+            values = float64_values(latest[column].iloc[positions])
+        else:
+            values = np.full(len(positions), np.nan)
+        columns[field] = [None if v != v else v for v in values.tolist()]
+
+    fields = list(columns)
+    return {
+        ticker: dict(zip(fields, values))
+        for ticker, values in zip(tickers[found], zip(*columns.values()))
+    }
+
+
+def build_screener(snapshot):
+    """최신 거래일 스크리너 배열 (utils/screener.py)"""
+    latest = snapshot["markets"]["ALL"]
+    numeric = {
+        column: float64_values(latest[column])
+        for column in screener.RANGE_FIELDS.values()
+        if column in latest.columns
+    }
+    return screener.build_screener(latest, snapshot["date"], numeric)
+
+
+def get_screener():
+    """
+    store의 스크리너 (없으면 instant_df 최신 스냅샷에서 직접 계산, 데이터가 없으면 None)
+    """
+    screener_data = store.get_data("screener")
+    if screener_data is None:
+        instant_df = store.get_data("instant_df")
+        if instant_df is None:
+            return None
+        screener_data = build_screener(store.get_data("latest_snapshot") or build_latest_snapshot(instant_df))
+    return screener_data
+
+
+def instant_values(instant_df):
+    """instant_df와 파생 인덱스 (store key → 값)"""
+    snapshot = build_latest_snapshot(instant_df)
+    return {
+        'instant_df': instant_df,
+        'ticker_index': build_ticker_index(instant_df),
+        'latest_snapshot': snapshot,
+        'screener': build_screener(snapshot),
+    }
+
+
+def set_instant_df(instant_df):
+    """
+    instant_df와 파생 인덱스를 함께 저장 (한 번에 교체)
+    """
+    store.set_many(instant_values(instant_df))
+
+
+def build_search_index(updates):
+    """
+    회사 검색 인덱스 (utils/search_index.py)
+    updates에 새 스냅샷/profile이 없으면 store의 현재 값 사용
+    """
+    snapshot = updates.get('latest_snapshot') or store.get_data('latest_snapshot')
+    profile_df = updates['profile_df'] if 'profile_df' in updates else store.get_data('profile_df')
+    return search_index.build_from_frames(snapshot["markets"]["ALL"] if snapshot else None, profile_df)
+
+
+def llm_output_version(s3, strict=False):
+    """
+    llm_output/ 최신 객체 "key@ETag" (없으면 None)
+    조회 실패 시 None, strict면 예외 (없음과 실패를 구분해야 하는 data_watcher용)
+    """
+    try:
+        latest = s3.get_latest_object(LLM_OUTPUT_PREFIX)
+    except Exception as e:
+        if strict:
+            raise
+        debug_print(f"✗ llm_output version check failed: {e}")
+        return None
+    if not latest:
+        return None
+    return f"{latest['Key']}@{latest.get('ETag') or ''}"
+
+
+def source_versions(s3, instant_df, profile_keys):
+    """
+    데이터 버전을 구성하는 원본 정보
+    { "instant": 최신 거래일, "profile": {market: key}, "llm_output": "key@ETag" }
+    """
+    return {
+        "instant": str(pd.Timestamp(instant_df['date'].max()).date()) if instant_df is not None else None,
+        "profile": profile_keys,
+        "llm_output": llm_output_version(s3),
+    }
+
+
+def make_data_version(sources):
+    """
+    원본 정보 → 데이터 버전 (id는 원본이 같으면 같은 값)
+    { "id", "sources", "loaded_at" }
+    """
+    digest = hashlib.sha1(json.dumps(sources, sort_keys=True, default=str).encode("utf-8"))
+    return {
+        "id": digest.hexdigest()[:12],
+        "sources": sources,
+        "loaded_at": datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def get_data_version():
+    """현재 서비스 중인 데이터 버전 (로드 전이면 None)"""
+    return store.get_data('data_version')
+
+
+def _timed(fn, *args):
+    """(결과, 소요 시간) 반환"""
+    start = time.time()
+    result = fn(*args)
+    return result, time.time() - start
+
+
+def _sort_instant_df(instant_df):
+    """시가총액 기준 정렬: date 오름차순, market_cap 내림차순"""
+    instant_df['market_cap_numeric'] = pd.to_numeric(instant_df['market_cap'], errors='coerce')
+    return instant_df.sort_values(
+        by=['date', 'market_cap_numeric'],
+        ascending=[True, False]
+    ).drop(columns=['market_cap_numeric'])
+
+
+def _load_instant_df(s3):
+    """
+    최신 instant parquet 다운로드 + 스키마 정규화 + 정렬
+    (DataFrame | None, {"download", "sort"} 소요 시간) 반환
+    """
+    (instant_df, ts), download_elapsed = _timed(s3.get_latest_parquet_df, INSTANT_PREFIX)
+    if instant_df is None:
+        return None, {"download": download_elapsed}
+
+    instant_df, normalize_elapsed = _timed(normalize_schema, instant_df)
+    instant_df, sort_elapsed = _timed(_sort_instant_df, instant_df)
+    return instant_df, {
+        "download": download_elapsed,
+        "normalize": normalize_elapsed,
+        "sort": sort_elapsed,
+    }
+
+
+def _latest_profile_keys(s3):
+    """
+    company-profile/ 에서 market별 최신 파일 key
+    { "kospi": key | None, "kosdaq": key | None }
+    """
+    keys = {"kospi": None, "kosdaq": None}
+
+    response = s3.get_list_v2(PROFILE_PREFIX)
+    if 'Contents' not in response:
+        return keys
+
+    files = sorted(response['Contents'], key=lambda x: x['LastModified'], reverse=True)
+    for f in files:
+        for market in keys:
+            if f'market={market}' in f['Key'] and keys[market] is None:
+                keys[market] = f['Key']
+        if all(keys.values()):
+            break
+
+    return keys
+
+
+def load_sources(s3):
+    """
+    instant parquet과 KOSPI/KOSDAQ profile을 동시에 다운로드/디코딩
+    - instant 다운로드·정렬과 company-profile 목록 조회를 함께 시작
+    - 목록이 나오면 market별 profile 다운로드를 이어서 제출
+    반환: { "instant_df", "profiles": {market: df}, "profile_keys", "timings": {단계: 초} }
+    """
+    timings = {}
+
+    with ThreadPoolExecutor(max_workers=LOAD_WORKERS, thread_name_prefix="instant-data") as pool:
+        instant_future = pool.submit(_load_instant_df, s3)
+        listing_future = pool.submit(_timed, _latest_profile_keys, s3)
+
+        profile_keys, timings["profile_list"] = listing_future.result()
+        profile_futures = {
+            market: pool.submit(_timed, s3.get_dataframe, key)
+            for market, key in profile_keys.items() if key
+        }
+
+        instant_df, instant_timings = instant_future.result()
+        for step, elapsed in instant_timings.items():
+            timings[f"instant_{step}"] = elapsed
+
+        profiles = {}
+        for market, future in profile_futures.items():
+            profiles[market], timings[f"profile_{market}"] = future.result()
+
+    return {
+        "instant_df": instant_df,
+        "profiles": profiles,
+        "profile_keys": profile_keys,
+        "timings": timings,
+    }
+
+
+def _combine_profiles(profiles):
+    """KOSDAQ + KOSPI profile 합치기 (한쪽만 있으면 그대로)"""
+    frames = [profiles[m] for m in ("kosdaq", "kospi") if profiles.get(m) is not None]
+    if not frames:
+        return None
+    return pd.concat(frames) if len(frames) > 1 else frames[0]
+
+
+def _print_memory(instant_df):
+    used = memory_mb(instant_df)
+    debug_print(f"  - Memory: {used:.1f}MB (budget {MEMORY_BUDGET_MB}MB)")
+    if used > MEMORY_BUDGET_MB:
+        debug_print(f"  ⚠ instant_df exceeds memory budget (INSTANT_DATA_MEMORY_BUDGET_MB)")
 
-            # Store in Shared Memory
-            store.set_data('profile_df', profile_df)
 
-            debug_print(f"✓ Profile data loaded to cache: {profile_df.shape}")
-            debug_print(f"  - KOSDAQ: {len(profile_kosdaq)} 종목")
-            debug_print(f"  - KOSPI: {len(profile_kospi)} 종목")
-            debug_print(f"  - Total: {len(profile_df)} 종목")
-        elif profile_kosdaq is not None:
-            store.set_data('profile_df', profile_kosdaq)
-            debug_print(f"✓ Profile data loaded (KOSDAQ only): {profile_kosdaq.shape}")
-        elif profile_kospi is not None:
-            store.set_data('profile_df', profile_kospi)
-            debug_print(f"✓ Profile data loaded (KOSPI only): {profile_kospi.shape}")
+def init():
+    print_line()
+    debug_print("Loading instant data into Django cache...")
 
-    profile_elapsed = time.time() - profile_start
-    debug_print(f"  - Load time: {profile_elapsed:.2f}s")
+    total_start = time.time()
+    s3 = FinanceBucket()
+
+    # 1) Instant + Company Profile(KOSPI/KOSDAQ) 동시 로드
+    loaded = load_sources(s3)
+    timings = loaded["timings"]
+    load_elapsed = time.time() - total_start
+
+    # 새 버전은 모두 만든 뒤 한 번에 교체
+    updates = {}
+
+    instant_df = loaded["instant_df"]
+    if instant_df is not None:
+        # ticker 인덱스, 최신일 스냅샷
+        index_start = time.time()
+        updates.update(instant_values(instant_df))
+        index_elapsed = time.time() - index_start
+
+        debug_print(f"✓ Instant data loaded: {instant_df.shape}")
+        debug_print(f"  - S3 download time: {timings['instant_download']:.2f}s")
+        debug_print(f"  - Normalize time: {timings['instant_normalize']:.2f}s")
+        debug_print(f"  - Sort time: {timings['instant_sort']:.2f}s")
+        _print_memory(instant_df)
+        debug_print(f"  - Index/snapshot build time: {index_elapsed:.2f}s")
+        debug_print(f"  - Unique tickers: {instant_df['ticker'].nunique()}")
+        debug_print(f"  - Date range: {instant_df['date'].min()} ~ {instant_df['date'].max()}")
+        debug_print(f"  - Sorted by: date (asc), market_cap (desc)")
+
+    # 2) Company Profile 저장
+    profiles = loaded["profiles"]
+    profile_df = _combine_profiles(profiles)
+    if profile_df is not None:
+        updates['profile_df'] = profile_df
+        updates['profile_keys'] = loaded['profile_keys']
+
+        debug_print(f"✓ Profile data loaded: {profile_df.shape}")
+        debug_print(f"  - List time: {timings['profile_list']:.2f}s")
+        for market in ("kospi", "kosdaq"):
+            if market in profiles:
+                debug_print(f"  - {market.upper()} profile from: {loaded['profile_keys'][market]}")
+                debug_print(f"    {len(profiles[market])} 종목, {timings[f'profile_{market}']:.2f}s")
+        debug_print(f"  - Total: {len(profile_df)} 종목")
+
+    # 3) Store in Shared memory (+ 검색 인덱스, 데이터 버전)
+    search_start = time.time()
+    updates['search_index'] = build_search_index(updates)
+    debug_print(f"✓ Search index built: {len(updates['search_index']['entries'])} 종목, "
+                f"{time.time() - search_start:.2f}s")
+
+    data_version = make_data_version(source_versions(s3, instant_df, loaded['profile_keys']))
+    updates['data_version'] = data_version
+    store.set_many(updates)
+    debug_print(f"✓ Data version: {data_version['id']}")
 
     # 로드 시각 저장
     total_elapsed = time.time() - total_start
     cache.set('data_last_loaded', datetime.now(), timeout=None)
 
+    debug_print(f"✓ Concurrent S3 load time: {load_elapsed:.2f}s")
     debug_print(f"✓ Total loading time: {total_elapsed:.2f}s")
     debug_print(f"✓ Data loaded at: {datetime.now()}")
     print_line()
 
 
-def reload():
+def _month_prefixes(since, until):
+    """since ~ until 사이 월별 daily partition prefix"""
+    year, month = since.year, since.month
+    while (year, month) <= (until.year, until.month):
+        yield f"{PRICE_PREFIX}year={year}/month={month}/"
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def find_new_partitions(s3, since):
+    """
+    since 이후 올라온 daily partition
+    [(date, {"kospi": key, "kosdaq": key})] 날짜 오름차순
+    두 시장이 모두 올라온 날짜까지만 (업로드 중인 날짜와 그 이후는 제외)
+    """
+    since = pd.Timestamp(since)
+    by_date = {}
+
+    for prefix in _month_prefixes(since, max(datetime.now(), since)):
+        for obj in s3.get_list_v2(prefix).get('Contents', []):
+            match = DAILY_KEY.search(obj['Key'])
+            if match is None:
+                continue
+            day = pd.Timestamp(match[2])
+            if day > since:
+                by_date.setdefault(day, {})[match[1]] = obj['Key']
+
+    partitions = []
+    for day in sorted(by_date):
+        if set(by_date[day]) != {"kospi", "kosdaq"}:
+            break
+        partitions.append((day, by_date[day]))
+    return partitions
+
+
+def build_daily_rows(day, frames):
+    """
+    daily partition(KOSPI, KOSDAQ) → instant_df 형식
+    price-financial-crawler/cross_to_ts2.py 와 같은 변환
+    """
+    daily = pd.concat(frames).replace(["nan", "NaN", "None", ""], np.nan).dropna()
+    ticker = daily.index
+    daily = daily.reset_index(drop=True)
+    daily['ticker'] = ticker
+    daily['date'] = day
+    return pd.concat({day: daily})
+
+
+def load_delta(s3, instant_df):
+    """
+    instant_df 이후 추가된 거래일만 내려받아 붙인 DataFrame 반환
+    (새 DataFrame | None, 추가된 날짜 목록)
+    - 추가할 날짜가 DELTA_MAX_DAYS를 넘으면 DeltaUnavailable → 전체 로드
+    """
+    partitions = find_new_partitions(s3, instant_df['date'].max())
+    if not partitions:
+        return None, []
+    if len(partitions) > DELTA_MAX_DAYS:
+        raise DeltaUnavailable(f"{len(partitions)} trading days behind")
+
+    with ThreadPoolExecutor(max_workers=LOAD_WORKERS, thread_name_prefix="instant-data") as pool:
+        futures = [
+            (day, [pool.submit(s3.get_dataframe, keys[m]) for m in ("kospi", "kosdaq")])
+            for day, keys in partitions
+        ]
+        rows = [build_daily_rows(day, [f.result() for f in frames]) for day, frames in futures]
+
+    # 기존 스키마 유지 (컬럼 순서/구성/dtype), 새 행만 정렬 → 날짜가 모두 뒤이므로 전체 정렬 유지
+    delta = normalize_schema(pd.concat(rows).reindex(columns=instant_df.columns))
+    delta = _sort_instant_df(delta)
+    instant_df, delta = _align_categories(instant_df, delta)
+    return pd.concat([instant_df, delta]), [day for day, _ in partitions]
+
+
+def reload(full=False):
+    """
+    S3 데이터 다시 로드
+    - 기본: store의 instant_df 이후 추가된 daily partition만 붙임 (delta)
+    - full=True, 저장된 데이터가 없거나 delta 실패 시: 전체 instant parquet 로드
+    - profile은 최신 파일 key가 바뀐 경우에만 다시 다운로드
+    - 새 버전을 모두 만든 뒤 store에 한 번에 교체 (요청 처리 중인 worker는 이전 버전을 계속 사용)
+    """
+    with _reload_lock:
+        return _reload(full)
+
+
+def _reload(full):
     print_line()
-    debug_print("Manual data reload triggered...")
+    debug_print("Data reload triggered...")
 
     total_start = time.time()
     s3 = FinanceBucket()
+    updates = {}
 
     # 1) Instant 데이터 로드
     instant_start = time.time()
-    instant_df, ts = s3.get_latest_parquet_df('price-financial-info-instant/')
+    mode = "full"
+    added_dates = []
+    current_df = None if full else store.get_data('instant_df')
+
+    instant_df = None
+    if current_df is not None:
+        try:
+            instant_df, added_dates = load_delta(s3, current_df)
+            mode = "delta"
+        except Exception as e:
+            debug_print(f"✗ Delta reload unavailable, falling back to full reload: {e}")
+
+    if mode == "full":
+        instant_df, _ = _load_instant_df(s3)
     instant_elapsed = time.time() - instant_start
 
     if instant_df is not None:
-        # 시가총액 기준 정렬
-        instant_df['market_cap_numeric'] = pd.to_numeric(instant_df['market_cap'], errors='coerce')
-        instant_df = instant_df.sort_values(
-            by=['date', 'market_cap_numeric'],
-            ascending=[True, False]
-        ).drop(columns=['market_cap_numeric'])
-
-        # Django 캐시에 저장
-        store.set_data('instant_df', instant_df)
-        debug_print(f"✓ Instant data reloaded to cache: {instant_df.shape}")
+        # ticker 인덱스, 최신일 스냅샷
+        updates.update(instant_values(instant_df))
+        debug_print(f"✓ Instant data reloaded ({mode}): {instant_df.shape}")
+        _print_memory(instant_df)
+        if added_dates:
+            debug_print(f"  - Added dates: {', '.join(str(d.date()) for d in added_dates)}")
+    elif mode == "delta":
+        instant_df = current_df
+        debug_print("✓ Instant data already up to date")
 
     # 2) Profile 데이터 로드 (market별 자동 검색)
     profile_start = time.time()
 
-    response = s3.get_list_v2('company-profile/')
-
-    if 'Contents' in response:
-        files = sorted(response['Contents'], key=lambda x: x['LastModified'], reverse=True)
-
-        kospi_file = None
-        kosdaq_file = None
-
-        for f in files:
-            if 'market=kospi' in f['Key'] and kospi_file is None:
-                kospi_file = f['Key']
-            if 'market=kosdaq' in f['Key'] and kosdaq_file is None:
-                kosdaq_file = f['Key']
-            if kospi_file and kosdaq_file:
-                break
-
-        profile_kospi = None
-        profile_kosdaq = None
-
-        if kospi_file: profile_kospi = s3.get_dataframe(kospi_file)
-        if kosdaq_file: profile_kosdaq = s3.get_dataframe(kosdaq_file)
-
-        if profile_kosdaq is not None and profile_kospi is not None:
-            profile_df = pd.concat([profile_kosdaq, profile_kospi])
-            store.set_data('profile_df', profile_df)
-            debug_print(f"✓ Profile data reloaded to cache: {profile_df.shape}")
+    profile_keys = _latest_profile_keys(s3)
+    if full or profile_keys != store.get_data('profile_keys'):
+        profiles = {
+            market: s3.get_dataframe(key) for market, key in profile_keys.items() if key
+        }
+        profile_df = _combine_profiles(profiles)
+        if profile_df is not None:
+            updates['profile_df'] = profile_df
+            updates['profile_keys'] = profile_keys
+            debug_print(f"✓ Profile data reloaded: {profile_df.shape}")
 
     profile_elapsed = time.time() - profile_start
 
-    total_elapsed = time.time() - total_start
-    # 로드 시각 저장
-    store.set_data('data_last_loaded', datetime.now())
+    # 3) 새 버전 교체 (+ 검색 인덱스, 데이터 버전, 로드 시각)
+    if 'latest_snapshot' in updates or 'profile_df' in updates:
+        updates['search_index'] = build_search_index(updates)
+    data_version = make_data_version(source_versions(s3, instant_df, profile_keys))
+    updates['data_version'] = data_version
+    updates['data_last_loaded'] = datetime.now()
+    store.set_many(updates)
 
+    total_elapsed = time.time() - total_start
+    debug_print(f"✓ Data version: {data_version['id']}")
     debug_print(f"✓ Total reload time: {total_elapsed:.2f}s")
     debug_print(f"✓ Data reloaded at: {datetime.now()}")
     print_line()
 
     # 캐시에서 확인
-    instant_df = store.get_data('instant_df')
-    profile_df = store.get_data('profile_df')
+    instant_df, profile_df = store.get_many(['instant_df', 'profile_df'])
 
     return ok({
         "message": "Data reloaded successfully",
+        "mode": mode,
+        "added_dates": [str(d.date()) for d in added_dates],
         "instant_shape": list(instant_df.shape) if instant_df is not None else None,
         "profile_shape": list(profile_df.shape) if profile_df is not None else None,
+        "data_version": data_version["id"],
         "instant_time": f"{instant_elapsed:.2f}s",
         "profile_time": f"{profile_elapsed:.2f}s",
         "total_time": f"{total_elapsed:.2f}s",
         "reloaded_at": str(datetime.now())
-    })
\ No newline at end of file
+    })
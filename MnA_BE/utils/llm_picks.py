@@ -0,0 +1,155 @@
+from S3.finance import FinanceBucket
+from utils.debug_print import debug_print
+from utils.for_api import get_path_with_date
+from collections import OrderedDict
+import json, os, threading, time
+
+# 최신 llm_output 객체(key, ETag) 재확인 주기
+PICKS_TTL_SECONDS = int(os.getenv("LLM_PICKS_TTL_SECONDS", 60))
+# 변환한 추천 목록을 보관할 최대 파일(날짜 × content) 수 (LRU)
+PICKS_CACHE_SIZE = int(os.getenv("LLM_PICKS_CACHE_SIZE", 32))
+
+LLM_OUTPUT_PREFIX = "llm_output"
+
+# { "date": "YYYY-MM-DD" | None, "version": "key@ETag" | None, "checked_at": float }
+_latest_state = None
+_latest_lock = threading.Lock()
+_refresh_thread = None
+
+# path → { "value": parse 결과, "version": 로드할 때의 최신 객체 version (지난 날짜면 None) }
+_picks_cache = OrderedDict()
+_picks_lock = threading.Lock()
+
+# 요청된 적 있는 content → parse (새 최신 날짜가 올라오면 미리 로드)
+_parsers = {}
+
+
+def _fetch_latest():
+    s3 = FinanceBucket()
+    latest = s3.get_latest_object(LLM_OUTPUT_PREFIX)
+    return {
+        "date": s3.source_date(latest) if latest else None,
+        "version": f"{latest['Key']}@{latest.get('ETag') or ''}" if latest else None,
+    }
+
+
+def refresh():
+    """
+    최신 llm_output 객체 확인, 바뀌었으면 요청된 적 있는 content의 새 최신 파일을 먼저 로드한 뒤 교체
+    (요청은 교체 전까지 이전 버전을 그대로 사용 → S3를 기다리지 않음)
+    S3 장애 시 이전 값 유지 (처음이면 예외)
+    """
+    global _latest_state
+    previous = _latest_state
+    try:
+        state = _fetch_latest()
+    except Exception as e:
+        if previous is None:
+            raise
+        debug_print(f"LLM picks revalidation failed: {e}")
+        state = dict(previous)
+
+    if state["date"] and (previous is None or previous["version"] != state["version"]):
+        year, month, day = state["date"].split("-")
+        for content, parse in list(_parsers.items()):
+            try:
+                _load(picks_path(content, year, month, day), parse, state["version"])
+            except Exception as e:
+                debug_print(f"LLM picks preload failed ({content} {state['date']}): {e}")
+
+    state["checked_at"] = time.time()
+    _latest_state = state
+    return state
+
+
+def _refresh_in_background():
+    global _refresh_thread
+    with _latest_lock:
+        if _refresh_thread is not None and _refresh_thread.is_alive():
+            return
+        _refresh_thread = threading.Thread(target=refresh, name="llm-picks-refresh", daemon=True)
+        _refresh_thread.start()
+
+
+def _latest():
+    """
+    llm_output 최신 객체의 날짜/version
+    - 처음: S3 확인 후 반환
+    - TTL이 지나면 이전 값을 반환하고 백그라운드에서 재확인
+    """
+    state = _latest_state
+    if state is None:
+        with _latest_lock:
+            return _latest_state or refresh()
+
+    if time.time() - state["checked_at"] >= PICKS_TTL_SECONDS:
+        _refresh_in_background()
+    return state
+
+
+def latest_date():
+    """가장 최근 llm_output 날짜 ("YYYY-MM-DD"), 없으면 None"""
+    return _latest()["date"]
+
+
+def latest_version():
+    """
+    최신 llm_output 객체 식별자 (ETag용, "key@ETag")
+    없거나 조회에 실패하면 None
+    """
+    try:
+        return _latest()["version"]
+    except Exception as e:
+        debug_print(f"LLM picks version check failed: {e}")
+        return None
+
+
+def picks_path(content, year, month, day):
+    return f"{LLM_OUTPUT_PREFIX}/{get_path_with_date(content, year, month, day)}"
+
+
+def _load(path, parse, version):
+    llm_output = FinanceBucket().get_json(key=path)
+    # Parse JSON string if needed
+    if isinstance(llm_output, str):
+        llm_output = json.loads(llm_output)
+    value = parse(llm_output)
+
+    with _picks_lock:
+        _picks_cache[path] = {"value": value, "version": version}
+        _picks_cache.move_to_end(path)
+        while len(_picks_cache) > PICKS_CACHE_SIZE:
+            _picks_cache.popitem(last=False)
+
+    return value
+
+
+def get_picks(content: str, year, month, day, parse):
+    """
+    llm_output/.../content={content}/{날짜} 추천 파일 → parse(llm_output) 결과 (캐시)
+    - 지난 날짜: 한 번 변환한 결과를 LRU로 보관 (파일이 바뀌지 않음)
+    - 최신 날짜: 최신 객체 version이 바뀌면 (같은 날짜 재업로드 포함) refresh에서 다시 로드
+    parse 결과는 요청 사이에 공유되므로 수정하지 않고 읽기만 할 것
+    """
+    path = picks_path(content, year, month, day)
+    _parsers.setdefault(content, parse)
+
+    latest = _latest()
+    date = path.rsplit("/", 1)[-1]
+    version = latest["version"] if date == latest["date"] else None
+
+    with _picks_lock:
+        entry = _picks_cache.get(path)
+        if entry is not None and entry["version"] == version:
+            _picks_cache.move_to_end(path)
+            return entry["value"]
+
+    return _load(path, parse, version)
+
+
+def clear_picks_cache():
+    global _latest_state
+    with _latest_lock, _picks_lock:
+        _latest_state = None
+        _picks_cache.clear()
+        _parsers.clear()
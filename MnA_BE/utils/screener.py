@@ -0,0 +1,167 @@
+"""
+최신 거래일 스크리너 (PER/PBR/ROE/DIV/시가총액 범위, 시장/업종 필터, 정렬, 페이지)
+- 데이터 로드 때 최신 스냅샷을 컬럼별 float64 배열 + 범주 코드 배열로 만들어 store에 저장
+  (instant_data.instant_values, 시가총액 내림차순 = 스냅샷 순서)
+- 요청 조건은 parse_screen으로 (컬럼, 하한, 상한) / (범주 컬럼, 값) predicate 목록으로 변환
+- run_screen: predicate마다 boolean mask를 &로 누적 → 정렬 키 argsort → 페이지 행만 꺼냄
+  (~2,700 종목 기준 수십 μs, pandas query/boolean indexing 없이 배열 연산만)
+"""
+from collections import namedtuple
+import numpy as np
+import pandas as pd
+
+# query param 이름 → 스냅샷 컬럼 (범위 필터 / 정렬 키)
+RANGE_FIELDS = {
+    "per": "PER",
+    "pbr": "PBR",
+    "roe": "ROE",
+    "div": "DIV",
+    "market_cap": "market_cap",
+    "close": "close",
+    "change_rate": "change_rate",
+}
+CATEGORY_FIELDS = ("market", "industry")
+SORT_ORDERS = ("asc", "desc")
+DEFAULT_SORT = "market_cap"
+
+Screen = namedtuple("Screen", ["ranges", "categories", "sort", "descending"])
+
+
+def build_screener(snapshot_df, date, numeric: dict) -> dict:
+    """
+    snapshot_df: 최신 거래일 스냅샷 (시가총액 내림차순)
+    numeric: {컬럼: float64 배열} (숫자가 아닌 값은 NaN, instant_data.float64_values)
+    {
+        "date": 최신 거래일,
+        "size": 종목 수,
+        "numeric": {컬럼: float64 배열},
+        "categories": {컬럼: {"codes": int 배열 (-1 = 결측), "lookup": {대문자 값: 코드}}},
+        "rows": [{"ticker", "name", "market", "industry", 지표...}],   # 응답용 (위치 = 순위)
+    }
+    """
+    size = len(snapshot_df)
+    numeric = {column: values for column, values in numeric.items() if len(values) == size}
+
+    categories = {}
+    for column in CATEGORY_FIELDS:
+        if column not in snapshot_df.columns:
+            continue
+        codes, uniques = pd.factorize(snapshot_df[column].astype(object))
+        categories[column] = {
+            "codes": codes,
+            "lookup": {str(value).upper(): code for code, value in enumerate(uniques)},
+        }
+
+    def strings(column):
+        if column not in snapshot_df.columns:
+            return [None] * size
+        return [None if v is None or v != v else str(v) for v in snapshot_df[column].astype(object)]
+
+    columns = {column: strings(column) for column in ("ticker", "name", "market", "industry")}
+    for field, column in RANGE_FIELDS.items():
+        values = numeric.get(column)
+        if values is None:
+            columns[column] = [None] * size
+        elif column == "market_cap":
+            columns[column] = [None if v != v else int(v) for v in values.tolist()]
+        else:
+            columns[column] = values.tolist()
+
+    names = list(columns)
+    rows = [dict(zip(names, values)) for values in zip(*columns.values())] if size else []
+
+    return {
+        "date": date,
+        "size": size,
+        "numeric": numeric,
+        "categories": categories,
+        "rows": rows,
+    }
+
+
+def _number(name: str, value: str) -> float:
+    try:
+        number = float(value)
+    except ValueError:
+        raise ValueError(f"INVALID {name.upper()} (number)")
+    if number != number:
+        raise ValueError(f"INVALID {name.upper()} (number)")
+    return number
+
+
+def parse_screen(params) -> Screen:
+    """
+    query params → Screen (잘못된 값이면 ValueError)
+    - {field}_min / {field}_max: 범위 (양 끝 포함, 값이 없는 종목은 제외)
+    - market / industry: 쉼표로 여러 값 (대소문자 무시)
+    - sort: RANGE_FIELDS 중 하나 (기본 market_cap), order: asc / desc (기본 desc)
+    """
+    ranges = []
+    for field, column in RANGE_FIELDS.items():
+        low, high = params.get(f"{field}_min"), params.get(f"{field}_max")
+        if not low and not high:
+            continue
+        low = _number(f"{field}_min", low) if low else -np.inf
+        high = _number(f"{field}_max", high) if high else np.inf
+        if low > high:
+            raise ValueError(f"{field.upper()}_MIN MUST BE <= {field.upper()}_MAX")
+        ranges.append((column, low, high))
+
+    categories = []
+    for column in CATEGORY_FIELDS:
+        values = [v.strip().upper() for v in (params.get(column) or "").split(",") if v.strip()]
+        if values:
+            categories.append((column, tuple(dict.fromkeys(values))))
+
+    sort = (params.get("sort") or DEFAULT_SORT).lower()
+    if sort not in RANGE_FIELDS:
+        raise ValueError(f"INVALID SORT (one of {', '.join(RANGE_FIELDS)})")
+    order = (params.get("order") or "desc").lower()
+    if order not in SORT_ORDERS:
+        raise ValueError("INVALID ORDER (asc or desc)")
+
+    return Screen(tuple(ranges), tuple(categories), RANGE_FIELDS[sort], order == "desc")
+
+
+def run_screen(screener: dict, screen: Screen) -> np.ndarray:
+    """
+    조건에 맞는 종목 위치 (정렬 순서)
+    - 범위: low <= v <= high (NaN은 비교가 False → 제외)
+    - 정렬: 값이 없는 종목은 항상 뒤, 같은 값은 시가총액 순 (stable)
+    """
+    size = screener["size"]
+    mask = np.ones(size, dtype=bool)
+
+    for column, low, high in screen.ranges:
+        values = screener["numeric"].get(column)
+        if values is None:
+            return np.empty(0, dtype=np.intp)
+        if low != -np.inf:
+            mask &= values >= low
+        if high != np.inf:
+            mask &= values <= high
+
+    for column, wanted in screen.categories:
+        category = screener["categories"].get(column)
+        if category is None:
+            return np.empty(0, dtype=np.intp)
+        codes = [category["lookup"][v] for v in wanted if v in category["lookup"]]
+        mask &= np.isin(category["codes"], codes)
+
+    positions = np.flatnonzero(mask)
+
+    # 스냅샷이 이미 시가총액 내림차순
+    if screen.sort == "market_cap" and screen.descending:
+        return positions
+
+    values = screener["numeric"].get(screen.sort)
+    if values is None:
+        return positions
+    keys = values[positions]
+    order = np.argsort(-keys if screen.descending else keys, kind="stable")
+    return positions[order]
+
+
+def page_rows(screener: dict, positions: np.ndarray, limit: int, offset: int) -> list:
+    rows = screener["rows"]
+    return [rows[i] for i in positions[offset : offset + limit].tolist()]
@@ -0,0 +1,180 @@
+"""
+회사 검색 / 자동완성 인덱스
+- 검색 키: ticker, 회사명, 회사명 초성 (삼성전자 → ㅅㅅㅈㅈ)
+- exact: ticker/회사명 → 종목 id
+- prefix: 키의 모든 접두어(MAX_PREFIX자까지) → 종목 id (시가총액 순)
+- 2-gram: 회사명/초성의 모든 2글자 → 종목 id (중간 일치: "전자" → 삼성전자)
+- 약 2,700 종목 기준 id 10만 개 미만 → 검색은 dict 조회 + 결과 수만큼의 순회
+- id 목록은 키별 [start, end) 구간 + int32 배열 하나 (store에서 worker 간 공유되는 배열)
+- 데이터 로드 때마다 새로 만들어 store에 함께 저장 (instant_data.init / reload)
+"""
+import re
+import numpy as np
+
+# 접두어 인덱스에 넣는 최대 길이 (더 긴 검색어는 2-gram으로 찾고 부분 문자열로 확인)
+MAX_PREFIX = 12
+
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+HANGUL_START, HANGUL_END = 0xAC00, 0xD7A3
+# 한 초성에 해당하는 음절 수 (중성 21 × 종성 28)
+SYLLABLES_PER_CHOSUNG = 588
+
+_SPACES = re.compile(r"\s+")
+
+
+def normalize(text: str) -> str:
+    """소문자, 공백 제거"""
+    return _SPACES.sub("", str(text)).lower()
+
+
+def chosung(text: str) -> str:
+    """한글 음절 → 초성 (그 외 문자는 그대로)"""
+    out = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_START <= code <= HANGUL_END:
+            out.append(CHOSUNG[(code - HANGUL_START) // SYLLABLES_PER_CHOSUNG])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def _has_chosung(text: str) -> bool:
+    return any(ch in CHOSUNG for ch in text)
+
+
+def _bigrams(key: str):
+    return {key[i : i + 2] for i in range(len(key) - 1)}
+
+
+def _add(postings: dict, key: str, entry_id: int):
+    ids = postings.setdefault(key, [])
+    if not ids or ids[-1] != entry_id:
+        ids.append(entry_id)
+
+
+def build_search_index(companies) -> dict:
+    """
+    companies: [(ticker, name | None, market | None)] 시가총액 내림차순
+    {
+        "entries": [{"ticker", "name", "market"}],   # id = 위치 = 순위
+        "by_ticker": {ticker: id},
+        "keys": [(ticker, name, name 초성)],           # 부분 문자열 확인용 (정규화)
+        "ids": int32 배열,                             # 아래 구간이 가리키는 id 목록
+        "exact": {ticker | name: (start, end)},
+        "prefixes": {접두어: (start, end)},
+        "ngrams": {2-gram: (start, end)},
+    }
+    """
+    entries, keys, by_ticker = [], [], {}
+    exact, prefixes, ngrams = {}, {}, {}
+
+    for ticker, name, market in companies:
+        if ticker is None or ticker in by_ticker:
+            continue
+        entry_id = len(entries)
+        by_ticker[ticker] = entry_id
+        entries.append({"ticker": ticker, "name": name, "market": market})
+
+        name_key = normalize(name) if name else ""
+        initials = chosung(name_key)
+        keys.append((normalize(ticker), name_key, initials))
+
+        for key in dict.fromkeys((normalize(ticker), name_key)):
+            if key:
+                _add(exact, key, entry_id)
+        for key in dict.fromkeys((normalize(ticker), name_key, initials)):
+            for i in range(1, min(len(key), MAX_PREFIX) + 1):
+                _add(prefixes, key[:i], entry_id)
+        for gram in _bigrams(name_key) | _bigrams(initials):
+            _add(ngrams, gram, entry_id)
+
+    # id는 순위 순으로 추가되므로 이미 정렬됨
+    ids, spans = [], {}
+    for table, postings in (("exact", exact), ("prefixes", prefixes), ("ngrams", ngrams)):
+        spans[table] = {}
+        for key, values in postings.items():
+            spans[table][key] = (len(ids), len(ids) + len(values))
+            ids.extend(values)
+
+    return {
+        "entries": entries,
+        "by_ticker": by_ticker,
+        "keys": keys,
+        "ids": np.array(ids, dtype=np.int32),
+        **spans,
+    }
+
+
+def _ids(index: dict, table: str, key: str) -> list:
+    span = index[table].get(key)
+    return index["ids"][span[0] : span[1]].tolist() if span else []
+
+
+def _count(index: dict, table: str, key: str) -> int:
+    span = index[table].get(key)
+    return span[1] - span[0] if span else 0
+
+
+def build_from_frames(snapshot_df, profile_df=None) -> dict:
+    """
+    최신 거래일 스냅샷(시가총액 내림차순) + profile(ticker index)으로 인덱스 생성
+    스냅샷에 없는 profile ticker는 이름 없이 뒤에 추가
+    """
+    companies = []
+    if snapshot_df is not None and len(snapshot_df) > 0:
+        def column(name):
+            if name not in snapshot_df.columns:
+                return [None] * len(snapshot_df)
+            return [None if v is None or v != v else str(v) for v in snapshot_df[name].astype(object)]
+
+        companies.extend(zip(column("ticker"), column("name"), column("market")))
+    if profile_df is not None:
+        companies.extend((str(t), None, None) for t in profile_df.index)
+    return build_search_index(companies)
+
+
+def search(index: dict, query: str, limit: int = 10, market: str = None) -> list:
+    """
+    검색어 → [{"ticker", "name", "market"}]
+    정확히 일치 → 접두어 일치 → 중간 일치 순, 같은 그룹 안에서는 시가총액 순
+    검색어에 초성(ㄱ~ㅎ)이 있으면 초성으로 비교 ("ㅅㅅ", "삼ㅅ" → 삼성…)
+    """
+    q = normalize(query)
+    if not q or index is None:
+        return []
+    if _has_chosung(q):
+        q = chosung(q)
+
+    entries, keys = index["entries"], index["keys"]
+    market = market.upper() if market else None
+    found, seen = [], set()
+
+    def collect(ids, check=None):
+        for entry_id in ids:
+            if len(found) >= limit:
+                return
+            if entry_id in seen:
+                continue
+            if market and entries[entry_id]["market"] != market:
+                continue
+            if check and not check(keys[entry_id]):
+                continue
+            seen.add(entry_id)
+            found.append(entry_id)
+
+    # 1) 정확히 일치 (ticker / 회사명)
+    collect(_ids(index, "exact", q))
+    # 2) 접두어
+    if len(q) <= MAX_PREFIX:
+        collect(_ids(index, "prefixes", q))
+    else:
+        candidates = _ids(index, "prefixes", q[:MAX_PREFIX])
+        collect(candidates, lambda key: any(k.startswith(q) for k in key))
+    # 3) 중간 일치 (가장 드문 2-gram의 후보 → 부분 문자열 확인)
+    if len(q) >= 2 and len(found) < limit:
+        grams = sorted(_bigrams(q), key=lambda g: _count(index, "ngrams", g))
+        candidates = _ids(index, "ngrams", grams[0])
+        collect(candidates, lambda key: q in key[1] or q in key[2])
+
+    return [entries[i] for i in found]
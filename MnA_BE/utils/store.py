@@ -1,38 +1,430 @@
-from django.core.cache import cache
-from multiprocessing import shared_memory
-import pickle
+from contextlib import contextmanager
+from multiprocessing import shared_memory, resource_tracker
+import pandas as pd
+import pyarrow as pa
+import atexit, gc, json, os, pickle, secrets, struct, tempfile, threading, weakref
+
+try:
+    import fcntl
+except ImportError:  # Windows (개발 환경): 단일 프로세스로 간주
+    fcntl = None
+
+STORE_NAMESPACE = os.getenv("STORE_NAMESPACE", "mna")
+STORE_REGISTRY_PATH = os.getenv(
+    "STORE_REGISTRY_PATH", os.path.join(tempfile.gettempdir(), f"{STORE_NAMESPACE}_store.json")
+)
+
+
+def _to_arrow_table(df: pd.DataFrame) -> pa.Table:
+    """
+    DataFrame → Arrow Table
+    float 컬럼은 NaN을 null로 바꾸지 않고 그대로 둔다 (읽을 때 복사 없이 numpy로 매핑되도록)
+    """
+    table = pa.Table.from_pandas(df)
+    for name in df.columns:
+        if df[name].dtype.kind == "f":
+            i = table.schema.get_field_index(str(name))
+            table = table.set_column(i, table.field(i), pa.array(df[name].to_numpy()))
+    return table
+
+
+def _untrack(shm):
+    """
+    segment 해제는 registry가 관리하므로 resource_tracker 등록 해제
+    (그대로 두면 만든/연결한 프로세스가 종료될 때 다른 worker가 쓰는 segment까지 unlink됨)
+    """
+    try:
+        resource_tracker.unregister(shm._name, "shared_memory")
+    except Exception:
+        pass
+    return shm
+
+
+def _write_arrow(df: pd.DataFrame, name=None):
+    """
+    Arrow IPC(File) 포맷으로 shared memory에 직접 기록
+    """
+    table = _to_arrow_table(df)
+
+    mock = pa.MockOutputStream()
+    with pa.ipc.new_file(mock, table.schema) as writer:
+        writer.write_table(table)
+    size = mock.size()
+
+    shm = _untrack(shared_memory.SharedMemory(name=name, create=True, size=size))
+    sink = pa.FixedSizeBufferWriter(pa.py_buffer(shm.buf))
+    with pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    return shm, size
+
+
+# out-of-band 버퍼 시작 위치 정렬 (numpy 배열 정렬 요구 충족)
+BUFFER_ALIGN = 64
+
+
+def _write_pickle(value, name=None):
+    """
+    pickle protocol 5로 기록: 연속 numpy 배열(DataFrame 블록 포함)의 데이터는 out-of-band 버퍼로
+    분리해 segment에 그대로 복사 → 읽는 쪽은 segment를 참조하는 배열을 받음 (복사 없음)
+    dict/list/str 등 나머지 객체만 pickle 본문으로 역직렬화
+
+    layout: [버퍼 수 n] [(offset, length) × (본문 + n)] [본문] [버퍼 ...] (각각 64바이트 정렬)
+    """
+    buffers = []
+    body = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+    parts = [memoryview(body)] + [buffer.raw() for buffer in buffers]
+
+    spans = []
+    offset = struct.calcsize(f"<{1 + 2 * len(parts)}Q")
+    for part in parts:
+        offset = -(-offset // BUFFER_ALIGN) * BUFFER_ALIGN
+        spans.append((offset, part.nbytes))
+        offset += part.nbytes
+
+    shm = _untrack(shared_memory.SharedMemory(name=name, create=True, size=offset))
+    struct.pack_into(
+        f"<{1 + 2 * len(parts)}Q", shm.buf, 0, len(buffers), *(n for span in spans for n in span)
+    )
+    for (start, length), part in zip(spans, parts):
+        shm.buf[start:start + length] = part
+
+    return shm, offset
+
+
+def _read(shm, size: int, fmt: str):
+    """
+    arrow: shared memory를 읽기 전용으로 매핑 (숫자 컬럼은 복사/역직렬화 없이 참조)
+    pickle: 본문만 역직렬화, numpy 배열은 segment의 out-of-band 버퍼를 읽기 전용으로 참조
+    """
+    buf = shm.buf[:size].toreadonly()
+
+    if fmt == "arrow":
+        table = pa.ipc.open_file(pa.py_buffer(buf)).read_all()
+        return table.to_pandas(split_blocks=True)
+
+    (count,) = struct.unpack_from("<Q", buf, 0)
+    spans = struct.unpack_from(f"<{2 * (count + 1)}Q", buf, 8)
+    parts = [buf[spans[i]:spans[i] + spans[i + 1]] for i in range(0, len(spans), 2)]
+    return pickle.loads(parts[0], buffers=parts[1:])
+
+
+def _unlink(name: str):
+    try:
+        shm = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+    # unlink()가 resource_tracker 등록 해제를 하므로 등록 상태를 맞춰 둔다
+    resource_tracker.register(shm._name, "shared_memory")
+    shm.close()
+    shm.unlink()
+
+
+def _detach(shm):
+    """
+    아직 DataFrame이 참조 중인 segment를 close 대상에서 뺌
+    (매핑은 마지막 참조가 사라질 때 해제, SharedMemory.__del__이 BufferError를 출력하지 않음)
+    """
+    shm._buf = None
+    shm._mmap = None
+    if getattr(shm, "_fd", -1) >= 0:
+        os.close(shm._fd)
+        shm._fd = -1
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+# fork된 worker가 부모의 로컬 상태를 이어받지 않도록 after_in_child에서 초기화
+_stores = weakref.WeakSet()
+
+
+def _reset_after_fork():
+    for store in list(_stores):
+        store._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
 
 
 class Store:
-    __key = None
-    __data = dict()
+    """
+    프로세스 간 공유 데이터 저장소
+    - 값은 shared memory segment에 저장 (DataFrame: Arrow IPC, 그 외: pickle)
+    - pickle 값 안의 numpy 배열(ticker_index order, 스크리너 숫자/범주 코드, 스냅샷 DataFrame
+      블록, 검색 인덱스 id 배열)은 out-of-band 버퍼로 segment를 직접 참조 → worker 간 공유
+      dict/list/str(ticker 구간 dict, 스크리너 응답 rows, 검색 키/entries)은 Python 객체로만
+      조회할 수 있어 worker마다 역직렬화 (버전이 바뀔 때 한 번, 수 MB 이하)
+    - 어떤 segment가 최신인지는 파일 registry(JSON)에 기록 → 모든 worker가 같은 버전을 봄
+    - segment 이름에 버전을 붙이고, 교체된 segment는 참조하는 프로세스가 없어지면 unlink
+
+    registry 형식:
+        {
+            "keys": { key: {"name", "size", "format", "version"} },
+            "segments": { name: {"holders": ["pid:store_id", ...], "retired": bool} }
+        }
+    """
+
+    def __init__(self, registry_path: str = STORE_REGISTRY_PATH, namespace: str = STORE_NAMESPACE):
+        self.registry_path = registry_path
+        self.namespace = namespace
+
+        self.__data = dict()
+        self.__versions = dict()
+        # 매핑된 데이터가 참조 중인 segment (닫히지 않도록 보관)
+        self.__segments = dict()
+        # 교체됐지만 아직 참조가 남아 close 하지 못한 segment
+        self.__closing = []
+
+        self.__registry = None
+        self.__registry_stat = None
+        self.__lock = threading.Lock()
+
+        _stores.add(self)
+
+    @property
+    def holder_id(self) -> str:
+        """registry에 기록하는 참조 id (fork 후에도 현재 pid 기준)"""
+        return f"{os.getpid()}:{id(self)}"
+
+    def _after_fork(self):
+        """
+        fork된 자식: 부모가 연결한 segment 참조는 registry상 부모 것이므로 로컬 상태만 비움
+        (다음 get_many에서 자식 pid로 다시 연결)
+        """
+        self.__lock = threading.Lock()
+        self.__registry = None
+        self.__registry_stat = None
+        self._drop_local()
+
+    def _drop_local(self):
+        """
+        이 저장소의 DataFrame 참조를 끊은 뒤 segment close, 밖에서 아직 쓰는 segment는 떼어 둠
+        """
+        self.__data.clear()
+        self.__versions.clear()
+        gc.collect()
+        for shm in [*self.__segments.values(), *self.__closing]:
+            try:
+                shm.close()
+            except BufferError:
+                _detach(shm)
+        self.__segments.clear()
+        self.__closing = []
+
+    # --- registry ---
+
+    @contextmanager
+    def _locked(self):
+        with self.__lock, open(f"{self.registry_path}.lock", "a") as lock_file:
+            if fcntl: fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl: fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _load_registry(self) -> dict:
+        try:
+            with open(self.registry_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {"keys": {}, "segments": {}}
+
+    def _save_registry(self, registry: dict):
+        # 임시 파일에 쓴 뒤 rename → 읽는 쪽은 항상 완전한 파일만 봄
+        directory = os.path.dirname(self.registry_path) or "."
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".store-", suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(registry, f)
+        os.replace(tmp_path, self.registry_path)
+
+    def _snapshot(self):
+        """
+        registry의 최신 key 목록 (파일이 바뀌었을 때만 다시 읽음), 파일이 없으면 None
+        """
+        try:
+            st = os.stat(self.registry_path)
+            stat = (st.st_mtime_ns, st.st_size, st.st_ino)
+        except FileNotFoundError:
+            return None
+
+        if stat != self.__registry_stat:
+            self.__registry = self._load_registry()
+            self.__registry_stat = stat
+
+        return self.__registry["keys"]
+
+    def _collect(self, registry: dict):
+        """
+        종료된 프로세스의 참조를 정리하고, 교체된 segment 중 참조가 없는 것을 unlink
+        """
+        for name, segment in list(registry["segments"].items()):
+            segment["holders"] = [
+                h for h in segment["holders"] if _pid_alive(int(h.split(":")[0]))
+            ]
+            if segment["retired"] and not segment["holders"]:
+                _unlink(name)
+                del registry["segments"][name]
+
+    def _release(self, registry: dict, name):
+        """segment에 대한 이 프로세스의 참조 반환"""
+        segment = registry["segments"].get(name)
+        if segment is not None:
+            segment["holders"] = [h for h in segment["holders"] if h != self.holder_id]
+
+    def _swap_local(self, key: str, entry: dict, shm, value):
+        """
+        이 프로세스의 데이터를 새 버전으로 교체하고 이전 segment 참조를 반환
+        """
+        old_shm = self.__segments.get(key)
 
-    def set_data(self, key: str, value):
         self.__data[key] = value
+        self.__segments[key] = shm
+        self.__versions[key] = entry["version"]
+
+        if old_shm is not None:
+            self.__closing.append(old_shm)
+        self._close_released()
+
+        return old_shm.name if old_shm is not None else None
+
+    def _close_released(self):
+        """이전 버전 DataFrame이 모두 해제된 segment만 close"""
+        still_open = []
+        for shm in self.__closing:
+            try:
+                shm.close()
+            except BufferError:
+                still_open.append(shm)
+        self.__closing = still_open
 
-        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    # --- public ---
 
-        # reset memory
-        shm_name = cache.get(f"{key}_shm_name")
-        if shm_name is not None: shared_memory.SharedMemory(shm_name).close()
+    def _write(self, key: str, value, version: int):
+        """
+        새 segment에 값 기록 → (registry entry, shm, 이 프로세스가 사용할 값)
+        """
+        name = f"{self.namespace}_{key}_v{version}_{secrets.token_hex(3)}"
 
-        shm = shared_memory.SharedMemory(create=True, size=len(blob))
-        shm.buf[:len(blob)] = blob
+        fmt = "pickle"
+        if isinstance(value, pd.DataFrame):
+            try:
+                shm, size = _write_arrow(value, name)
+                fmt = "arrow"
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                pass  # Arrow로 표현할 수 없는 컬럼이 있으면 pickle 사용
 
-        cache.set(f"{key}_shm_name", shm.name, timeout=None)
-        cache.set(f"{key}_shm_len", len(blob), timeout=None)
+        if fmt == "arrow":
+            # 이 프로세스도 shared memory를 매핑한 버전을 사용 (원본 사본 해제)
+            value = _read(shm, size, fmt)
+        else:
+            shm, size = _write_pickle(value, name)
+
+        return {"name": name, "size": size, "format": fmt, "version": version}, shm, value
+
+    def set_data(self, key: str, value):
+        self.set_many({key: value})
+
+    def set_many(self, values: dict):
+        """
+        여러 key를 한 번에 교체
+        segment는 모두 먼저 기록하고 registry는 한 번만 갱신 → registry의 어느 시점을 읽어도
+        이전 버전 묶음 또는 새 버전 묶음만 있음
+        함께 쓰는 key(instant_df와 파생 인덱스 등)는 get_many로 같은 시점에서 읽어야 함
+        """
+        with self._locked():
+            current = self._load_registry()["keys"]
+            versions = {key: (current[key]["version"] if key in current else 0) + 1 for key in values}
+
+        prepared = {key: self._write(key, value, versions[key]) for key, value in values.items()}
+
+        # registry 교체 (원자적)
+        with self._locked():
+            registry = self._load_registry()
+
+            for key, (entry, shm, value) in prepared.items():
+                previous = registry["keys"].get(key)
+                if previous is not None and previous["version"] >= entry["version"]:
+                    entry["version"] = previous["version"] + 1
+
+                registry["keys"][key] = entry
+                registry["segments"][entry["name"]] = {"holders": [self.holder_id], "retired": False}
+                if previous is not None and previous["name"] in registry["segments"]:
+                    registry["segments"][previous["name"]]["retired"] = True
+
+                self._release(registry, self._swap_local(key, entry, shm, value))
+
+            self._collect(registry)
+            self._save_registry(registry)
 
     def get_data(self, key: str):
-        if self.__data[key] is not None:
-            return self.__data[key]
+        return self.get_many([key])[0]
+
+    def get_many(self, keys):
+        """
+        여러 key를 registry 한 시점 기준으로 읽음 → 값 tuple (keys 순서)
+        set_many로 함께 교체한 key는 모두 같은 묶음 (get_data를 key마다 부르면
+        그 사이에 reload가 끝나 instant_df와 ticker_index가 서로 다른 버전일 수 있음)
+        """
+        keys = list(keys)
+        current = self._snapshot()
+        if current is None:
+            return tuple(self.__data.get(key) for key in keys)
+
+        # 이미 연결된 버전이면 lock 없이 (읽는 도중 다른 thread가 교체했으면 lock 경로로)
+        if all(key not in current or self.__versions.get(key) == current[key]["version"] for key in keys):
+            values = tuple(self.__data.get(key) for key in keys)
+            if all(key not in current or self.__versions.get(key) == current[key]["version"] for key in keys):
+                return values
+
+        # 새 버전 연결: 참조 등록과 연결을 lock 안에서 해야 그 사이 unlink되지 않음
+        with self._locked():
+            registry = self._load_registry()
+            changed = False
+
+            for key in keys:
+                entry = registry["keys"].get(key)
+                if entry is None or entry["name"] not in registry["segments"]:
+                    continue
+                if self.__versions.get(key) == entry["version"]:
+                    continue
+
+                shm = _untrack(shared_memory.SharedMemory(name=entry["name"]))
+                value = _read(shm, entry["size"], entry["format"])
+
+                registry["segments"][entry["name"]]["holders"].append(self.holder_id)
+                self._release(registry, self._swap_local(key, entry, shm, value))
+                changed = True
+
+            if changed:
+                self._collect(registry)
+                self._save_registry(registry)
+
+            return tuple(self.__data.get(key) for key in keys)
 
-        shm_name = cache.get(f"{key}_shm_name")
-        shm_len = cache.get(f"{key}_shm_len")
+    def release_all(self):
+        """
+        이 프로세스의 참조를 모두 반환 (프로세스 종료 시)
+        """
+        if not self.__segments:
+            return
 
-        shm = shared_memory.SharedMemory(name=shm_name)
-        blob = bytes(shm.buf[:shm_len])
+        with self._locked():
+            registry = self._load_registry()
+            for name in list(registry["segments"]):
+                self._release(registry, name)
+            self._collect(registry)
+            self._save_registry(registry)
 
-        self.__data[key] = pickle.loads(blob)
-        return self.__data[key]
+        self._drop_local()
 
-store = Store()
\ No newline at end of file
+store = Store()
+atexit.register(store.release_all)
@@ -0,0 +1,188 @@
+# utils/tests/test_data_watcher.py
+"""
+utils/data_watcher.py 테스트 (확인 주기, 변경 감지, 데이터 버전)
+"""
+
+from django.test import TestCase
+from unittest.mock import patch, MagicMock
+from datetime import datetime
+from zoneinfo import ZoneInfo
+import pandas as pd
+
+KST = ZoneInfo("Asia/Seoul")
+
+PROFILE_KEYS = {"kospi": "kospi.parquet", "kosdaq": "kosdaq.parquet"}
+
+
+def kst(*args):
+    return datetime(*args, tzinfo=KST)
+
+
+class NextCheckTests(TestCase):
+    """next_check: 장 마감 후 구간 / 주말 / 구간 밖"""
+
+    @patch("utils.data_watcher.INTERVAL_SECONDS", 600)
+    def test_inside_window_polls_interval(self):
+        from utils.data_watcher import next_check
+
+        # 2025-11-20 (목) 16:00
+        self.assertEqual(next_check(kst(2025, 11, 20, 16, 0)), kst(2025, 11, 20, 16, 10))
+
+    @patch("utils.data_watcher.IDLE_SECONDS", 3600)
+    def test_before_close_waits_for_window(self):
+        """장중에는 구간 시작(15:40)까지 (IDLE_SECONDS를 넘지 않음)"""
+        from utils.data_watcher import next_check
+
+        self.assertEqual(next_check(kst(2025, 11, 20, 15, 0)), kst(2025, 11, 20, 15, 40))
+        self.assertEqual(next_check(kst(2025, 11, 20, 10, 0)), kst(2025, 11, 20, 11, 0))
+
+    @patch("utils.data_watcher.IDLE_SECONDS", 7 * 24 * 3600)
+    def test_weekend_skips_to_monday(self):
+        """금요일 구간 이후 → 월요일 15:40"""
+        from utils.data_watcher import next_check
+
+        self.assertEqual(next_check(kst(2025, 11, 22, 12, 0)), kst(2025, 11, 24, 15, 40))
+
+    def test_utc_input_converted(self):
+        """UTC 시각도 KST 기준으로 판단 (07:00 UTC = 16:00 KST)"""
+        from utils.data_watcher import in_window
+        from datetime import timezone
+
+        self.assertTrue(in_window(datetime(2025, 11, 20, 7, 0, tzinfo=timezone.utc)))
+        self.assertFalse(in_window(datetime(2025, 11, 22, 7, 0, tzinfo=timezone.utc)))
+
+
+class PendingChangesTests(TestCase):
+    """pending_changes / check_once"""
+
+    def make_store(self, **data):
+        fake = MagicMock()
+        fake.get_data.side_effect = data.get
+        return fake
+
+    def make_version(self, llm_output="llm_output/a.json@\"1\""):
+        return {
+            "id": "abc",
+            "sources": {"instant": "2025-11-20", "profile": PROFILE_KEYS, "llm_output": llm_output},
+            "loaded_at": "2025-11-20T16:00:00",
+        }
+
+    def patched(self, version, partitions=(), profile_keys=PROFILE_KEYS, llm_output="llm_output/a.json@\"1\""):
+        from utils import data_watcher
+
+        instant_df = pd.DataFrame({"date": [pd.Timestamp("2025-11-20")]})
+        data = {"instant_df": instant_df}
+        if version is not None:
+            data["data_version"] = version
+        fake_store = self.make_store(**data)
+
+        return [
+            patch.object(data_watcher, "store", fake_store),
+            patch.object(data_watcher.instant_data, "store", fake_store),
+            patch.object(data_watcher.instant_data, "find_new_partitions", return_value=list(partitions)),
+            patch.object(data_watcher.instant_data, "_latest_profile_keys", return_value=profile_keys),
+            patch.object(data_watcher.instant_data, "llm_output_version", return_value=llm_output),
+        ]
+
+    def run_pending(self, *patches):
+        from utils.data_watcher import pending_changes
+
+        for p in patches:
+            p.start()
+        try:
+            return pending_changes(MagicMock())
+        finally:
+            for p in patches:
+                p.stop()
+
+    def test_no_changes(self):
+        self.assertEqual(self.run_pending(*self.patched(self.make_version())), set())
+
+    def test_new_partition(self):
+        partitions = [(pd.Timestamp("2025-11-21"), {})]
+        self.assertEqual(
+            self.run_pending(*self.patched(self.make_version(), partitions=partitions)), {"instant"}
+        )
+
+    def test_profile_and_llm_output(self):
+        changes = self.run_pending(
+            *self.patched(
+                self.make_version(),
+                profile_keys={"kospi": "new.parquet", "kosdaq": "kosdaq.parquet"},
+                llm_output="llm_output/b.json@\"2\"",
+            )
+        )
+        self.assertEqual(changes, {"profile", "llm_output"})
+
+    def test_failed_lookup_is_not_a_change(self):
+        """S3 조회 실패는 변경으로 보지 않고 그 원본만 이번 확인에서 제외"""
+        from utils import data_watcher
+
+        partitions = [(pd.Timestamp("2025-11-21"), {})]
+        patches = self.patched(self.make_version(), partitions=partitions)[:3] + [
+            patch.object(
+                data_watcher.instant_data, "_latest_profile_keys", side_effect=Exception("S3 down")
+            ),
+        ]
+        s3 = MagicMock()
+        s3.get_latest_object.side_effect = Exception("S3 down")
+
+        for p in patches:
+            p.start()
+        try:
+            changes = data_watcher.pending_changes(s3)
+        finally:
+            for p in patches:
+                p.stop()
+
+        self.assertEqual(changes, {"instant"})
+
+    def test_not_loaded_yet(self):
+        """데이터 버전이 없으면 (시작 시 로드 실패) 전부 다시 로드"""
+        self.assertEqual(
+            self.run_pending(*self.patched(None)), {"instant", "profile", "llm_output"}
+        )
+
+    def test_check_once_reloads_only_on_change(self):
+        from utils import data_watcher
+
+        with patch.object(data_watcher, "FinanceBucket"), \
+                patch.object(data_watcher, "pending_changes", return_value=set()), \
+                patch.object(data_watcher.instant_data, "reload") as reload:
+            data_watcher.check_once()
+        reload.assert_not_called()
+
+        with patch.object(data_watcher, "FinanceBucket"), \
+                patch.object(data_watcher, "pending_changes", return_value={"instant"}), \
+                patch.object(data_watcher.instant_data, "reload") as reload:
+            self.assertEqual(data_watcher.check_once(), {"instant"})
+        reload.assert_called_once_with()
+
+
+class DataVersionTests(TestCase):
+    """make_data_version / llm_output_version"""
+
+    def test_id_depends_only_on_sources(self):
+        from utils.instant_data import make_data_version
+
+        sources = {"instant": "2025-11-20", "profile": PROFILE_KEYS, "llm_output": None}
+
+        a = make_data_version(sources)
+        b = make_data_version(dict(reversed(list(sources.items()))))
+        c = make_data_version({**sources, "instant": "2025-11-21"})
+
+        self.assertEqual(a["id"], b["id"])
+        self.assertNotEqual(a["id"], c["id"])
+        self.assertEqual(a["sources"], sources)
+
+    def test_llm_output_version(self):
+        from utils.instant_data import llm_output_version
+
+        s3 = MagicMock()
+        s3.get_latest_object.return_value = {"Key": "llm_output/x.json", "ETag": '"e1"'}
+        self.assertEqual(llm_output_version(s3), 'llm_output/x.json@"e1"')
+
+        s3.get_latest_object.side_effect = Exception("S3 down")
+        self.assertIsNone(llm_output_version(s3))
+        with self.assertRaises(Exception):
+            llm_output_version(s3, strict=True)
@@ -0,0 +1,104 @@
+# utils/tests/test_fast_json.py
+"""
+utils/fast_json.py 테스트
+"""
+
+from django.test import SimpleTestCase
+from django.http import JsonResponse
+from unittest.mock import patch
+import datetime as dt
+import json
+import numpy as np
+import pandas as pd
+
+
+def sample():
+    return {
+        "nan": float("nan"),
+        "np_nan": np.float64("nan"),
+        "inf": float("inf"),
+        "int": np.int64(3),
+        "float32": np.float32(1.5),
+        "bool": np.bool_(True),
+        "array": np.array([1.0, np.nan]),
+        "timestamp": pd.Timestamp("2025-01-02"),
+        "nat": pd.NaT,
+        "na": pd.NA,
+        "datetime": dt.datetime(2025, 1, 1, 9, 30, tzinfo=dt.timezone.utc),
+        "date": dt.date(2025, 1, 1),
+        "name": "삼성전자",
+        "nested": [{"v": float("nan")}],
+    }
+
+
+EXPECTED = {
+    "nan": None,
+    "np_nan": None,
+    "inf": None,
+    "int": 3,
+    "float32": 1.5,
+    "bool": True,
+    "array": [1.0, None],
+    "timestamp": "2025-01-02T00:00:00",
+    "nat": None,
+    "na": None,
+    "datetime": "2025-01-01T09:30:00Z",
+    "date": "2025-01-01",
+    "name": "삼성전자",
+    "nested": [{"v": None}],
+}
+
+
+class FastJsonTests(SimpleTestCase):
+    """dumps / FastJsonResponse 테스트"""
+
+    def test_dumps(self):
+        """NumPy, NaN, datetime 변환"""
+        from utils.fast_json import dumps
+
+        self.assertEqual(json.loads(dumps(sample())), EXPECTED)
+
+    def test_stdlib_fallback_same_output(self):
+        """orjson이 없어도 같은 결과"""
+        from utils import fast_json
+
+        with patch.object(fast_json, "orjson", None):
+            body = fast_json.dumps(sample())
+
+        self.assertEqual(json.loads(body), EXPECTED)
+
+    def test_utf8_without_escape(self):
+        """한글은 \\u 이스케이프 없이 UTF-8"""
+        from utils.fast_json import dumps
+
+        self.assertIn("삼성전자".encode("utf-8"), dumps({"name": "삼성전자"}))
+
+    def test_response(self):
+        """JsonResponse와 같은 인터페이스"""
+        from utils.fast_json import FastJsonResponse
+
+        response = FastJsonResponse({"a": np.int64(1)}, status=201)
+
+        self.assertIsInstance(response, JsonResponse)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(json.loads(response.content), {"a": 1})
+
+    def test_safe(self):
+        """dict가 아니면 safe=False 필요"""
+        from utils.fast_json import FastJsonResponse
+
+        with self.assertRaises(TypeError):
+            FastJsonResponse([1, 2])
+        self.assertEqual(json.loads(FastJsonResponse([1, 2], safe=False).content), [1, 2])
+
+    def test_ok_uses_fast_encoder(self):
+        """ok / degraded 응답도 NaN → null"""
+        from utils.for_api import ok, degraded
+
+        body = json.loads(ok({"value": np.float64("nan")}).content)
+        self.assertIsNone(body["value"])
+        self.assertIn("asOf", body)
+
+        body = json.loads(degraded("S3 down", source="s3").content)
+        self.assertTrue(body["degraded"])
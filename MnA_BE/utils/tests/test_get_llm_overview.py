@@ -0,0 +1,176 @@
+# utils/tests/test_get_llm_overview.py
+"""
+utils/get_llm_overview.py 캐시 테스트
+"""
+
+from django.test import TestCase
+from unittest.mock import patch, MagicMock
+from datetime import datetime, timezone
+import json
+
+
+def make_bucket(etag='"v1"', payload=None):
+    """최신 객체/JSON을 돌려주는 FinanceBucket mock"""
+    from S3.base import BaseBucket
+
+    s3 = MagicMock()
+    s3.get_latest_object.return_value = {
+        "Key": "llm_output/company-overview/year=2025/month=11/2025-11-20.json",
+        "ETag": etag,
+        "LastModified": datetime(2025, 11, 20, tzinfo=timezone.utc),
+    }
+    s3.source_date.side_effect = BaseBucket.source_date
+    s3.get_json.return_value = payload or {"005930": json.dumps({"label": "buy"})}
+    return s3
+
+
+class OverviewCacheTests(TestCase):
+    """get_latest_overview / get_overview_items 테스트"""
+
+    def setUp(self):
+        from utils import get_llm_overview
+
+        get_llm_overview.clear_overview_cache()
+
+    @patch("utils.get_llm_overview.FinanceBucket")
+    def test_items_are_decoded(self, mock_bucket):
+        """ticker별 JSON 문자열이 dict로 변환됨"""
+        from utils.get_llm_overview import get_overview_items
+
+        mock_bucket.return_value = make_bucket()
+
+        items = get_overview_items("company-overview")
+
+        self.assertEqual(items["005930"], {"label": "buy"})
+        mock_bucket.return_value.get_json.assert_called_once_with(
+            key="llm_output/company-overview/year=2025/month=11/2025-11-20.json"
+        )
+
+    @patch("utils.get_llm_overview.FinanceBucket")
+    def test_no_s3_call_within_ttl(self, mock_bucket):
+        """TTL 안에서는 S3를 다시 조회하지 않음"""
+        from utils.get_llm_overview import get_overview_items
+
+        mock_bucket.return_value = make_bucket()
+
+        get_overview_items("company-overview")
+        get_overview_items("company-overview")
+
+        self.assertEqual(mock_bucket.return_value.get_latest_object.call_count, 1)
+
+    @patch("utils.get_llm_overview.FinanceBucket")
+    def test_same_etag_skips_download(self, mock_bucket):
+        """ETag가 같으면 재검증만 하고 다시 다운로드하지 않음"""
+        from utils import get_llm_overview
+
+        mock_bucket.return_value = make_bucket()
+
+        get_llm_overview.get_overview_items("company-overview")
+        get_llm_overview.refresh("company-overview")
+
+        self.assertEqual(mock_bucket.return_value.get_latest_object.call_count, 2)
+        self.assertEqual(mock_bucket.return_value.get_json.call_count, 1)
+
+    @patch("utils.get_llm_overview.FinanceBucket")
+    def test_new_etag_reloads(self, mock_bucket):
+        """ETag가 바뀌면 새로 다운로드"""
+        from utils import get_llm_overview
+
+        mock_bucket.return_value = make_bucket(etag='"v1"')
+        get_llm_overview.get_overview_items("company-overview")
+
+        mock_bucket.return_value = make_bucket(
+            etag='"v2"', payload={"005930": json.dumps({"label": "sell"})}
+        )
+        get_llm_overview.refresh("company-overview")
+        items = get_llm_overview.get_overview_items("company-overview")
+
+        self.assertEqual(items["005930"], {"label": "sell"})
+
+    @patch("utils.get_llm_overview.OVERVIEW_TTL_SECONDS", 0)
+    @patch("utils.get_llm_overview.FinanceBucket")
+    def test_expired_revalidates_in_background(self, mock_bucket):
+        """TTL이 지나면 이전 값을 바로 반환하고 백그라운드에서 재확인 (다른 sector는 기다리지 않음)"""
+        import threading
+        from utils import get_llm_overview
+
+        mock_bucket.return_value = make_bucket(etag='"v1"')
+        get_llm_overview.get_overview_items("company-overview")
+
+        release = threading.Event()
+        slow = make_bucket(etag='"v2"', payload={"005930": json.dumps({"label": "sell"})})
+        latest = slow.get_latest_object.return_value
+        slow.get_latest_object.side_effect = lambda prefix: release.wait(5) and latest
+        mock_bucket.return_value = slow
+
+        # 재확인이 S3에서 멈춰 있어도 요청은 이전 값으로 바로 응답
+        items = get_llm_overview.get_overview_items("company-overview")
+        self.assertEqual(items["005930"], {"label": "buy"})
+
+        release.set()
+        for thread in threading.enumerate():
+            if thread.name.startswith("llm-overview-refresh"):
+                thread.join(5)
+
+        items = get_llm_overview.get_overview_items("company-overview")
+        self.assertEqual(items["005930"], {"label": "sell"})
+        self.assertEqual(slow.get_json.call_count, 1)
+
+    @patch("utils.get_llm_overview.FinanceBucket")
+    def test_serves_stale_on_s3_error(self, mock_bucket):
+        """재검증 중 S3 오류가 나면 이전 값을 그대로 사용"""
+        from utils import get_llm_overview
+
+        mock_bucket.return_value = make_bucket()
+        get_llm_overview.get_overview_items("company-overview")
+
+        mock_bucket.return_value.get_latest_object.side_effect = Exception("S3 down")
+        get_llm_overview.refresh("company-overview")
+        items = get_llm_overview.get_overview_items("company-overview")
+
+        self.assertEqual(items["005930"], {"label": "buy"})
+
+    @patch("utils.get_llm_overview.FinanceBucket")
+    def test_not_found(self, mock_bucket):
+        """객체가 없으면 404 응답 / 빈 dict"""
+        from utils.get_llm_overview import get_latest_overview, get_overview_items
+
+        s3 = make_bucket()
+        s3.get_latest_object.return_value = None
+        mock_bucket.return_value = s3
+
+        self.assertEqual(get_latest_overview("market-index-overview").status_code, 404)
+        self.assertEqual(get_overview_items("company-overview"), {})
+
+    @patch("utils.get_llm_overview.FinanceBucket")
+    def test_not_found_is_cached(self, mock_bucket):
+        """객체가 없다는 결과도 TTL 동안 캐시 (요청마다 S3 목록을 조회하지 않음)"""
+        from utils.get_llm_overview import get_overview_items
+
+        s3 = make_bucket()
+        s3.get_latest_object.return_value = None
+        mock_bucket.return_value = s3
+
+        get_overview_items("company-overview")
+        get_overview_items("company-overview")
+
+        self.assertEqual(s3.get_latest_object.call_count, 1)
+
+    @patch("utils.get_llm_overview.FinanceBucket")
+    def test_overview_version(self, mock_bucket):
+        """ETag용 식별자: 객체 key@ETag, 새 객체가 올라오면 바뀜 / 없거나 조회 실패면 None"""
+        from utils.get_llm_overview import overview_version, refresh
+
+        key = "llm_output/company-overview/year=2025/month=11/2025-11-20.json"
+        mock_bucket.return_value = make_bucket(etag='"v1"')
+        self.assertEqual(overview_version("company-overview"), f'{key}@"v1"')
+
+        mock_bucket.return_value = make_bucket(etag='"v2"')
+        refresh("company-overview")
+        self.assertEqual(overview_version("company-overview"), f'{key}@"v2"')
+
+        mock_bucket.return_value.get_latest_object.return_value = None
+        self.assertIsNone(overview_version("market-index-overview"))
+
+        mock_bucket.return_value.get_latest_object.side_effect = Exception("S3 down")
+        self.assertIsNone(overview_version("other-overview"))
@@ -0,0 +1,663 @@
+# utils/tests/test_instant_data.py
+"""
+utils/instant_data.py 테스트
+"""
+
+from django.test import TestCase
+from unittest.mock import patch, MagicMock
+from datetime import datetime, timezone
+import numpy as np
+import pandas as pd
+import json
+import threading
+
+
+def make_instant_df():
+    """(date asc, market_cap desc) 순으로 정렬된 작은 instant_df"""
+    return pd.DataFrame(
+        {
+            "date": ["2025-01-02", "2025-01-02", "2025-01-03", "2025-01-03", "2025-01-04"],
+            "ticker": ["005930", "000660", "005930", "000660", "005930"],
+            "close": [100.0, 50.0, 101.0, 51.0, 102.0],
+            "market_cap": [1000, 500, 1010, 510, 1020],
+        }
+    )
+
+
+class BuildTickerIndexTests(TestCase):
+    """build_ticker_index 테스트"""
+
+    def test_offsets_cover_each_ticker(self):
+        """ticker별 [start, end) 구간 길이가 행 수와 일치"""
+        from utils.instant_data import build_ticker_index
+
+        index = build_ticker_index(make_instant_df())
+
+        start, end = index["offsets"]["005930"]
+        self.assertEqual(end - start, 3)
+        start, end = index["offsets"]["000660"]
+        self.assertEqual(end - start, 2)
+        self.assertEqual(len(index["order"]), 5)
+
+    def test_rows_sorted_by_date_within_ticker(self):
+        """구간 내부는 date 오름차순"""
+        from utils.instant_data import build_ticker_index
+
+        df = make_instant_df().iloc[::-1].reset_index(drop=True)
+        index = build_ticker_index(df)
+
+        start, end = index["offsets"]["005930"]
+        dates = df.iloc[index["order"][start:end]]["date"].tolist()
+        self.assertEqual(dates, ["2025-01-02", "2025-01-03", "2025-01-04"])
+
+    def test_missing_ticker_rows_excluded(self):
+        """ticker가 없는 행은 인덱스에서 제외"""
+        from utils.instant_data import build_ticker_index
+
+        df = make_instant_df()
+        df.loc[1, "ticker"] = None
+        index = build_ticker_index(df)
+
+        self.assertEqual(len(index["order"]), 4)
+        self.assertEqual(index["offsets"]["000660"][1] - index["offsets"]["000660"][0], 1)
+
+
+class GetTickerHistoryTests(TestCase):
+    """get_ticker_history 테스트"""
+
+    def test_slices_with_index(self):
+        """인덱스가 있으면 오프셋으로 바로 슬라이스"""
+        from utils import instant_data
+
+        df = make_instant_df()
+        index = instant_data.build_ticker_index(df)
+
+        history = instant_data.get_ticker_history(df, "000660", index)
+
+        self.assertEqual(history["close"].tolist(), [50.0, 51.0])
+
+    def test_unknown_symbol_returns_empty(self):
+        """없는 ticker는 빈 DataFrame"""
+        from utils import instant_data
+
+        df = make_instant_df()
+        index = instant_data.build_ticker_index(df)
+
+        history = instant_data.get_ticker_history(df, "999999", index)
+
+        self.assertEqual(len(history), 0)
+        self.assertListEqual(list(history.columns), list(df.columns))
+
+    def test_falls_back_to_scan_without_index(self):
+        """인덱스가 없으면 전체 스캔 결과와 동일"""
+        from utils import instant_data
+
+        history = instant_data.get_ticker_history(make_instant_df(), "005930")
+
+        self.assertEqual(history["close"].tolist(), [100.0, 101.0, 102.0])
+
+
+class GetTickersHistoryTests(TestCase):
+    """get_tickers_history 테스트"""
+
+    def check(self, index):
+        from utils import instant_data
+
+        df = make_instant_df()
+        combined, spans = instant_data.get_tickers_history(
+            df, ["000660", "999999", "005930", "000660"], index
+        )
+
+        self.assertEqual(list(spans), ["000660", "005930"])
+        self.assertEqual(spans, {"000660": (0, 2), "005930": (2, 5)})
+        self.assertEqual(combined["close"].tolist(), [50.0, 51.0, 100.0, 101.0, 102.0])
+
+    def test_single_slice_with_index(self):
+        """요청 순서대로 ticker 구간, 없는 ticker / 중복 제외"""
+        from utils import instant_data
+
+        self.check(instant_data.build_ticker_index(make_instant_df()))
+
+    def test_falls_back_to_scan_without_index(self):
+        self.check(None)
+
+    def test_no_match(self):
+        from utils import instant_data
+
+        df = make_instant_df()
+        combined, spans = instant_data.get_tickers_history(
+            df, ["999999"], instant_data.build_ticker_index(df)
+        )
+
+        self.assertEqual((len(combined), spans), (0, {}))
+
+
+def make_daily_history():
+    """2025-01-27(월) ~ 2025-02-07(금) 10거래일, close 100 → 109 (매일 +1)"""
+    dates = pd.bdate_range("2025-01-27", "2025-02-07")
+    close = 100.0 + np.arange(len(dates))
+    return pd.DataFrame(
+        {
+            "date": dates,
+            "ticker": "005930",
+            "close": close.astype(np.float32),
+            "change": np.r_[0.0, np.ones(len(dates) - 1)].astype(np.float32),
+            "change_rate": np.float32(1.0),
+            "market_cap": (close * 10).astype(np.int64),
+        }
+    )
+
+
+class HistoryWindowTests(TestCase):
+    """history_window: 구간 자르기 / 주·월봉 집계"""
+
+    def test_daily_range_inclusive(self):
+        from utils.instant_data import history_window
+
+        window = history_window(
+            make_daily_history(), pd.Timestamp("2025-01-29"), pd.Timestamp("2025-02-03")
+        )
+
+        self.assertEqual(
+            window["date"].dt.strftime("%m-%d").tolist(), ["01-29", "01-30", "01-31", "02-03"]
+        )
+
+    def test_weekly_last_close_and_summed_change(self):
+        """주봉: 금요일 종가, 주간 change 합계, 직전 주 종가 대비 change_rate"""
+        from utils.instant_data import history_window
+
+        bars = history_window(make_daily_history(), interval="weekly")
+
+        self.assertEqual(bars["date"].dt.strftime("%m-%d").tolist(), ["01-31", "02-07"])
+        self.assertEqual(bars["close"].tolist(), [104.0, 109.0])
+        self.assertEqual(bars["change"].tolist(), [4.0, 5.0])
+        self.assertEqual(bars["change_rate"].tolist(), [4.0, 4.81])  # 4/100, 5/104
+        self.assertEqual(bars["market_cap"].tolist(), [1040, 1090])
+
+    def test_monthly_with_range(self):
+        """월봉은 잘라낸 구간 안에서 집계 (월 경계)"""
+        from utils.instant_data import history_window
+
+        bars = history_window(make_daily_history(), start=pd.Timestamp("2025-01-30"), interval="monthly")
+
+        self.assertEqual(bars["date"].dt.strftime("%m-%d").tolist(), ["01-31", "02-07"])
+        self.assertEqual(bars["change"].tolist(), [2.0, 5.0])
+
+    def test_all_missing_change_stays_missing(self):
+        from utils.instant_data import history_window
+
+        history = make_daily_history()
+        history["change"] = np.nan
+
+        bars = history_window(history, interval="weekly")
+
+        self.assertTrue(bars["change"].isna().all())
+
+    def test_empty_range(self):
+        from utils.instant_data import history_window
+
+        window = history_window(make_daily_history(), start=pd.Timestamp("2026-01-01"), interval="weekly")
+
+        self.assertEqual(len(window), 0)
+
+
+class LatestSnapshotTests(TestCase):
+    """build_latest_snapshot / get_latest_snapshot 테스트"""
+
+    def make_df(self):
+        df = make_instant_df()
+        df["market"] = ["KOSPI", "KOSDAQ", "KOSPI", "KOSDAQ", "KOSPI"]
+        df.loc[len(df)] = ["2025-01-04", "000660", 52.0, 520, "KOSDAQ"]
+        return df
+
+    def test_snapshot_per_market(self):
+        """최신일 행만 market별로 나뉨"""
+        from utils.instant_data import build_latest_snapshot
+
+        snapshot = build_latest_snapshot(self.make_df())
+
+        self.assertEqual(snapshot["date"], "2025-01-04")
+        self.assertEqual(snapshot["markets"]["ALL"]["ticker"].tolist(), ["005930", "000660"])
+        self.assertEqual(snapshot["markets"]["KOSPI"]["ticker"].tolist(), ["005930"])
+        self.assertEqual(snapshot["markets"]["KOSDAQ"]["ticker"].tolist(), ["000660"])
+
+    def test_get_latest_snapshot_unknown_market(self):
+        """없는 market은 빈 DataFrame"""
+        from utils import instant_data
+
+        df = self.make_df()
+        snapshot = instant_data.build_latest_snapshot(df)
+
+        with patch.object(instant_data.store, "get_data", return_value=snapshot):
+            df_latest, latest_date = instant_data.get_latest_snapshot(df, "NYSE")
+
+        self.assertEqual(len(df_latest), 0)
+        self.assertEqual(latest_date, "2025-01-04")
+
+    def test_get_latest_snapshot_without_stored_snapshot(self):
+        """저장된 스냅샷이 없으면 instant_df에서 계산"""
+        from utils import instant_data
+
+        with patch.object(instant_data.store, "get_data", return_value=None):
+            df_latest, _ = instant_data.get_latest_snapshot(self.make_df(), "KOSDAQ")
+
+        self.assertEqual(df_latest["ticker"].tolist(), ["000660"])
+
+
+class GetQuotesTests(TestCase):
+    """get_quotes 테스트"""
+
+    def make_df(self):
+        df = make_instant_df()
+        df["change"] = [0.0, 0.0, 1.0, 1.0, 1.0]
+        df["change_rate"] = np.array([0.0, 0.0, 1.0, 2.0, 0.99], dtype=np.float32)
+        # 000660은 최신일(2025-01-04) 데이터 없음 → 999999만 추가
+        df.loc[len(df)] = ["2025-01-04", "999999", np.nan, 10, np.nan, np.nan]
+        return df
+
+    def check(self, snapshot):
+        from utils import instant_data
+
+        with patch.object(instant_data.store, "get_data", return_value=snapshot):
+            return instant_data.get_quotes(self.make_df(), ["999999", "000660", "005930", "005930"])
+
+    def test_latest_day_quotes(self):
+        """최신 거래일에 없는 종목 제외, float32는 10진 값 그대로, 결측은 None"""
+        from utils import instant_data
+
+        quotes = self.check(instant_data.build_latest_snapshot(self.make_df()))
+
+        self.assertEqual(list(quotes), ["999999", "005930"])
+        self.assertEqual(quotes["005930"], {"price": 102.0, "change": 1.0, "change_rate": 0.99})
+        self.assertEqual(quotes["999999"], {"price": None, "change": None, "change_rate": None})
+
+    def test_without_stored_snapshot(self):
+        quotes = self.check(None)
+
+        self.assertEqual(quotes["005930"]["price"], 102.0)
+
+    def test_no_tickers(self):
+        from utils import instant_data
+
+        with patch.object(instant_data.store, "get_data", return_value=None):
+            self.assertEqual(instant_data.get_quotes(self.make_df(), []), {})
+
+
+def make_profile_bucket(instant_df, barrier=None):
+    """instant parquet / company-profile 목록·파일을 돌려주는 FinanceBucket mock"""
+
+    def wait():
+        if barrier is not None:
+            barrier.wait()
+
+    def get_latest_parquet_df(prefix):
+        wait()
+        return instant_df, "2025-01-04T00:00:00+00:00"
+
+    def get_list_v2(prefix):
+        wait()
+        return {
+            "Contents": [
+                {"Key": f"company-profile/year=2025/month={m}/market={market}/2025-0{m}-01.parquet",
+                 "LastModified": datetime(2025, m, 1, tzinfo=timezone.utc)}
+                for m in (1, 2) for market in ("kospi", "kosdaq")
+            ]
+        }
+
+    def get_dataframe(key):
+        market = "kospi" if "market=kospi" in key else "kosdaq"
+        return pd.DataFrame({"explanation": [key]}, index=[f"{market}-ticker"])
+
+    s3 = MagicMock()
+    s3.get_latest_parquet_df.side_effect = get_latest_parquet_df
+    s3.get_list_v2.side_effect = get_list_v2
+    s3.get_dataframe.side_effect = get_dataframe
+    return s3
+
+
+class LoadSourcesTests(TestCase):
+    """load_sources / init 동시 로드 테스트"""
+
+    def test_instant_and_profile_listing_run_concurrently(self):
+        """instant 다운로드와 profile 목록 조회가 동시에 진행됨 (순차면 barrier 타임아웃)"""
+        from utils.instant_data import load_sources
+
+        s3 = make_profile_bucket(make_instant_df(), barrier=threading.Barrier(2, timeout=5))
+
+        loaded = load_sources(s3)
+
+        self.assertEqual(len(loaded["instant_df"]), 5)
+        self.assertEqual(set(loaded["profiles"]), {"kospi", "kosdaq"})
+        self.assertEqual(
+            loaded["profile_keys"]["kospi"],
+            "company-profile/year=2025/month=2/market=kospi/2025-02-01.parquet",
+        )
+        self.assertTrue(
+            {"instant_download", "instant_sort", "profile_list", "profile_kospi", "profile_kosdaq"}
+            <= set(loaded["timings"])
+        )
+
+    def test_instant_sorted_by_date_and_market_cap(self):
+        """instant_df는 date 오름차순, market_cap 내림차순"""
+        from utils.instant_data import load_sources
+
+        shuffled = make_instant_df().iloc[[4, 0, 3, 1, 2]].reset_index(drop=True)
+
+        instant_df = load_sources(make_profile_bucket(shuffled))["instant_df"]
+
+        self.assertEqual(instant_df["date"].tolist(), sorted(instant_df["date"]))
+        self.assertEqual(instant_df["market_cap"].tolist()[:2], [1000, 500])
+
+    def test_init_stores_instant_and_profiles(self):
+        """init: instant_df(+인덱스)와 KOSDAQ+KOSPI profile 저장"""
+        from utils import instant_data
+
+        s3 = make_profile_bucket(make_instant_df())
+        with patch.object(instant_data, "FinanceBucket", return_value=s3), \
+                patch.object(instant_data.store, "set_many") as set_many:
+            instant_data.init()
+
+        # 한 번에 교체
+        set_many.assert_called_once()
+        stored = set_many.call_args.args[0]
+        self.assertEqual(
+            set(stored),
+            {
+                "instant_df",
+                "ticker_index",
+                "latest_snapshot",
+                "screener",
+                "profile_df",
+                "profile_keys",
+                "search_index",
+                "data_version",
+            },
+        )
+        self.assertEqual(stored["profile_df"].index.tolist(), ["kosdaq-ticker", "kospi-ticker"])
+        self.assertEqual(stored["data_version"]["sources"]["instant"], "2025-01-04")
+        self.assertIn("kospi-ticker", stored["search_index"]["by_ticker"])
+
+
+def make_daily(market, rows):
+    """price-financial-info daily partition 형식 (index = ticker)"""
+    return pd.DataFrame(
+        {
+            "close": [close for _, close, _ in rows],
+            "market_cap": [cap for _, _, cap in rows],
+            "market": market.upper(),
+        },
+        index=pd.Index([ticker for ticker, _, _ in rows], name="ticker"),
+    )
+
+
+def make_delta_bucket(daily):
+    """
+    daily: { (date, market): DataFrame }
+    get_list_v2는 월별 prefix에 해당하는 daily key만 반환
+    """
+    keys = {
+        f"price-financial-info/year={int(d[:4])}/month={int(d[5:7])}/market={m}/{d}.parquet": df
+        for (d, m), df in daily.items()
+    }
+
+    s3 = MagicMock()
+    s3.get_list_v2.side_effect = lambda prefix: {
+        "Contents": [
+            {"Key": key, "LastModified": datetime(2025, 1, 1, tzinfo=timezone.utc)}
+            for key in keys if key.startswith(prefix)
+        ]
+    }
+    s3.get_dataframe.side_effect = lambda key: keys[key]
+    return s3
+
+
+class DeltaReloadTests(TestCase):
+    """find_new_partitions / load_delta / reload 테스트"""
+
+    def make_current(self):
+        rows = []
+        for day in ("2025-01-30", "2025-01-31"):
+            rows.append(
+                pd.DataFrame(
+                    {
+                        "close": [100.0, 50.0],
+                        "market_cap": [1000, 500],
+                        "market": ["KOSPI", "KOSDAQ"],
+                        "ticker": ["005930", "035720"],
+                        "date": pd.Timestamp(day),
+                    }
+                )
+            )
+        return pd.concat(rows, ignore_index=True)
+
+    def make_store(self, **data):
+        fake = MagicMock()
+        fake.get_data.side_effect = data.get
+        fake.get_many.side_effect = lambda keys: tuple(data.get(key) for key in keys)
+        fake.set_data.side_effect = data.__setitem__
+        fake.set_many.side_effect = data.update
+        return fake, data
+
+    def test_find_new_partitions(self):
+        """이후 날짜만, 월 경계를 넘어서, 한 시장만 올라온 날짜에서 멈춤"""
+        from utils.instant_data import find_new_partitions
+
+        s3 = make_delta_bucket({
+            ("2025-01-31", "kospi"): None, ("2025-01-31", "kosdaq"): None,
+            ("2025-02-03", "kospi"): None, ("2025-02-03", "kosdaq"): None,
+            ("2025-02-04", "kospi"): None,
+            ("2025-02-05", "kospi"): None, ("2025-02-05", "kosdaq"): None,
+        })
+
+        partitions = find_new_partitions(s3, pd.Timestamp("2025-01-31"))
+
+        self.assertEqual([day for day, _ in partitions], [pd.Timestamp("2025-02-03")])
+        self.assertEqual(
+            partitions[0][1]["kosdaq"],
+            "price-financial-info/year=2025/month=2/market=kosdaq/2025-02-03.parquet",
+        )
+
+    def test_delta_appends_new_days(self):
+        """새 거래일만 붙이고 (date asc, market_cap desc) 정렬과 파생 인덱스 갱신"""
+        from utils import instant_data
+
+        s3 = make_delta_bucket({
+            ("2025-02-03", "kospi"): make_daily("kospi", [("005930", 110.0, 1100), ("000660", 90.0, "nan")]),
+            ("2025-02-03", "kosdaq"): make_daily("kosdaq", [("035720", 55.0, 2000)]),
+        })
+        fake_store, data = self.make_store(instant_df=self.make_current())
+
+        with patch.object(instant_data, "FinanceBucket", return_value=s3), \
+                patch.object(instant_data, "store", fake_store), \
+                patch.object(instant_data, "_latest_profile_keys", return_value={}):
+            instant_data.reload()
+
+        s3.get_latest_parquet_df.assert_not_called()
+        instant_df = data["instant_df"]
+        latest = instant_df[instant_df["date"] == pd.Timestamp("2025-02-03")]
+        # 결측 행("nan")은 제외, market_cap 내림차순
+        self.assertEqual(latest["ticker"].tolist(), ["035720", "005930"])
+        self.assertEqual(len(instant_df), 6)
+        self.assertEqual(list(instant_df.columns), list(self.make_current().columns))
+        self.assertEqual(data["latest_snapshot"]["date"], pd.Timestamp("2025-02-03"))
+        self.assertEqual(data["ticker_index"]["offsets"]["005930"], (0, 3))
+
+    def test_up_to_date_keeps_store(self):
+        """새 데이터가 없으면 instant_df를 다시 저장하지 않음"""
+        from utils import instant_data
+
+        current = self.make_current()
+        fake_store, data = self.make_store(instant_df=current)
+
+        with patch.object(instant_data, "FinanceBucket", return_value=make_delta_bucket({})), \
+                patch.object(instant_data, "store", fake_store), \
+                patch.object(instant_data, "_latest_profile_keys", return_value={}):
+            instant_data.reload()
+
+        self.assertIs(data["instant_df"], current)
+        self.assertNotIn("ticker_index", data)
+
+    @patch("utils.instant_data.DELTA_MAX_DAYS", 1)
+    def test_falls_back_to_full_reload(self):
+        """밀린 거래일이 많으면 전체 instant parquet 로드"""
+        from utils import instant_data
+
+        daily = {}
+        for day in ("2025-02-03", "2025-02-04"):
+            for market in ("kospi", "kosdaq"):
+                daily[(day, market)] = make_daily(market, [("005930", 1.0, 1)])
+        s3 = make_delta_bucket(daily)
+        s3.get_latest_parquet_df.return_value = (make_instant_df(), "ts")
+        fake_store, data = self.make_store(instant_df=self.make_current())
+
+        with patch.object(instant_data, "FinanceBucket", return_value=s3), \
+                patch.object(instant_data, "store", fake_store), \
+                patch.object(instant_data, "_latest_profile_keys", return_value={}):
+            instant_data.reload()
+
+        s3.get_latest_parquet_df.assert_called_once()
+        self.assertEqual(len(data["instant_df"]), 5)
+
+    def test_profiles_skipped_when_unchanged(self):
+        """최신 profile key가 같으면 다시 다운로드하지 않음"""
+        from utils import instant_data
+
+        keys = {"kospi": "kospi.parquet", "kosdaq": "kosdaq.parquet"}
+        s3 = make_delta_bucket({})
+        fake_store, _ = self.make_store(instant_df=self.make_current(), profile_keys=dict(keys))
+
+        with patch.object(instant_data, "FinanceBucket", return_value=s3), \
+                patch.object(instant_data, "store", fake_store), \
+                patch.object(instant_data, "_latest_profile_keys", return_value=keys):
+            instant_data.reload()
+
+        s3.get_dataframe.assert_not_called()
+
+    def test_reload_swaps_once_with_data_version(self):
+        """새 버전(instant + 인덱스 + 데이터 버전)을 set_many 한 번으로 교체"""
+        from utils import instant_data
+
+        s3 = make_delta_bucket({
+            ("2025-02-03", "kospi"): make_daily("kospi", [("005930", 110.0, 1100)]),
+            ("2025-02-03", "kosdaq"): make_daily("kosdaq", [("035720", 55.0, 2000)]),
+        })
+        s3.get_latest_object.return_value = {"Key": "llm_output/a.json", "ETag": '"1"'}
+        fake_store, data = self.make_store(instant_df=self.make_current())
+
+        with patch.object(instant_data, "FinanceBucket", return_value=s3), \
+                patch.object(instant_data, "store", fake_store), \
+                patch.object(instant_data, "_latest_profile_keys", return_value={}):
+            response = instant_data.reload()
+
+        fake_store.set_many.assert_called_once()
+        fake_store.set_data.assert_not_called()
+        self.assertTrue(
+            {"instant_df", "ticker_index", "latest_snapshot", "screener", "data_version"}
+            <= set(fake_store.set_many.call_args.args[0])
+        )
+        version = data["data_version"]
+        self.assertEqual(version["sources"]["instant"], "2025-02-03")
+        self.assertEqual(version["sources"]["llm_output"], 'llm_output/a.json@"1"')
+        self.assertEqual(json.loads(response.content)["data_version"], version["id"])
+
+    def test_delta_keeps_compact_dtypes(self):
+        """정규화된 instant_df에 붙여도 category/float32 dtype 유지"""
+        from utils import instant_data
+
+        current = instant_data.normalize_schema(self.make_current())
+        s3 = make_delta_bucket({
+            ("2025-02-03", "kospi"): make_daily("kospi", [("000660", 90.0, 900)]),
+            ("2025-02-03", "kosdaq"): make_daily("kosdaq", [("035720", 55.0, 2000)]),
+        })
+        fake_store, data = self.make_store(instant_df=current)
+
+        with patch.object(instant_data, "FinanceBucket", return_value=s3), \
+                patch.object(instant_data, "store", fake_store), \
+                patch.object(instant_data, "_latest_profile_keys", return_value={}):
+            instant_data.reload()
+
+        instant_df = data["instant_df"]
+        self.assertIsInstance(instant_df["ticker"].dtype, pd.CategoricalDtype)
+        self.assertIn("000660", instant_df["ticker"].cat.categories)
+        self.assertEqual(instant_df["close"].dtype, "float32")
+        self.assertEqual(instant_df["ticker"].tolist()[-2:], ["035720", "000660"])
+
+
+class NormalizeSchemaTests(TestCase):
+    """normalize_schema / float64_values 테스트"""
+
+    def make_raw(self, days=200, tickers=50):
+        """cross_to_ts2 결과처럼 문자열 위주인 instant_df"""
+        n = days * tickers
+        return pd.DataFrame(
+            {
+                "ticker": [f"{i % tickers:06d}" for i in range(n)],
+                "name": [f"회사{i % tickers}" for i in range(n)],
+                "market": ["KOSPI" if i % 2 else "KOSDAQ" for i in range(n)],
+                "industry": ["전기·전자" for _ in range(n)],
+                "close": [str(1000 + i % 7) for i in range(n)],
+                "change_rate": ["1.23"] * n,
+                "market_cap": [str(10 ** 12 + i) for i in range(n)],
+                "ROE": ["0.1234"] * n,
+                "date": pd.Timestamp("2025-01-02"),
+            }
+        )
+
+    def test_dtypes(self):
+        """문자열 → category, 지표 → float32, 시가총액 → int64"""
+        from utils.instant_data import normalize_schema
+
+        df = normalize_schema(self.make_raw(days=2, tickers=3))
+
+        self.assertIsInstance(df["ticker"].dtype, pd.CategoricalDtype)
+        self.assertIsInstance(df["industry"].dtype, pd.CategoricalDtype)
+        self.assertEqual(df["close"].dtype, "float32")
+        self.assertEqual(df["ROE"].dtype, "float32")
+        self.assertEqual(df["market_cap"].dtype, "int64")
+        self.assertEqual(df["market_cap"].iloc[0], 10 ** 12)
+        self.assertEqual(df["ticker"].iloc[1], "000001")
+
+    def test_invalid_numbers_become_nan(self):
+        """숫자가 아닌 값은 NaN, 시가총액에 결측이 있으면 float64"""
+        from utils.instant_data import normalize_schema
+
+        df = pd.DataFrame({"ROE": ["0.5", "nan", ""], "market_cap": ["1", None, "3"]})
+        df = normalize_schema(df)
+
+        self.assertEqual(df["ROE"].isna().tolist(), [False, True, True])
+        self.assertEqual(df["market_cap"].dtype, "float64")
+
+    def test_memory_reduction(self):
+        """문자열 스키마 대비 3배 이상 작음"""
+        from utils.instant_data import normalize_schema, memory_mb
+
+        raw = self.make_raw()
+        before = memory_mb(raw)
+        after = memory_mb(normalize_schema(raw.copy()))
+
+        self.assertGreater(before / after, 3)
+
+    def test_float64_values_shortest_repr(self):
+        """float32 값은 10진 표현 그대로 float64로"""
+        from utils.instant_data import float64_values
+
+        values = float64_values(pd.Series([1.23, None, 71000], dtype="float32"))
+
+        self.assertEqual(values[0], 1.23)
+        self.assertTrue(pd.isna(values[1]))
+        self.assertEqual(values[2], 71000.0)
+
+    def test_float64_values_matches_decimal_source(self):
+        """유효숫자 7자리 이하 10진 값은 그대로 복원, 1e7 이상 정수도 그대로"""
+        from utils.instant_data import float64_values
+
+        rng = np.random.default_rng(0)
+        for decimals in range(5):
+            source = np.round(rng.uniform(-1e5, 1e5, 10000), decimals)
+            source = source[np.abs(source) < 10 ** (7 - decimals)]
+            values = float64_values(pd.Series(source.astype(np.float32)))
+            with self.subTest(decimals=decimals):
+                np.testing.assert_array_equal(values, source)
+
+        source = np.array([0.0, -0.0001234, 9.99, 9_999_999.0, 16_777_215.0])
+        np.testing.assert_array_equal(float64_values(pd.Series(source, dtype="float32")), source)
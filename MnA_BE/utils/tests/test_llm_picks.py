@@ -0,0 +1,251 @@
+# utils/tests/test_llm_picks.py
+"""
+utils/llm_picks.py 캐시 테스트 (날짜별 LRU, 최신 날짜 재검증)
+"""
+
+from django.test import TestCase, RequestFactory
+from unittest.mock import patch, MagicMock
+from datetime import datetime, timezone
+import json
+
+LATEST = "llm_output/year=2025/month=11/content=top_picks/2025-11-20"
+NEXT = "llm_output/year=2025/month=11/content=top_picks/2025-11-21"
+
+
+def make_bucket(etag='"v1"', picks=None, date="2025-11-20"):
+    """최신 llm_output 객체 / top_picks JSON을 돌려주는 FinanceBucket mock"""
+    from S3.base import BaseBucket
+
+    year, month, day = date.split("-")
+    s3 = MagicMock()
+    s3.get_latest_object.return_value = {
+        "Key": f"llm_output/year={year}/month={month}/content=top_picks/{date}.json",
+        "ETag": etag,
+        "LastModified": datetime(2025, 11, 20, tzinfo=timezone.utc),
+    }
+    s3.source_date.side_effect = BaseBucket.source_date
+    s3.get_json.return_value = json.dumps(
+        {"top_picks": picks or [{"ticker": "005930", "name": "삼성전자", "reason": "HBM"}]}
+    )
+    return s3
+
+
+def tickers(llm_output):
+    return [pick["ticker"] for pick in llm_output["top_picks"]]
+
+
+class PicksCacheTests(TestCase):
+    """latest_date / get_picks / refresh 테스트"""
+
+    def setUp(self):
+        from utils import llm_picks
+
+        llm_picks.clear_picks_cache()
+        self.addCleanup(llm_picks.clear_picks_cache)
+
+    @patch("utils.llm_picks.FinanceBucket")
+    def test_parsed_once_per_date(self, mock_bucket):
+        """같은 날짜는 한 번만 다운로드/변환"""
+        from utils.llm_picks import get_picks, latest_date
+
+        mock_bucket.return_value = s3 = make_bucket()
+        parse = MagicMock(side_effect=tickers)
+
+        self.assertEqual(latest_date(), "2025-11-20")
+        self.assertEqual(get_picks("top_picks", 2025, 11, 20, parse), ["005930"])
+        self.assertEqual(get_picks("top_picks", "2025", "11", "20", parse), ["005930"])
+
+        parse.assert_called_once()
+        s3.get_json.assert_called_once_with(key=LATEST)
+        # TTL 안에서는 최신 객체도 다시 확인하지 않음
+        s3.get_latest_object.assert_called_once()
+
+    @patch("utils.llm_picks.FinanceBucket")
+    def test_refresh_preloads_new_version(self, mock_bucket):
+        """새 버전은 refresh에서 미리 로드 → 요청은 S3를 기다리지 않음, 지난 날짜는 그대로"""
+        from utils import llm_picks
+
+        mock_bucket.return_value = make_bucket(etag='"v1"')
+        llm_picks.get_picks("top_picks", 2025, 11, 20, tickers)
+        llm_picks.get_picks("top_picks", 2025, 11, 19, tickers)
+
+        mock_bucket.return_value = s3 = make_bucket(
+            etag='"v2"', picks=[{"ticker": "000660", "name": "SK하이닉스"}]
+        )
+        llm_picks.refresh()
+        s3.get_json.assert_called_once_with(key=LATEST)
+
+        s3.get_json.side_effect = Exception("S3 down")
+        self.assertEqual(llm_picks.get_picks("top_picks", 2025, 11, 20, tickers), ["000660"])
+        self.assertEqual(llm_picks.get_picks("top_picks", 2025, 11, 19, tickers), ["005930"])
+
+    @patch("utils.llm_picks.PICKS_TTL_SECONDS", 0)
+    @patch("utils.llm_picks.FinanceBucket")
+    def test_expired_revalidates_in_background(self, mock_bucket):
+        """TTL이 지나면 이전 값을 바로 반환하고 백그라운드에서 재확인"""
+        from utils import llm_picks
+
+        mock_bucket.return_value = make_bucket(etag='"v1"')
+        llm_picks.get_picks("top_picks", 2025, 11, 20, tickers)
+
+        mock_bucket.return_value = make_bucket(etag='"v2"', date="2025-11-21")
+        with patch.object(llm_picks, "_refresh_in_background") as background:
+            self.assertEqual(llm_picks.latest_date(), "2025-11-20")
+        background.assert_called_once()
+
+        llm_picks.refresh()
+        self.assertEqual(llm_picks.latest_date(), "2025-11-21")
+        self.assertIn(NEXT, llm_picks._picks_cache)
+
+    @patch("utils.llm_picks.FinanceBucket")
+    def test_serves_stale_on_s3_error(self, mock_bucket):
+        from utils import llm_picks
+
+        mock_bucket.return_value = s3 = make_bucket()
+        llm_picks.get_picks("top_picks", 2025, 11, 20, tickers)
+
+        s3.get_latest_object.side_effect = Exception("S3 down")
+        llm_picks.refresh()
+        self.assertEqual(llm_picks.latest_date(), "2025-11-20")
+        self.assertEqual(llm_picks.get_picks("top_picks", 2025, 11, 20, tickers), ["005930"])
+
+    @patch("utils.llm_picks.PICKS_CACHE_SIZE", 2)
+    @patch("utils.llm_picks.FinanceBucket")
+    def test_lru_eviction(self, mock_bucket):
+        """최근에 쓰지 않은 날짜부터 제거"""
+        from utils import llm_picks
+
+        mock_bucket.return_value = make_bucket()
+        paths = [f"llm_output/year=2025/month=10/content=top_picks/2025-10-0{d}" for d in (1, 2, 3)]
+
+        llm_picks.get_picks("top_picks", 2025, 10, 1, tickers)
+        llm_picks.get_picks("top_picks", 2025, 10, 2, tickers)
+        llm_picks.get_picks("top_picks", 2025, 10, 1, tickers)
+        llm_picks.get_picks("top_picks", 2025, 10, 3, tickers)
+
+        self.assertEqual(list(llm_picks._picks_cache), [paths[0], paths[2]])
+
+    @patch("utils.llm_picks.FinanceBucket")
+    def test_not_found(self, mock_bucket):
+        from utils.llm_picks import latest_date
+
+        mock_bucket.return_value.get_latest_object.return_value = None
+        self.assertIsNone(latest_date())
+
+    @patch("utils.llm_picks.FinanceBucket")
+    def test_latest_version(self, mock_bucket):
+        """ETag용 식별자: 최신 llm_output 객체 key@ETag, 조회 실패면 None"""
+        from utils import llm_picks
+
+        mock_bucket.return_value = make_bucket(etag='"v1"')
+        self.assertEqual(llm_picks.latest_version(), f'{LATEST}.json@"v1"')
+
+        mock_bucket.return_value = make_bucket(etag='"v2"')
+        llm_picks.refresh()
+        self.assertEqual(llm_picks.latest_version(), f'{LATEST}.json@"v2"')
+
+        llm_picks.clear_picks_cache()
+        mock_bucket.return_value.get_latest_object.side_effect = Exception("S3 down")
+        self.assertIsNone(llm_picks.latest_version())
+
+
+class GeneralRecommendationsCacheTests(TestCase):
+    """GeneralRecommendationsView: 페이지 요청은 캐시된 목록의 slice"""
+
+    def setUp(self):
+        from utils import llm_picks
+
+        llm_picks.clear_picks_cache()
+        self.addCleanup(llm_picks.clear_picks_cache)
+
+    @patch("utils.llm_picks.FinanceBucket")
+    def test_pages_share_one_download(self, mock_bucket):
+        from apps.api.recommendations.general import GeneralRecommendationsView
+
+        picks = [{"ticker": f"{i:06d}", "name": f"c{i}", "reason": f"r{i}"} for i in range(5)]
+        mock_bucket.return_value = s3 = make_bucket(picks=picks)
+        view = GeneralRecommendationsView.as_view({"get": "get"})
+
+        pages = []
+        for offset in (0, 2, 4):
+            request = RequestFactory().get("/", {"limit": 2, "offset": offset})
+            pages.append(json.loads(view(request).content))
+
+        self.assertEqual(
+            [[item["ticker"] for item in page["data"]] for page in pages],
+            [["000000", "000001"], ["000002", "000003"], ["000004"]],
+        )
+        self.assertEqual(pages[0]["data"][0]["headline"], "r0")
+        self.assertEqual(pages[0]["total"], 5)
+        s3.get_json.assert_called_once_with(key=LATEST)
+
+    @patch("utils.llm_picks.FinanceBucket")
+    def test_etag_follows_llm_output_version(self, mock_bucket):
+        """새 llm_output이 올라오면 (데이터 reload 전이라도) 이전 ETag로 304가 아님"""
+        from apps.api.recommendations.general import GeneralRecommendationsView
+        from utils import llm_picks
+
+        version = {"id": "v1", "sources": {}, "loaded_at": "2025-11-20T16:10:00"}
+        view = GeneralRecommendationsView.as_view({"get": "get"})
+
+        def get(**headers):
+            return view(RequestFactory().get("/", **headers))
+
+        mock_bucket.return_value = make_bucket(etag='"v1"')
+        with patch("decorators.data_etag.instant_data.get_data_version", return_value=version):
+            first = get()
+            same = get(HTTP_IF_NONE_MATCH=first["ETag"])
+
+            mock_bucket.return_value = make_bucket(
+                etag='"v2"', picks=[{"ticker": "000660", "name": "SK하이닉스"}]
+            )
+            llm_picks.refresh()
+            changed = get(HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(same.status_code, 304)
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed["ETag"], first["ETag"])
+        self.assertEqual(json.loads(changed.content)["data"][0]["ticker"], "000660")
+
+
+class PersonalizedIndexTests(TestCase):
+    """all_industry_picks 인덱스 / style별 병합"""
+
+    def make_index(self):
+        from apps.api.recommendations.personalized import index_industry_picks
+
+        return index_industry_picks(
+            {
+                "growth_semiconductor": [
+                    {"ticker": "005930", "name": "삼성전자", "reason": "a"},
+                    {"ticker": "000660", "name": "SK하이닉스", "reason": "b"},
+                    {"ticker": "005930", "name": "삼성전자", "reason": "dup"},
+                ],
+                "growth_battery": {"ticker": "247540", "name": "에코프로비엠", "reason": "c"},
+                "growth_ai": [{"ticker": "000660", "name": "SK하이닉스", "reason": "d"}],
+                "value_semiconductor": [],
+                "generated_at": "2025-11-20",
+            }
+        )
+
+    def test_index(self):
+        index = self.make_index()
+
+        self.assertEqual(
+            [item["headline"] for item in index["picks"]["growth_semiconductor"]], ["a", "b"]
+        )
+        self.assertEqual(index["picks"]["growth_battery"][0]["ticker"], "247540")
+        self.assertNotIn("generated_at", index["picks"])
+
+    def test_merged_in_interest_order(self):
+        from apps.api.recommendations.personalized import merged_picks
+
+        index = self.make_index()
+        merged = merged_picks(index, "growth", ["battery", "ai", "semiconductor", "unknown"])
+
+        self.assertEqual([item["ticker"] for item in merged], ["247540", "000660", "005930"])
+        # 같은 style은 같은 목록 재사용
+        self.assertIs(
+            merged_picks(index, "growth", ["battery", "ai", "semiconductor", "unknown"]), merged
+        )
+        self.assertEqual(merged_picks(index, "value", ["semiconductor"]), [])
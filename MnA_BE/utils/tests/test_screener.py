@@ -0,0 +1,106 @@
+# utils/tests/test_screener.py
+"""
+utils/screener.py 테스트 (범위/범주 필터, 정렬, 결측값)
+"""
+
+from django.test import SimpleTestCase
+import numpy as np
+import pandas as pd
+
+
+def make_snapshot():
+    """최신 거래일 스냅샷 (시가총액 내림차순, float32 지표)"""
+    df = pd.DataFrame(
+        {
+            "ticker": ["005930", "000660", "207940", "247540", "035720"],
+            "name": ["삼성전자", "SK하이닉스", "삼성바이오로직스", "에코프로비엠", "카카오"],
+            "market": ["KOSPI", "KOSPI", "KOSPI", "KOSDAQ", "KOSPI"],
+            "industry": ["반도체", "반도체", "제약", "2차전지", None],
+            "close": [70000.0, 120000.0, 800000.0, 250000.0, 50000.0],
+            "change_rate": [1.5, -0.5, 0.0, 3.2, np.nan],
+            "market_cap": [400, 90, 55, 25, 20],
+            "PER": [12.3, 8.0, 60.5, np.nan, 1.23],
+            "PBR": [1.2, 1.5, 5.0, 4.0, 1.1],
+            "ROE": [9.0, 18.0, 8.0, -2.0, 3.0],
+            "DIV": [2.5, 1.0, 0.0, 0.0, 0.1],
+        }
+    )
+    for column in ["close", "change_rate", "PER", "PBR", "ROE", "DIV"]:
+        df[column] = df[column].astype(np.float32)
+    for column in ["ticker", "name", "market", "industry"]:
+        df[column] = df[column].astype("category")
+    return df
+
+
+class ScreenerTests(SimpleTestCase):
+    def setUp(self):
+        from utils.instant_data import build_screener
+
+        self.screener = build_screener(
+            {"date": pd.Timestamp("2025-11-20"), "markets": {"ALL": make_snapshot()}}
+        )
+
+    def screen(self, **params):
+        from utils.screener import parse_screen, run_screen, page_rows
+
+        positions = run_screen(self.screener, parse_screen(params))
+        return [row["ticker"] for row in page_rows(self.screener, positions, 100, 0)]
+
+    def test_no_filter_market_cap_order(self):
+        self.assertEqual(self.screen(), ["005930", "000660", "207940", "247540", "035720"])
+
+    def test_ranges(self):
+        """양 끝 포함, 값이 없는 종목 제외"""
+        self.assertEqual(self.screen(per_max="12.3"), ["005930", "000660", "035720"])
+        self.assertEqual(self.screen(per_min="8", per_max="20", roe_min="10"), ["000660"])
+        self.assertEqual(self.screen(div_min="1", pbr_max="1.5"), ["005930", "000660"])
+
+    def test_float32_bounds_exact(self):
+        """float32 컬럼도 10진 값 그대로 비교 (1.23 <= 1.23)"""
+        self.assertEqual(self.screen(per_min="1.23", per_max="1.23"), ["035720"])
+
+    def test_categories(self):
+        self.assertEqual(self.screen(market="kosdaq"), ["247540"])
+        self.assertEqual(self.screen(market="kospi,KOSDAQ", industry="반도체"), ["005930", "000660"])
+        self.assertEqual(self.screen(industry="없는업종"), [])
+
+    def test_sort(self):
+        """정렬 값이 없는 종목은 순서와 관계없이 뒤"""
+        self.assertEqual(
+            self.screen(sort="per", order="asc"), ["035720", "000660", "005930", "207940", "247540"]
+        )
+        self.assertEqual(
+            self.screen(sort="per"), ["207940", "005930", "000660", "035720", "247540"]
+        )
+        self.assertEqual(self.screen(sort="market_cap", order="asc")[0], "035720")
+
+    def test_invalid_params(self):
+        from utils.screener import parse_screen
+
+        for params in (
+            {"per_min": "abc"},
+            {"per_min": "nan"},
+            {"roe_min": "10", "roe_max": "5"},
+            {"sort": "name"},
+            {"order": "up"},
+        ):
+            with self.subTest(params=params), self.assertRaises(ValueError):
+                parse_screen(params)
+
+    def test_rows(self):
+        """응답 행: 문자열 / float / int (결측은 None)"""
+        row = self.screener["rows"][4]
+        self.assertEqual(row["ticker"], "035720")
+        self.assertIsNone(row["industry"])
+        self.assertEqual(row["PER"], 1.23)
+        self.assertEqual(row["market_cap"], 20)
+        self.assertTrue(np.isnan(row["change_rate"]))
+
+    def test_empty_snapshot(self):
+        from utils.instant_data import build_screener
+        from utils.screener import parse_screen, run_screen
+
+        empty = build_screener(
+            {"date": pd.Timestamp("2025-11-20"), "markets": {"ALL": make_snapshot().iloc[0:0]}}
+        )
+        self.assertEqual(len(run_screen(empty, parse_screen({"per_max": "10"}))), 0)
@@ -0,0 +1,107 @@
+# utils/tests/test_search_index.py
+"""
+utils/search_index.py 테스트 (정확/접두어/중간 일치, 초성, 시장 필터)
+"""
+
+from django.test import SimpleTestCase
+import pandas as pd
+
+# 시가총액 내림차순
+COMPANIES = [
+    ("005930", "삼성전자", "KOSPI"),
+    ("000660", "SK하이닉스", "KOSPI"),
+    ("207940", "삼성바이오로직스", "KOSPI"),
+    ("247540", "에코프로비엠", "KOSDAQ"),
+    ("009150", "삼성전기", "KOSPI"),
+    ("005935", "삼성전자우", "KOSPI"),
+]
+
+
+def tickers(results):
+    return [item["ticker"] for item in results]
+
+
+class SearchIndexTests(SimpleTestCase):
+    def setUp(self):
+        from utils.search_index import build_search_index
+
+        self.index = build_search_index(COMPANIES)
+
+    def search(self, query, **kwargs):
+        from utils.search_index import search
+
+        return tickers(search(self.index, query, **kwargs))
+
+    def test_chosung(self):
+        from utils.search_index import chosung
+
+        self.assertEqual(chosung("삼성전자"), "ㅅㅅㅈㅈ")
+        self.assertEqual(chosung("sk하이닉스"), "skㅎㅇㄴㅅ")
+
+    def test_exact_name_first(self):
+        """정확히 일치하는 종목이 시가총액이 더 큰 접두어 일치보다 앞"""
+        self.assertEqual(self.search("삼성전자우"), ["005935"])
+        self.assertEqual(self.search("삼성전기")[0], "009150")
+
+    def test_prefix_in_market_cap_order(self):
+        self.assertEqual(self.search("삼성"), ["005930", "207940", "009150", "005935"])
+        self.assertEqual(self.search("삼성", limit=2), ["005930", "207940"])
+
+    def test_ticker(self):
+        self.assertEqual(self.search("0059"), ["005930", "005935"])
+        self.assertEqual(self.search("000660"), ["000660"])
+
+    def test_infix(self):
+        """중간 일치: 접두어 일치 뒤"""
+        self.assertEqual(self.search("전자"), ["005930", "005935"])
+        self.assertEqual(self.search("바이오"), ["207940"])
+        self.assertEqual(self.search("하이닉스"), ["000660"])
+
+    def test_case_and_spaces(self):
+        self.assertEqual(self.search(" sk 하이 "), ["000660"])
+
+    def test_chosung_query(self):
+        self.assertEqual(self.search("ㅅㅅㅈㅈ"), ["005930", "005935"])
+        self.assertEqual(self.search("삼ㅅㅈ"), ["005930", "009150", "005935"])
+        self.assertEqual(self.search("ㅇㅋㅍ"), ["247540"])
+
+    def test_market_filter(self):
+        self.assertEqual(self.search("ㅇ", market="kosdaq"), ["247540"])
+        self.assertEqual(self.search("에코", market="KOSPI"), [])
+
+    def test_no_match(self):
+        self.assertEqual(self.search("없는회사"), [])
+        self.assertEqual(self.search("   "), [])
+
+    def test_long_query(self):
+        """MAX_PREFIX보다 긴 검색어는 접두어 후보를 부분 문자열로 확인"""
+        from utils.search_index import build_search_index, search
+
+        index = build_search_index([("1", "가나다라마바사아자차카타파하", None)])
+        self.assertEqual(tickers(search(index, "가나다라마바사아자차카타파")), ["1"])
+        self.assertEqual(tickers(search(index, "가나다라마바사아자차카타하")), [])
+
+    def test_build_from_frames(self):
+        """스냅샷에 없는 profile 종목은 이름 없이 추가, 중복 제외"""
+        from utils.search_index import build_from_frames
+
+        snapshot = pd.DataFrame(
+            {
+                "ticker": ["005930", "000660"],
+                "name": ["삼성전자", None],
+                "market": ["KOSPI", "KOSPI"],
+            }
+        )
+        profile = pd.DataFrame({"explanation": ["a", "b"]}, index=["005930", "999999"])
+
+        index = build_from_frames(snapshot, profile)
+
+        self.assertEqual(
+            index["entries"],
+            [
+                {"ticker": "005930", "name": "삼성전자", "market": "KOSPI"},
+                {"ticker": "000660", "name": None, "market": "KOSPI"},
+                {"ticker": "999999", "name": None, "market": None},
+            ],
+        )
+        self.assertEqual(index["by_ticker"]["999999"], 2)
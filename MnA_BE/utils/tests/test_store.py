@@ -0,0 +1,301 @@
+# utils/tests/test_store.py
+"""
+utils/store.py 테스트 (Arrow IPC shared memory)
+"""
+
+from django.test import TestCase
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+
+
+def make_df():
+    return pd.DataFrame(
+        {
+            "ticker": ["005930", "000660", "035720"],
+            "close": [100.0, np.nan, 102.5],
+            "market_cap": [1000, 500, 300],
+            "market": pd.Categorical(["KOSPI", "KOSPI", "KOSDAQ"]),
+        },
+        index=pd.Index(["a", "b", "c"], name="key"),
+    )
+
+
+class ArrowSegmentTests(TestCase):
+    """_write_arrow / _read 테스트"""
+
+    def setUp(self):
+        from utils.store import _write_arrow
+
+        self.df = make_df()
+        self.shm, self.size = _write_arrow(self.df)
+
+    def tearDown(self):
+        from utils.store import _unlink
+
+        _unlink(self.shm.name)
+
+    def test_roundtrip(self):
+        """DataFrame(인덱스, NaN, categorical 포함)이 그대로 복원됨"""
+        from utils.store import _read
+
+        out = _read(self.shm, self.size, "arrow")
+
+        pd.testing.assert_frame_equal(out, self.df)
+
+    def test_numeric_columns_are_zero_copy(self):
+        """숫자 컬럼은 shared memory를 직접 참조하고 읽기 전용"""
+        from utils.store import _read
+
+        out = _read(self.shm, self.size, "arrow")
+        segment = np.frombuffer(self.shm.buf, dtype=np.uint8)
+
+        for column in ["close", "market_cap"]:
+            values = out[column].to_numpy()
+            self.assertTrue(np.shares_memory(values, segment))
+            self.assertFalse(values.flags.writeable)
+
+
+class PickleSegmentTests(TestCase):
+    """_write_pickle / _read 테스트 (numpy 배열은 out-of-band 버퍼)"""
+
+    def setUp(self):
+        from utils.store import _write_pickle
+
+        self.value = {
+            "numeric": {"PER": np.linspace(0, 1, 1000)},
+            "codes": np.arange(1000, dtype=np.int64) % 3,
+            "frame": make_df(),
+            "rows": [{"ticker": "005930"}],
+        }
+        self.shm, self.size = _write_pickle(self.value)
+
+    def tearDown(self):
+        from utils.store import _unlink
+
+        _unlink(self.shm.name)
+
+    def test_roundtrip(self):
+        from utils.store import _read
+
+        out = _read(self.shm, self.size, "pickle")
+
+        np.testing.assert_array_equal(out["numeric"]["PER"], self.value["numeric"]["PER"])
+        np.testing.assert_array_equal(out["codes"], self.value["codes"])
+        pd.testing.assert_frame_equal(out["frame"], self.value["frame"])
+        self.assertEqual(out["rows"], self.value["rows"])
+
+    def test_arrays_are_zero_copy(self):
+        """배열/DataFrame 숫자 블록은 shared memory를 직접 참조하고 읽기 전용"""
+        from utils.store import _read
+
+        out = _read(self.shm, self.size, "pickle")
+        segment = np.frombuffer(self.shm.buf, dtype=np.uint8)
+
+        for values in (out["numeric"]["PER"], out["codes"], out["frame"]["close"].to_numpy()):
+            self.assertTrue(np.shares_memory(values, segment))
+            self.assertFalse(values.flags.writeable)
+
+
+class StoreTests(TestCase):
+    """Store registry / segment 수명 관리 테스트"""
+
+    def setUp(self):
+        import tempfile
+        from utils.store import Store
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.registry_path = f"{self.tmpdir.name}/store.json"
+        # 같은 registry를 보는 두 worker
+        self.writer = Store(self.registry_path, namespace="test")
+        self.reader = Store(self.registry_path, namespace="test")
+
+    def tearDown(self):
+        from utils.store import _unlink
+
+        for name in self.writer._load_registry()["segments"]:
+            _unlink(name)
+        self.tmpdir.cleanup()
+
+    def registry(self):
+        import json
+
+        with open(self.registry_path) as f:
+            return json.load(f)
+
+    def segment_exists(self, name):
+        from utils.store import _untrack
+
+        try:
+            _untrack(shared_memory.SharedMemory(name=name)).close()
+            return True
+        except FileNotFoundError:
+            return False
+
+    def test_dataframe_stored_as_arrow(self):
+        """DataFrame은 arrow 포맷으로 저장"""
+        self.writer.set_data("test_df", make_df())
+
+        self.assertEqual(self.registry()["keys"]["test_df"]["format"], "arrow")
+        pd.testing.assert_frame_equal(self.writer.get_data("test_df"), make_df())
+
+    def test_other_worker_reads_from_segment(self):
+        """다른 worker가 registry를 통해 같은 segment를 읽음"""
+        self.writer.set_data("test_df", make_df())
+
+        pd.testing.assert_frame_equal(self.reader.get_data("test_df"), make_df())
+
+        holders = self.registry()["segments"][self.registry()["keys"]["test_df"]["name"]]
+        self.assertIn(self.reader.holder_id, holders["holders"])
+
+    def test_non_dataframe_uses_pickle(self):
+        """DataFrame이 아닌 값은 pickle"""
+        value = {"order": np.arange(3), "offsets": {"005930": (0, 3)}}
+        self.writer.set_data("test_obj", value)
+
+        self.assertEqual(self.registry()["keys"]["test_obj"]["format"], "pickle")
+        self.assertEqual(self.reader.get_data("test_obj")["offsets"], value["offsets"])
+
+    def test_reload_swaps_version_for_all_workers(self):
+        """새 버전을 쓰면 다른 worker도 다음 조회에서 새 버전을 봄"""
+        self.writer.set_data("test_obj", {"v": 1})
+        self.assertEqual(self.reader.get_data("test_obj"), {"v": 1})
+
+        self.writer.set_data("test_obj", {"v": 2})
+
+        self.assertEqual(self.registry()["keys"]["test_obj"]["version"], 2)
+        self.assertEqual(self.reader.get_data("test_obj"), {"v": 2})
+
+    def test_set_many_single_registry_swap(self):
+        """set_many: 여러 key를 registry 한 번 갱신으로 교체"""
+        from unittest.mock import patch
+
+        self.writer.set_many({"a": {"v": 1}, "b": [1]})
+
+        with patch.object(self.writer, "_save_registry", wraps=self.writer._save_registry) as save:
+            self.writer.set_many({"a": {"v": 2}, "b": [2]})
+
+        save.assert_called_once()
+        keys = self.registry()["keys"]
+        self.assertEqual((keys["a"]["version"], keys["b"]["version"]), (2, 2))
+        self.assertEqual(self.reader.get_data("a"), {"v": 2})
+        self.assertEqual(self.reader.get_data("b"), [2])
+
+    def test_get_many_reads_one_registry_snapshot(self):
+        """get_many: set_many로 함께 바꾼 key는 registry 한 시점에서 같은 묶음으로 읽음"""
+        from unittest.mock import patch
+
+        self.writer.set_many({"a": {"v": 1}, "b": [1]})
+        self.assertEqual(self.reader.get_many(["a", "b"]), ({"v": 1}, [1]))
+
+        self.writer.set_many({"a": {"v": 2}, "b": [2]})
+
+        with patch.object(self.reader, "_load_registry", wraps=self.reader._load_registry) as load:
+            self.assertEqual(self.reader.get_many(["b", "a", "never_set"]), ([2], {"v": 2}, None))
+
+        # 변경 확인 1번 + 새 버전 연결 1번 (key마다 다시 읽지 않음)
+        self.assertEqual(load.call_count, 2)
+
+        # 이미 연결된 버전은 segment를 다시 연결하지 않음
+        with patch.object(self.reader, "_save_registry") as save:
+            self.assertEqual(self.reader.get_many(["a", "b"]), ({"v": 2}, [2]))
+        save.assert_not_called()
+
+    def test_old_segment_unlinked_after_last_holder_releases(self):
+        """교체된 segment는 마지막 참조가 반환될 때 unlink"""
+        self.writer.set_data("test_obj", {"v": 1})
+        self.reader.get_data("test_obj")
+        old_name = self.registry()["keys"]["test_obj"]["name"]
+
+        self.writer.set_data("test_obj", {"v": 2})
+
+        # reader가 아직 이전 버전을 참조 중
+        self.assertTrue(self.segment_exists(old_name))
+        self.assertTrue(self.registry()["segments"][old_name]["retired"])
+
+        self.reader.get_data("test_obj")
+
+        self.assertFalse(self.segment_exists(old_name))
+        self.assertNotIn(old_name, self.registry()["segments"])
+
+    def test_dead_process_holders_are_pruned(self):
+        """종료된 프로세스의 참조는 정리되어 segment가 누적되지 않음"""
+        import json
+
+        self.writer.set_data("test_obj", {"v": 1})
+        old_name = self.registry()["keys"]["test_obj"]["name"]
+
+        registry = self.registry()
+        registry["segments"][old_name]["holders"].append("999999999:1")
+        with open(self.registry_path, "w") as f:
+            json.dump(registry, f)
+
+        self.writer.set_data("test_obj", {"v": 2})
+
+        self.assertFalse(self.segment_exists(old_name))
+
+    def test_release_all(self):
+        """release_all 후 교체된 segment는 unlink"""
+        self.writer.set_data("test_obj", {"v": 1})
+        self.reader.get_data("test_obj")
+        old_name = self.registry()["keys"]["test_obj"]["name"]
+        self.writer.set_data("test_obj", {"v": 2})
+
+        self.reader.release_all()
+
+        self.assertFalse(self.segment_exists(old_name))
+
+    def test_forked_worker_registers_own_pid(self):
+        """store를 만든 뒤 fork한 worker는 자기 pid로 참조 → 종료 후 교체된 segment는 unlink"""
+        import os
+
+        if not hasattr(os, "fork"):
+            self.skipTest("fork 미지원")
+
+        self.writer.set_data("test_obj", {"v": 1})
+        self.reader.get_data("test_obj")
+        old_name = self.registry()["keys"]["test_obj"]["name"]
+
+        pid = os.fork()
+        if pid == 0:
+            # 자식: 부모가 연결한 버전을 이어받지 않고 자기 pid로 다시 연결
+            ok = False
+            try:
+                ok = self.reader.get_data("test_obj") == {"v": 1}
+                ok = ok and self.reader.holder_id.startswith(f"{os.getpid()}:")
+            finally:
+                os._exit(0 if ok else 1)
+        _, status = os.waitpid(pid, 0)
+
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+        holders = self.registry()["segments"][old_name]["holders"]
+        self.assertIn(f"{pid}:{id(self.reader)}", holders)
+
+        # 부모 reader도 참조를 반환하면 종료된 자식의 참조만 남음
+        self.reader.release_all()
+        self.writer.set_data("test_obj", {"v": 2})
+
+        self.assertFalse(self.segment_exists(old_name))
+
+    def test_release_all_with_frame_in_use(self):
+        """참조 중인 DataFrame이 있어도 release_all 시 BufferError 없이 segment를 닫음"""
+        import gc
+        from unittest.mock import patch
+
+        self.writer.set_data("test_df", make_df())
+        held = self.reader.get_data("test_df")
+
+        with patch("sys.unraisablehook") as unraisable:
+            # 프로세스 종료처럼 release_all 후 저장소 자체가 사라짐
+            self.reader.release_all()
+            self.reader = None
+            gc.collect()
+            pd.testing.assert_frame_equal(held, make_df())
+            del held
+            gc.collect()
+
+        unraisable.assert_not_called()
+
+    def test_missing_key_returns_none(self):
+        """저장된 적 없는 key는 None"""
+        self.assertIsNone(self.reader.get_data("never_set"))
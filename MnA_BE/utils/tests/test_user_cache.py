@@ -0,0 +1,170 @@
+# utils/tests/test_user_cache.py
+"""
+utils/user_cache.py 테스트 (require_auth 사용자 캐시)
+"""
+
+from django.test import TestCase, RequestFactory
+from django.http import JsonResponse
+from unittest.mock import patch
+import json
+
+
+class UserCacheTests(TestCase):
+    def setUp(self):
+        from apps.user.models import User, Style
+        from utils import user_cache
+
+        user_cache.clear()
+        self.addCleanup(user_cache.clear)
+
+        self.user = User.objects.create(name="tester", password="pw")
+        Style.objects.create(
+            user=self.user, interests={"interests": ["반도체"]}, strategy={"strategy": "안정형"}
+        )
+        Style.objects.create(
+            user=self.user,
+            interests={"interests": ["2차전지"]},
+            strategy={"strategy": "공격투자형"},
+        )
+
+    def get(self):
+        from decorators.require_auth import load_user
+        from utils import user_cache
+
+        return user_cache.get_user(self.user.id, load_user)
+
+    def test_single_load_then_cached(self):
+        """첫 로드: 사용자 + 최신 Style (쿼리 2번), 이후 TTL 안에서는 쿼리 없음"""
+        from utils.user_cache import latest_style
+
+        with self.assertNumQueries(2):
+            user = self.get()
+            style = latest_style(user)
+
+        self.assertEqual(style.strategy, {"strategy": "공격투자형"})
+
+        with self.assertNumQueries(0):
+            user = self.get()
+            self.assertEqual(latest_style(user).interests, {"interests": ["2차전지"]})
+
+    def test_copies_are_independent(self):
+        """view에서 필드를 바꿔도 캐시는 그대로"""
+        user = self.get()
+        user.portfolio = {"changed": True}
+
+        self.assertEqual(self.get().portfolio, {})
+
+    def test_invalidated_on_writes(self):
+        from apps.user.models import Style
+        from utils.user_cache import latest_style
+
+        user = self.get()
+        user.name = "renamed"
+        user.save()
+        self.assertEqual(self.get().name, "renamed")
+
+        Style.objects.create(
+            user=self.user, interests={"interests": ["AI"]}, strategy={"strategy": "중립형"}
+        )
+        self.assertEqual(latest_style(self.get()).strategy, {"strategy": "중립형"})
+
+        self.user.delete()
+        with self.assertRaises(Exception):
+            self.get()
+
+    @patch("utils.user_cache.USER_CACHE_TTL_SECONDS", 0)
+    def test_ttl_zero_disables_cache(self):
+        self.get()
+        with self.assertNumQueries(2):
+            self.get()
+
+    def test_latest_style_without_prefetch(self):
+        from apps.user.models import User
+        from utils.user_cache import latest_style
+
+        user = User.objects.get(id=self.user.id)
+        self.assertEqual(latest_style(user).strategy, {"strategy": "공격투자형"})
+
+    @patch.dict("os.environ", {"SECRET_KEY": "test_secret_key", "HASH_ALGORITHM": "HS256"})
+    def test_require_auth_uses_cache(self):
+        """같은 사용자의 두 번째 인증 요청은 DB 조회 없음"""
+        from decorators.require_auth import require_auth
+        from utils.token_handler import make_access_token, load_keys
+        from utils.user_cache import latest_style
+        from apps.user.models import Style
+
+        load_keys()
+        self.addCleanup(load_keys)
+
+        @require_auth
+        def view(self, request, user=None):
+            return JsonResponse({"name": user.name, "strategy": latest_style(user).strategy})
+
+        request = RequestFactory().get("/")
+        request.COOKIES = {"access_token": make_access_token(str(self.user.id))}
+
+        view(None, request)
+        with self.assertNumQueries(0):
+            response = view(None, request)
+
+        self.assertEqual(
+            json.loads(response.content), {"name": "tester", "strategy": {"strategy": "공격투자형"}}
+        )
+
+        # 토큰의 문자열 id로 캐시돼도 Style 저장 시 무효화
+        Style.objects.create(
+            user=self.user, interests={"interests": []}, strategy={"strategy": "안정형"}
+        )
+        response = view(None, request)
+        self.assertEqual(json.loads(response.content)["strategy"], {"strategy": "안정형"})
+
+    def test_stale_copy_does_not_overwrite_other_fields(self):
+        """
+        다른 worker가 바꾼 password / refresh_token (이 프로세스 캐시는 이전 값)을
+        name / portfolio / password 변경이 이전 값으로 덮어쓰지 않음
+        """
+        from django.test import Client
+        from django.urls import reverse
+        from apps.user.models import User
+        from utils.token_handler import make_access_token
+
+        client = Client()
+        cookie = f"access_token={make_access_token(str(self.user.id))}"
+        self.get()
+
+        # signal 없이 DB만 변경 (다른 worker의 로그인 / 비밀번호 변경)
+        User.objects.filter(id=self.user.id).update(password="new_hash", refresh_token="new_rt")
+
+        res = client.post(
+            reverse("name"),
+            data=json.dumps({"name": "renamed"}),
+            content_type="application/json",
+            HTTP_COOKIE=cookie,
+        )
+        self.assertEqual(res.status_code, 200)
+
+        user = User.objects.get(id=self.user.id)
+        self.assertEqual(user.name, "renamed")
+        self.assertEqual(user.password, "new_hash")
+        self.assertEqual(user.refresh_token, "new_rt")
+
+        # 저장 후 캐시 무효화 → 다음 요청은 DB 값
+        self.assertEqual(self.get().refresh_token, "new_rt")
+
+    def test_every_user_write_invalidates(self):
+        """update_fields 저장 / 전체 저장 / 삭제 모두 캐시 항목 제거"""
+        from apps.user.models import User
+        from utils import user_cache
+
+        writes = [
+            lambda u: u.save(update_fields=["refresh_token"]),
+            lambda u: u.save(update_fields=["password"]),
+            lambda u: u.save(),
+            lambda u: u.delete(),
+        ]
+        for write in writes:
+            self.get()
+            self.assertIn(str(self.user.id), user_cache._cache)
+
+            write(User.objects.get(id=self.user.id))
+            self.assertNotIn(str(self.user.id), user_cache._cache)
@@ -263,9 +263,15 @@ class TokenHandlerTests(TestCase):
             'REFRESH_TOKEN_EXPIRE_DAYS': '7'
         })
         self.env_patcher.start()
+
+        from utils import token_handler
+        token_handler.load_keys()
     
     def tearDown(self):
         self.env_patcher.stop()
+
+        from utils import token_handler
+        token_handler.load_keys()
     
     def test_make_access_token(self):
         """액세스 토큰 생성"""
@@ -334,6 +340,64 @@ class TokenHandlerTests(TestCase):
         new_payload = decode_token(new_token)
         self.assertEqual(new_payload['id'], user_id)
     
+    def test_decode_access_token_cached(self):
+        """검증한 access token은 exp 전까지 jwt.decode 없이 반환"""
+        from utils.token_handler import make_access_token, decode_access_token
+        
+        token = make_access_token(321)
+        payload = decode_access_token(token)
+        self.assertEqual(payload['id'], 321)
+        
+        with patch('utils.token_handler.jwt.decode') as mock_decode:
+            cached = decode_access_token(token)
+            mock_decode.assert_not_called()
+        
+        self.assertEqual(cached, payload)
+        
+        # 반환값을 바꿔도 캐시는 그대로
+        cached['id'] = 0
+        self.assertEqual(decode_access_token(token)['id'], 321)
+    
+    def test_decode_access_token_expired_entry(self):
+        """캐시된 token도 exp가 지나면 다시 검증 (ExpiredSignatureError)"""
+        import time
+        from utils.token_handler import make_access_token, decode_access_token
+        
+        token = make_access_token(654)
+        decode_access_token(token)
+        
+        with patch('utils.token_handler.time.time', return_value=time.time() + 31 * 60), \
+                patch('utils.token_handler.jwt.decode',
+                      side_effect=jwt.ExpiredSignatureError) as mock_decode:
+            with self.assertRaises(jwt.ExpiredSignatureError):
+                decode_access_token(token)
+            mock_decode.assert_called_once()
+    
+    def test_decode_access_token_invalid(self):
+        """위조된 token은 캐시하지 않음"""
+        from utils.token_handler import decode_access_token
+        
+        forged = jwt.encode(
+            {'id': 1, 'exp': datetime.now(timezone.utc) + timedelta(minutes=1)},
+            'wrong_key',
+            algorithm='HS256',
+        )
+        for _ in range(2):
+            with self.assertRaises(jwt.InvalidSignatureError):
+                decode_access_token(forged)
+    
+    def test_load_keys_clears_cache(self):
+        """키가 바뀌면 이전 키로 검증한 token은 다시 검증"""
+        from utils import token_handler
+        
+        token = token_handler.make_access_token(777)
+        token_handler.decode_access_token(token)
+        
+        with patch.dict('os.environ', {'SECRET_KEY': 'rotated_secret_key'}):
+            token_handler.load_keys()
+            with self.assertRaises(jwt.InvalidSignatureError):
+                token_handler.decode_access_token(token)
+    
     def test_set_cookie(self):
         """쿠키 설정"""
         from utils.token_handler import set_cookie
@@ -1,23 +1,75 @@
 import jwt
 import os
 import uuid
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 
+# 서명을 확인한 access token 보관 수 (LRU, 0이면 캐시 안 함)
+VERIFIED_TOKEN_CACHE_SIZE = int(os.getenv("VERIFIED_TOKEN_CACHE_SIZE", 1024))
+
+# SECRET_KEY / HASH_ALGORITHM (import 시 한 번 로드, load_keys로 다시 로드)
+_secret_key = None
+_algorithms = None
+
+# sha256(token) → (exp, claims)
+_verified = OrderedDict()
+_verified_lock = threading.Lock()
+
+
+def load_keys():
+    """환경변수에서 키를 다시 읽음 (키가 바뀌면 검증 캐시도 비움)"""
+    global _secret_key, _algorithms
+    with _verified_lock:
+        _secret_key = os.getenv("SECRET_KEY")
+        _algorithms = [os.getenv("HASH_ALGORITHM")]
+        _verified.clear()
+
+
+load_keys()
+
+
 def decode_token(token):
     return jwt.decode(
                 token,
-                os.getenv("SECRET_KEY"),
-                algorithms=[os.getenv("HASH_ALGORITHM")],
+                _secret_key,
+                algorithms=_algorithms,
             )
 
+def decode_access_token(token):
+    """
+    decode_token + 검증 결과 캐시 (require_auth의 access token용)
+    - 한 번 서명을 확인한 token은 exp 전까지 jwt.decode 없이 claims 반환
+    - exp가 지났거나 처음 보는 token은 decode_token (만료/위조 예외 그대로)
+    """
+    digest = hashlib.sha256(token.encode()).digest()
+    with _verified_lock:
+        entry = _verified.get(digest)
+        if entry is not None:
+            if entry[0] > time.time():
+                _verified.move_to_end(digest)
+                return dict(entry[1])
+            del _verified[digest]
+
+    claims = decode_token(token)
+    exp = claims.get("exp")
+    if VERIFIED_TOKEN_CACHE_SIZE > 0 and isinstance(exp, (int, float)):
+        with _verified_lock:
+            _verified[digest] = (exp, dict(claims))
+            while len(_verified) > VERIFIED_TOKEN_CACHE_SIZE:
+                _verified.popitem(last=False)
+    return claims
+
 def make_access_token(id):
     return jwt.encode(
         {
             "id": id,
             "exp": datetime.utcnow() + timedelta(minutes=int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES")))
         },
-        os.getenv("SECRET_KEY"),
-        algorithm=os.getenv("HASH_ALGORITHM")
+        _secret_key,
+        algorithm=_algorithms[0]
     )
 
 def make_refresh_token(id, exp=None):
@@ -30,8 +82,8 @@ def make_refresh_token(id, exp=None):
             "random_salt": str(uuid.uuid4()),
             "exp": exp
         },
-        os.getenv("SECRET_KEY"),
-        algorithm=os.getenv("HASH_ALGORITHM")
+        _secret_key,
+        algorithm=_algorithms[0]
     )
 
 def rotate_refresh_token(token):
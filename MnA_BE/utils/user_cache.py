@@ -0,0 +1,77 @@
+"""
+인증된 사용자 캐시 (프로세스별, 짧은 TTL)
+- require_auth: user id → User(+ 최신 Style prefetch)를 한 번 로드 후 USER_CACHE_TTL_SECONDS 동안 재사용
+- 같은 프로세스에서 User/Style을 저장·삭제하면 바로 무효화 (post_save / post_delete)
+  다른 worker는 최대 TTL 동안 이전 값을 볼 수 있음 → refresh token 비교는 캐시를 쓰지 않음
+- 요청마다 얕은 복사본을 돌려주므로 view에서 필드를 바꿔도 캐시는 그대로
+- 캐시된 값은 최대 TTL만큼 오래됐을 수 있으므로 저장은 바꾼 필드만 (save(update_fields=[...]))
+  전체 save()는 다른 worker가 바꾼 password / refresh_token을 이전 값으로 덮어씀
+"""
+from django.db.models import Prefetch
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from apps.user.models import User, Style
+import copy, os, threading, time
+
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", 30))
+
+# 최신 Style 1개만 prefetch (Style.Meta.ordering = -create_at)
+LATEST_STYLE_ATTR = "latest_styles"
+LATEST_STYLE = Prefetch("style_set", queryset=Style.objects.all()[:1], to_attr=LATEST_STYLE_ATTR)
+
+# str(user_id) → (만료 시각, User)  (토큰의 id는 문자열, signal의 pk는 int)
+_cache = {}
+# str(user_id) → 무효화 횟수 (로드 중 무효화된 값을 저장하지 않도록)
+_generations = {}
+_lock = threading.Lock()
+
+
+def get_user(user_id, load):
+    """
+    캐시된 사용자의 복사본, 없거나 만료됐으면 load(user_id)로 로드 후 저장
+    load의 예외(사용자 없음 등)는 그대로 전달
+    """
+    key = str(user_id)
+    entry = _cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return copy.copy(entry[1])
+
+    generation = _generations.get(key, 0)
+    user = load(user_id)
+
+    if USER_CACHE_TTL_SECONDS > 0:
+        with _lock:
+            if _generations.get(key, 0) == generation:
+                _cache[key] = (time.monotonic() + USER_CACHE_TTL_SECONDS, user)
+    return copy.copy(user)
+
+
+def invalidate(user_id):
+    key = str(user_id)
+    with _lock:
+        _generations[key] = _generations.get(key, 0) + 1
+        _cache.pop(key, None)
+
+
+def clear():
+    with _lock:
+        _cache.clear()
+        _generations.clear()
+
+
+def latest_style(user):
+    """사용자의 최신 Style (require_auth에서 prefetch했으면 쿼리 없이), 없으면 None"""
+    styles = getattr(user, LATEST_STYLE_ATTR, None)
+    if styles is None:
+        return user.style_set.first()
+    return styles[0] if styles else None
+
+
+@receiver([post_save, post_delete], sender=User)
+def _user_changed(sender, instance, **kwargs):
+    invalidate(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=Style)
+def _style_changed(sender, instance, **kwargs):
+    invalidate(instance.user_id)
@@ -8,6 +8,7 @@ import pandas as pd
 import numpy as np
 import pytz
 import boto3
+import json
 import io
 
 def is_trading_day_krx():
@@ -40,6 +41,20 @@ def load_s3_parquet(key):
     print(f"[S3] Loaded Parquet from s3://{bucket}/{key}")
     return df
 
+def update_latest_manifest(s3, bucket, key, *prefixes):
+    # 서버가 prefix 전체를 조회하지 않도록 최신 객체 포인터(<prefix>/_latest.json) 갱신
+    # MnA_BE 밖에서 따로 실행되므로 복사본: 형식은 MnA_BE/S3/base.py put_latest_manifest와 같게 유지
+    head = s3.head_object(Bucket=bucket, Key=key)
+    for prefix in prefixes:
+        body = json.dumps({
+            "Prefix": prefix.rstrip("/"),
+            "Key": key,
+            "ETag": head.get("ETag"),
+            "LastModified": head["LastModified"].isoformat(),
+            "Size": head.get("ContentLength"),
+        })
+        s3.put_object(Bucket=bucket, Key=f"{prefix.rstrip('/')}/_latest.json", Body=body, ContentType="application/json")
+
 def save_s3_df(now, df_concat):
     bucket = 'swpp-12-bucket'
     s3 = boto3.client("s3")
@@ -49,6 +64,10 @@ def save_s3_df(now, df_concat):
     key = f"price-financial-info-instant/year={now.year}/month={now.month}/{now.strftime('%Y-%m-%d')}.parquet"
     s3.put_object(Bucket=bucket, Key=key, Body=buffer.getvalue(), ContentType="application/octet-stream")
     print(f"[S3] Uploaded Parquet to s3://{bucket}/{key}")
+    try:
+        update_latest_manifest(s3, bucket, key, "price-financial-info-instant")
+    except Exception as e:
+        print(f"[S3] Manifest update failed: {e}")
     return key
 
 if is_trading_day_krx():